@@ -0,0 +1,64 @@
+"""
+카탈로그 파일(CSV, NDJSON) 읽기/쓰기
+
+    MUSIC_CATALOG_FILE=catalog.csv uvicorn app.main:app
+    python -m app.catalog_io export --format csv > catalog.csv
+"""
+import csv
+import json
+from typing import Iterable, Iterator, Optional, TextIO
+
+from .models import Music
+
+COLUMNS = list(Music.model_fields)
+
+
+def detect_format(path: str) -> str:
+    return "csv" if path.endswith(".csv") else "ndjson"
+
+
+def iter_catalog(f: TextIO, fmt: str) -> Iterator[Music]:
+    """
+    파일에서 곡을 한 줄씩 읽어 Music으로 변환합니다. likes가 없으면 0으로 채웁니다.
+    """
+    if fmt == "csv":
+        rows = csv.DictReader(f)
+    else:
+        rows = (json.loads(line) for line in f if line.strip())
+    for line_no, row in enumerate(rows, start=1):
+        if row.get("likes") in (None, ""):
+            row["likes"] = 0
+        try:
+            yield Music.model_validate(row, strict=False)
+        except ValueError as e:
+            raise ValueError(f"{line_no}번째 행을 읽을 수 없습니다: {e}") from e
+
+
+def load_catalog(path: str, fmt: Optional[str] = None) -> Iterator[Music]:
+    with open(path, encoding="utf-8", newline="") as f:
+        yield from iter_catalog(f, fmt or detect_format(path))
+
+
+def write_catalog(music_iter: Iterable[Music], f: TextIO, fmt: str) -> None:
+    if fmt == "csv":
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(COLUMNS)
+        writer.writerows([getattr(music, column) for column in COLUMNS] for music in music_iter)
+        return
+    for music in music_iter:
+        f.write(music.model_dump_json() + "\n")
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="음악 카탈로그 내보내기")
+    subparsers = parser.add_subparsers(dest="action", required=True)
+    export_parser = subparsers.add_parser("export", help="현재 카탈로그를 표준 출력으로 내보내기")
+    export_parser.add_argument("--format", choices=["csv", "ndjson"], default="ndjson", help="출력 형식")
+    args = parser.parse_args()
+
+    from .database import db
+
+    write_catalog(db.iter_music(), sys.stdout, args.format)
@@ -1,75 +1,408 @@
-from typing import List, Optional
+import os
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from .models import Music
 
-class Database:
+# 저장소 방식: "models"(Music 모델 리스트) 또는 "columnar"(타입 배열 기반 컬럼 저장)
+STORAGE_BACKEND = os.getenv("MUSIC_STORAGE_BACKEND", "models")
+# 시작 시 불러올 카탈로그 파일 (CSV 또는 NDJSON). 지정하지 않으면 예시 데이터를 사용합니다.
+CATALOG_FILE = os.getenv("MUSIC_CATALOG_FILE")
+
+# 보조 인덱스를 유지할 필드 (필드명 -> 인덱스 키 생성 함수)
+INDEXED_FIELDS = {
+    "genre": lambda value: value.casefold(),
+    "artist": lambda value: value.casefold(),
+    "release_year": lambda value: value,
+}
+
+SAMPLE_MUSIC: List[Music] = [
+    Music(
+        id=1,
+        title="Dynamite",
+        artist="BTS",
+        album="BE",
+        release_year=2020,
+        genre="K-pop",
+        duration=199,
+        likes=1000000
+    ),
+    Music(
+        id=2,
+        title="Spring Day",
+        artist="BTS",
+        album="You Never Walk Alone",
+        release_year=2017,
+        genre="K-pop",
+        duration=255,
+        likes=950000
+    ),
+    Music(
+        id=3,
+        title="How You Like That",
+        artist="BLACKPINK",
+        album="THE ALBUM",
+        release_year=2020,
+        genre="K-pop",
+        duration=182,
+        likes=890000
+    ),
+    Music(
+        id=4,
+        title="Maria",
+        artist="Hwasa",
+        album="Maria",
+        release_year=2020,
+        genre="K-pop",
+        duration=195,
+        likes=450000
+    ),
+    Music(
+        id=5,
+        title="Celebrity",
+        artist="IU",
+        album="Celebrity",
+        release_year=2021,
+        genre="K-pop",
+        duration=195,
+        likes=780000
+    )
+]
+
+class ChangeNotifier:
+    """
+    곡이 추가/수정될 때 구독자에게 (music_id, 변경된 필드 목록)을 알립니다.
+    """
     def __init__(self):
-        self.music_list: List[Music] = [
-            Music(
-                id=1,
-                title="Dynamite",
-                artist="BTS",
-                album="BE",
-                release_year=2020,
-                genre="K-pop",
-                duration=199,
-                likes=1000000
-            ),
-            Music(
-                id=2,
-                title="Spring Day",
-                artist="BTS",
-                album="You Never Walk Alone",
-                release_year=2017,
-                genre="K-pop",
-                duration=255,
-                likes=950000
-            ),
-            Music(
-                id=3,
-                title="How You Like That",
-                artist="BLACKPINK",
-                album="THE ALBUM",
-                release_year=2020,
-                genre="K-pop",
-                duration=182,
-                likes=890000
-            ),
-            Music(
-                id=4,
-                title="Maria",
-                artist="Hwasa",
-                album="Maria",
-                release_year=2020,
-                genre="K-pop",
-                duration=195,
-                likes=450000
-            ),
-            Music(
-                id=5,
-                title="Celebrity",
-                artist="IU",
-                album="Celebrity",
-                release_year=2021,
-                genre="K-pop",
-                duration=195,
-                likes=780000
-            )
-        ]
+        self._listeners: List[Callable[[int, Tuple[str, ...]], None]] = []
+
+    def subscribe(self, callback: Callable[[int, Tuple[str, ...]], None]) -> None:
+        self._listeners.append(callback)
+
+    def _notify(self, music_id: int, fields: Tuple[str, ...]) -> None:
+        for callback in self._listeners:
+            callback(music_id, fields)
+
+class Database(ChangeNotifier):
+    def __init__(self, music_list: Optional[Iterable[Music]] = None):
+        super().__init__()
+        self.music_list: List[Music] = []
+        # 기본 키 인덱스 (id -> Music)
+        self._by_id: Dict[int, Music] = {}
+        # 커서 페이지네이션용 정렬된 id 목록
+        self._sorted_ids = array("q")
+        # 보조 인덱스 (필드명 -> 인덱스 키 -> {id: Music}), 삽입 순서를 유지
+        self._indexes: Dict[str, Dict[object, Dict[int, Music]]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+
+        if music_list is None:
+            music_list = [music.model_copy() for music in SAMPLE_MUSIC]
+        for music in music_list:
+            self.add_music(music)
+
+    def _index_key(self, field: str, value):
+        return INDEXED_FIELDS[field](value)
+
+    def _add_to_indexes(self, music: Music) -> None:
+        for field, index in self._indexes.items():
+            key = self._index_key(field, getattr(music, field))
+            index.setdefault(key, {})[music.id] = music
+
+    def _remove_from_indexes(self, music: Music) -> None:
+        for field, index in self._indexes.items():
+            key = self._index_key(field, getattr(music, field))
+            bucket = index.get(key)
+            if bucket is None:
+                continue
+            bucket.pop(music.id, None)
+            if not bucket:
+                del index[key]
+
+    def _lookup(self, field: str, value) -> List[Music]:
+        bucket = self._indexes[field].get(self._index_key(field, value))
+        return list(bucket.values()) if bucket else []
+
+    def add_music(self, music: Music) -> bool:
+        """
+        새 음악을 추가합니다. 이미 존재하는 id이면 False를 반환합니다.
+        """
+        if music.id in self._by_id:
+            return False
+        self.music_list.append(music)
+        self._by_id[music.id] = music
+        insort(self._sorted_ids, music.id)
+        self._add_to_indexes(music)
+        self._notify(music.id, tuple(Music.model_fields))
+        return True
+
+    def update_music(self, music_id: int, **fields) -> Optional[Music]:
+        """
+        음악 정보를 수정하고 보조 인덱스를 갱신합니다. id는 변경할 수 없습니다.
+        """
+        music = self._by_id.get(music_id)
+        if not music:
+            return None
+        fields.pop("id", None)
+        reindex = any(field in INDEXED_FIELDS for field in fields)
+        if reindex:
+            self._remove_from_indexes(music)
+        for field, value in fields.items():
+            setattr(music, field, value)
+        if reindex:
+            self._add_to_indexes(music)
+        self._notify(music_id, tuple(fields))
+        return music
 
     def get_all_music(self) -> List[Music]:
         return self.music_list
 
+    def iter_music(self) -> Iterator[Music]:
+        return iter(self.music_list)
+
+    def get_music_page(self, after: Optional[int], limit: int) -> List[Music]:
+        """
+        id 순으로 after 다음부터 최대 limit개의 음악을 반환합니다.
+        """
+        start = bisect_right(self._sorted_ids, after) if after is not None else 0
+        return [self._by_id[music_id] for music_id in self._sorted_ids[start:start + limit]]
+
     def get_music_by_id(self, music_id: int) -> Optional[Music]:
-        return next((music for music in self.music_list if music.id == music_id), None)
+        return self._by_id.get(music_id)
 
     def get_music_by_genre(self, genre: str) -> List[Music]:
-        return [music for music in self.music_list if music.genre.lower() == genre.lower()]
+        return self._lookup("genre", genre)
+
+    def get_music_by_artist(self, artist: str) -> List[Music]:
+        return self._lookup("artist", artist)
+
+    def get_music_by_release_year(self, release_year: int) -> List[Music]:
+        return self._lookup("release_year", release_year)
 
     def add_like(self, music_id: int) -> bool:
         music = self.get_music_by_id(music_id)
         if music:
             music.likes += 1
+            self._notify(music_id, ("likes",))
+            return True
+        return False
+
+class _StringColumn:
+    """
+    사전 인코딩(dictionary encoding)된 문자열 컬럼. 행마다 값 코드만 배열에 저장합니다.
+    """
+    def __init__(self):
+        self.codes = array("I")
+        self.values: List[str] = []
+        self._code_of: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self._code_of.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._code_of[value] = code
+        return code
+
+    def append(self, value: str) -> None:
+        self.codes.append(self.encode(value))
+
+    def __getitem__(self, row: int) -> str:
+        return self.values[self.codes[row]]
+
+    def __setitem__(self, row: int, value: str) -> None:
+        self.codes[row] = self.encode(value)
+
+class _TextColumn:
+    """
+    고유 값이 많은 문자열 컬럼. UTF-8 바이트를 하나의 버퍼에 이어 붙이고 위치만 저장합니다.
+    """
+    def __init__(self):
+        self.data = bytearray()
+        self.starts = array("Q")
+        self.lengths = array("I")
+
+    def _write(self, value: str):
+        encoded = value.encode("utf-8")
+        start = len(self.data)
+        self.data += encoded
+        return start, len(encoded)
+
+    def append(self, value: str) -> None:
+        start, length = self._write(value)
+        self.starts.append(start)
+        self.lengths.append(length)
+
+    def __getitem__(self, row: int) -> str:
+        start = self.starts[row]
+        return self.data[start:start + self.lengths[row]].decode("utf-8")
+
+    def __setitem__(self, row: int, value: str) -> None:
+        # 이전 값의 바이트는 버퍼에 남지만, 수정은 드물기 때문에 재압축하지 않습니다.
+        self.starts[row], self.lengths[row] = self._write(value)
+
+class ColumnarDatabase(ChangeNotifier):
+    """
+    Database와 같은 인터페이스를 제공하는 컬럼 기반 저장소.
+
+    정수 컬럼은 array, 아티스트/앨범/장르는 사전 인코딩으로 저장하고
+    Music 모델은 응답 시점에만 생성합니다.
+    """
+    _INT_COLUMNS = ("release_year", "duration", "likes")
+    _ENCODED_COLUMNS = ("artist", "album", "genre")
+
+    def __init__(self, music_list: Optional[Iterable[Music]] = None):
+        super().__init__()
+        self._ids = array("q")
+        self._titles = _TextColumn()
+        self._ints: Dict[str, array] = {
+            "release_year": array("H"),
+            "duration": array("I"),
+            "likes": array("Q"),
+        }
+        self._strings = {column: _StringColumn() for column in self._ENCODED_COLUMNS}
+        # id가 오름차순으로만 추가되면 이진 탐색, 아니면 id -> 행 번호 딕셔너리를 사용
+        self._row_of: Optional[Dict[int, int]] = None
+        # id 순서가 뒤섞인 경우에만 사용하는 정렬된 id 목록
+        self._sorted_ids: Optional[array] = None
+        # 보조 인덱스 (필드명 -> 인덱스 키 -> 행 번호 배열)
+        self._indexes: Dict[str, Dict[object, array]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+
+        if music_list is None:
+            music_list = SAMPLE_MUSIC
+        for music in music_list:
+            self.add_music(music)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _row(self, music_id: int) -> Optional[int]:
+        if self._row_of is not None:
+            return self._row_of.get(music_id)
+        row = bisect_left(self._ids, music_id)
+        if row < len(self._ids) and self._ids[row] == music_id:
+            return row
+        return None
+
+    def _value(self, row: int, field: str):
+        if field == "title":
+            return self._titles[row]
+        if field in self._ints:
+            return self._ints[field][row]
+        return self._strings[field][row]
+
+    def _build(self, row: int) -> Music:
+        return Music(
+            id=self._ids[row],
+            title=self._titles[row],
+            artist=self._strings["artist"][row],
+            album=self._strings["album"][row],
+            release_year=self._ints["release_year"][row],
+            genre=self._strings["genre"][row],
+            duration=self._ints["duration"][row],
+            likes=self._ints["likes"][row]
+        )
+
+    def _lookup(self, field: str, value) -> List[Music]:
+        rows = self._indexes[field].get(INDEXED_FIELDS[field](value))
+        return [self._build(row) for row in rows] if rows else []
+
+    def add_music(self, music: Music) -> bool:
+        """
+        새 음악을 추가합니다. 이미 존재하는 id이면 False를 반환합니다.
+        """
+        if self._row(music.id) is not None:
+            return False
+        row = len(self._ids)
+        if self._row_of is None and row and music.id < self._ids[-1]:
+            self._row_of = {music_id: i for i, music_id in enumerate(self._ids)}
+            self._sorted_ids = array("q", self._ids)
+        if self._row_of is not None:
+            self._row_of[music.id] = row
+            insort(self._sorted_ids, music.id)
+
+        self._ids.append(music.id)
+        self._titles.append(music.title)
+        for column in self._INT_COLUMNS:
+            self._ints[column].append(getattr(music, column))
+        for column in self._ENCODED_COLUMNS:
+            self._strings[column].append(getattr(music, column))
+        for field, index in self._indexes.items():
+            key = INDEXED_FIELDS[field](getattr(music, field))
+            index.setdefault(key, array("I")).append(row)
+        self._notify(music.id, tuple(Music.model_fields))
+        return True
+
+    def update_music(self, music_id: int, **fields) -> Optional[Music]:
+        """
+        음악 정보를 수정하고 보조 인덱스를 갱신합니다. id는 변경할 수 없습니다.
+        """
+        row = self._row(music_id)
+        if row is None:
+            return None
+        fields.pop("id", None)
+        for field, value in fields.items():
+            if field in self._indexes:
+                index = self._indexes[field]
+                old_key = INDEXED_FIELDS[field](self._value(row, field))
+                index[old_key].remove(row)
+                if not index[old_key]:
+                    del index[old_key]
+                index.setdefault(INDEXED_FIELDS[field](value), array("I")).append(row)
+            if field == "title":
+                self._titles[row] = value
+            elif field in self._ints:
+                self._ints[field][row] = value
+            else:
+                self._strings[field][row] = value
+        self._notify(music_id, tuple(fields))
+        return self._build(row)
+
+    def get_all_music(self) -> List[Music]:
+        return list(self.iter_music())
+
+    def iter_music(self) -> Iterator[Music]:
+        for row in range(len(self._ids)):
+            yield self._build(row)
+
+    def get_music_page(self, after: Optional[int], limit: int) -> List[Music]:
+        """
+        id 순으로 after 다음부터 최대 limit개의 음악을 반환합니다.
+        """
+        if self._sorted_ids is None:
+            # id가 오름차순으로 저장되어 있으므로 행 번호가 곧 정렬 순서
+            start = bisect_right(self._ids, after) if after is not None else 0
+            return [self._build(row) for row in range(start, min(start + limit, len(self._ids)))]
+        start = bisect_right(self._sorted_ids, after) if after is not None else 0
+        return [self.get_music_by_id(music_id) for music_id in self._sorted_ids[start:start + limit]]
+
+    def get_music_by_id(self, music_id: int) -> Optional[Music]:
+        row = self._row(music_id)
+        return self._build(row) if row is not None else None
+
+    def get_music_by_genre(self, genre: str) -> List[Music]:
+        return self._lookup("genre", genre)
+
+    def get_music_by_artist(self, artist: str) -> List[Music]:
+        return self._lookup("artist", artist)
+
+    def get_music_by_release_year(self, release_year: int) -> List[Music]:
+        return self._lookup("release_year", release_year)
+
+    def add_like(self, music_id: int) -> bool:
+        row = self._row(music_id)
+        if row is not None:
+            self._ints["likes"][row] += 1
+            self._notify(music_id, ("likes",))
             return True
         return False
 
-db = Database() 
\ No newline at end of file
+def _initial_catalog() -> Optional[Iterator[Music]]:
+    if not CATALOG_FILE:
+        return None
+    from .catalog_io import load_catalog
+    return load_catalog(CATALOG_FILE)
+
+db = ColumnarDatabase(_initial_catalog()) if STORAGE_BACKEND == "columnar" else Database(_initial_catalog())
\ No newline at end of file
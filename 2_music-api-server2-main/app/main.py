@@ -1,7 +1,20 @@
-from fastapi import FastAPI, HTTPException
-from typing import List
+import heapq
+import os
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import Iterable, Iterator, List, Optional
 from .models import Music
 from .database import db
+from .metrics import CONTENT_TYPE, MetricsMiddleware, render_metrics
+from .ranking import RANKING, LikeRanking
+from .serialized import PRESERIALIZE, Entry, SerializedCatalog, etag_matches
+
+# after만 지정한 경우의 기본 페이지 크기
+DEFAULT_PAGE_SIZE = 100
+# NDJSON 스트리밍 시 한 번에 내보낼 곡 수
+STREAM_CHUNK_SIZE = 1000
+# Prometheus 메트릭(/metrics): 라우트별 요청 지연 시간 측정 여부
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
 
 app = FastAPI(
     title="MelodyHub",
@@ -9,28 +22,91 @@ app = FastAPI(
     version="1.0.0"
 )
 
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# 미리 직렬화된 응답 캐시 (MUSIC_PRESERIALIZE=false이면 사용하지 않음)
+catalog = SerializedCatalog(db) if PRESERIALIZE else None
+# 좋아요 순위 인덱스 (MUSIC_RANKING=false이면 요청마다 전체를 정렬)
+ranking = LikeRanking(db) if RANKING else None
+
+def json_response(request: Request, entry: Entry) -> Response:
+    body, etag = entry
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+def iter_ndjson(music_iter: Iterable[Music]) -> Iterator[bytes]:
+    lines = []
+    for music in music_iter:
+        lines.append(music.model_dump_json())
+        if len(lines) >= STREAM_CHUNK_SIZE:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
 @app.get("/api/music", response_model=List[Music])
-async def get_all_music():
+async def get_all_music(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="페이지 크기 (지정 시 id 순 커서 페이지네이션)"),
+    after: Optional[int] = Query(None, description="이전 페이지의 마지막 id (X-Next-Cursor 헤더 값)"),
+    stream: bool = Query(False, description="전체 목록을 NDJSON으로 스트리밍")
+):
     """
     모든 음악 목록을 반환합니다.
+    limit/after를 지정하면 id 순으로 페이지 단위 조회하며, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달됩니다.
     """
-    return db.get_all_music()
+    if stream:
+        return StreamingResponse(iter_ndjson(db.iter_music()), media_type="application/x-ndjson")
+    if limit is None and after is None:
+        if catalog:
+            return json_response(request, catalog.get_all())
+        return db.get_all_music()
+
+    limit = limit or DEFAULT_PAGE_SIZE
+    page = db.get_music_page(after, limit)
+    if len(page) == limit:
+        response.headers["X-Next-Cursor"] = str(page[-1].id)
+    return page
+
+@app.get("/api/music/top", response_model=List[Music])
+async def get_top_music(
+    n: int = Query(10, ge=1, le=100, description="반환할 곡 수"),
+    genre: Optional[str] = Query(None, description="장르 (지정하지 않으면 전체)")
+):
+    """
+    좋아요 수가 많은 순으로 상위 n곡을 반환합니다.
+    """
+    if ranking:
+        return ranking.top(n, genre)
+    music_iter = db.iter_music() if genre is None else db.get_music_by_genre(genre)
+    return heapq.nlargest(n, music_iter, key=lambda music: (music.likes, music.id))
 
 @app.get("/api/music/{music_id}", response_model=Music)
-async def get_music_by_id(music_id: int):
+async def get_music_by_id(music_id: int, request: Request):
     """
     특정 ID의 음악 정보를 반환합니다.
     """
+    if catalog:
+        entry = catalog.get_music(music_id)
+        if not entry:
+            raise HTTPException(status_code=404, detail="음악을 찾을 수 없습니다.")
+        return json_response(request, entry)
+
     music = db.get_music_by_id(music_id)
     if not music:
         raise HTTPException(status_code=404, detail="음악을 찾을 수 없습니다.")
     return music
 
 @app.get("/api/music/genre/{genre}", response_model=List[Music])
-async def get_music_by_genre(genre: str):
+async def get_music_by_genre(genre: str, request: Request):
     """
     특정 장르의 음악 목록을 반환합니다.
     """
+    if catalog:
+        return json_response(request, catalog.get_genre(genre))
     return db.get_music_by_genre(genre)
 
 @app.post("/api/music/{music_id}/like")
@@ -41,4 +117,11 @@ async def add_like(music_id: int):
     success = db.add_like(music_id)
     if not success:
         raise HTTPException(status_code=404, detail="음악을 찾을 수 없습니다.")
-    return {"message": "좋아요가 추가되었습니다."} 
\ No newline at end of file
+    return {"message": "좋아요가 추가되었습니다."} 
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """
+    라우트별 요청 지연 시간 히스토그램을 Prometheus 텍스트 형식으로 반환합니다.
+    """
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
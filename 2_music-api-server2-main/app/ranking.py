@@ -0,0 +1,135 @@
+import os
+from array import array
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .models import Music
+
+# 좋아요 순위 인덱스를 유지하는 모드 (기본 사용)
+RANKING = os.getenv("MUSIC_RANKING", "true").lower() == "true"
+
+# 순위 키 = likes << ID_BITS | id. 정수 하나로 (likes, id) 순서를 표현합니다.
+ID_BITS = 32
+ID_MASK = (1 << ID_BITS) - 1
+# 정렬 배열을 이 크기 단위로 나눠 삽입/삭제 시 이동하는 원소 수를 제한합니다.
+CHUNK_SIZE = 1024
+
+
+def rank_key(likes: int, music_id: int) -> int:
+    return likes << ID_BITS | music_id
+
+
+class _RankIndex:
+    """
+    순위 키를 오름차순으로 보관하는 청크 단위 정렬 배열.
+    삽입/삭제는 청크 하나만 수정하므로 전체 크기와 거의 무관하고,
+    상위 n개는 끝에서부터 거꾸로 읽습니다.
+    """
+
+    def __init__(self, sorted_keys: Iterable[int] = ()):
+        keys = array("Q", sorted_keys)
+        self._chunks: List[array] = [keys[i:i + CHUNK_SIZE] for i in range(0, len(keys), CHUNK_SIZE)]
+        # 청크별 마지막(최대) 키
+        self._maxes: List[int] = [chunk[-1] for chunk in self._chunks]
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def add(self, key: int) -> None:
+        if not self._chunks:
+            self._chunks.append(array("Q", [key]))
+            self._maxes.append(key)
+            return
+        i = min(bisect_left(self._maxes, key), len(self._chunks) - 1)
+        chunk = self._chunks[i]
+        insort(chunk, key)
+        self._maxes[i] = chunk[-1]
+        if len(chunk) > CHUNK_SIZE * 2:
+            half = len(chunk) // 2
+            self._chunks[i:i + 1] = [chunk[:half], chunk[half:]]
+            self._maxes[i:i + 1] = [chunk[half - 1], chunk[-1]]
+
+    def remove(self, key: int) -> bool:
+        i = bisect_left(self._maxes, key)
+        if i == len(self._chunks):
+            return False
+        chunk = self._chunks[i]
+        j = bisect_left(chunk, key)
+        if j == len(chunk) or chunk[j] != key:
+            return False
+        del chunk[j]
+        if chunk:
+            self._maxes[i] = chunk[-1]
+        else:
+            del self._chunks[i]
+            del self._maxes[i]
+        return True
+
+    def iter_desc(self) -> Iterator[int]:
+        for chunk in reversed(self._chunks):
+            yield from reversed(chunk)
+
+
+class LikeRanking:
+    """
+    좋아요 수 기준 전체/장르별 순위 인덱스.
+
+    저장소의 변경 알림을 구독해 좋아요나 장르가 바뀐 곡만 다시 배치하므로,
+    상위 n곡 조회는 카탈로그 크기와 관계없이 O(n)입니다.
+    좋아요 수가 같으면 id가 큰 곡이 앞에 옵니다.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        # id -> 현재 순위 키 (변경 시 이전 위치를 찾기 위해 보관)
+        self._keys: Dict[int, int] = {}
+        # 처음에는 한 번 정렬해서 만들고, 이후에는 변경된 곡만 다시 배치합니다.
+        genre_keys: Dict[str, List[int]] = {}
+        for music in store.iter_music():
+            key = rank_key(music.likes, music.id)
+            self._keys[music.id] = key
+            genre_keys.setdefault(music.genre.casefold(), []).append(key)
+        self._all = _RankIndex(sorted(self._keys.values()))
+        # 장르 키(대소문자 무시) -> 순위 인덱스
+        self._by_genre: Dict[str, _RankIndex] = {
+            genre_key: _RankIndex(sorted(keys)) for genre_key, keys in genre_keys.items()
+        }
+        store.subscribe(self.update)
+
+    def _insert(self, music: Music) -> None:
+        key = rank_key(music.likes, music.id)
+        self._keys[music.id] = key
+        self._all.add(key)
+        self._by_genre.setdefault(music.genre.casefold(), _RankIndex()).add(key)
+
+    def _remove(self, music_id: int, genre_key: Optional[str]) -> None:
+        key = self._keys.pop(music_id, None)
+        if key is None:
+            return
+        self._all.remove(key)
+        if genre_key is not None and genre_key in self._by_genre and self._by_genre[genre_key].remove(key):
+            return
+        # 이전 장르를 모르는 경우(장르 변경) 장르 인덱스를 모두 확인합니다.
+        for index in self._by_genre.values():
+            if index.remove(key):
+                return
+
+    def update(self, music_id: int, fields: Tuple[str, ...]) -> None:
+        if music_id in self._keys and "likes" not in fields and "genre" not in fields:
+            return
+        music = self.store.get_music_by_id(music_id)
+        genre_key = None if music is None or "genre" in fields else music.genre.casefold()
+        self._remove(music_id, genre_key)
+        if music is not None:
+            self._insert(music)
+
+    def top(self, n: int, genre: Optional[str] = None) -> List[Music]:
+        index = self._all if genre is None else self._by_genre.get(genre.casefold())
+        if index is None:
+            return []
+        music_list = []
+        for key in index.iter_desc():
+            music_list.append(self.store.get_music_by_id(key & ID_MASK))
+            if len(music_list) >= n:
+                break
+        return music_list
@@ -0,0 +1,93 @@
+import hashlib
+import os
+from typing import Dict, Iterable, Optional, Tuple
+
+# 응답 JSON을 미리 직렬화해 두는 모드 (기본 사용)
+PRESERIALIZE = os.getenv("MUSIC_PRESERIALIZE", "true").lower() == "true"
+
+# (JSON 바이트, ETag)
+Entry = Tuple[bytes, str]
+
+
+def make_entry(body: bytes) -> Entry:
+    return body, f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+
+_EMPTY = make_entry(b"[]")
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더 값이 ETag와 일치하는지 확인합니다. (약한 비교)
+    """
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or any(value.removeprefix("W/") == etag for value in candidates)
+
+
+class SerializedCatalog:
+    """
+    곡별 JSON 바이트와 장르별/전체 목록 JSON을 미리 만들어 두는 캐시.
+
+    목록은 곡별 바이트를 이어 붙여 만들기 때문에, 좋아요로 한 곡이 바뀌면
+    그 곡만 다시 직렬화하고 해당 곡이 속한 목록만 다시 조립합니다.
+    직렬화는 pydantic-core(Rust)의 `model_dump_json`을 사용합니다.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._tracks: Dict[int, bytes] = {}
+        self._by_id: Dict[int, Entry] = {}
+        self._by_genre: Dict[str, Entry] = {}
+        self._all: Optional[Entry] = None
+        store.subscribe(self.invalidate)
+
+    def _track_bytes(self, music) -> bytes:
+        body = self._tracks.get(music.id)
+        if body is None:
+            body = music.model_dump_json().encode()
+            self._tracks[music.id] = body
+        return body
+
+    def _join(self, music_iter: Iterable) -> bytes:
+        return b"[" + b",".join(self._track_bytes(music) for music in music_iter) + b"]"
+
+    def get_music(self, music_id: int) -> Optional[Entry]:
+        entry = self._by_id.get(music_id)
+        if entry is None:
+            music = self.store.get_music_by_id(music_id)
+            if music is None:
+                return None
+            entry = make_entry(self._track_bytes(music))
+            self._by_id[music_id] = entry
+        return entry
+
+    def get_genre(self, genre: str) -> Entry:
+        key = genre.casefold()
+        entry = self._by_genre.get(key)
+        if entry is None:
+            music_list = self.store.get_music_by_genre(genre)
+            if not music_list:
+                # 카탈로그에 없는 장르는 저장하지 않음 (임의의 장르 문자열로 캐시가 계속 커지지 않도록)
+                return _EMPTY
+            entry = make_entry(self._join(music_list))
+            self._by_genre[key] = entry
+        return entry
+
+    def get_all(self) -> Entry:
+        if self._all is None:
+            self._all = make_entry(self._join(self.store.iter_music()))
+        return self._all
+
+    def invalidate(self, music_id: int, fields: Tuple[str, ...]) -> None:
+        self._tracks.pop(music_id, None)
+        self._by_id.pop(music_id, None)
+        self._all = None
+        if "genre" in fields:
+            # 장르가 바뀌면 이전 장르를 알 수 없으므로 장르 목록을 모두 다시 만듭니다.
+            self._by_genre.clear()
+            return
+        music = self.store.get_music_by_id(music_id)
+        if music is not None:
+            self._by_genre.pop(music.genre.casefold(), None)
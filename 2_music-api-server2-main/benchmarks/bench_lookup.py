@@ -0,0 +1,80 @@
+"""
+인메모리 카탈로그 조회 지연 시간 벤치마크
+
+기존 방식(선형 탐색, 요청마다 장르 소문자 변환)과 인덱스 기반 Database를 비교합니다.
+
+    python -m benchmarks.bench_lookup --rows 1000000
+"""
+import argparse
+import random
+import time
+from typing import List, Optional
+
+from app.database import Database
+from app.models import Music
+
+GENRES = ["K-pop", "Pop", "Rock", "Hip-hop", "Jazz", "Ballad", "R&B", "EDM", "Classical", "Indie"]
+
+
+def make_catalog(rows: int) -> List[Music]:
+    return [
+        Music(
+            id=i,
+            title=f"Track {i}",
+            artist=f"Artist {i % 5000}",
+            album=f"Album {i % 20000}",
+            release_year=1980 + i % 45,
+            genre=GENRES[i % len(GENRES)],
+            duration=120 + i % 240,
+            likes=i % 100000
+        )
+        for i in range(1, rows + 1)
+    ]
+
+
+# 기존 Database 구현과 동일한 조회 방식
+def linear_get_by_id(music_list: List[Music], music_id: int) -> Optional[Music]:
+    return next((music for music in music_list if music.id == music_id), None)
+
+
+def linear_get_by_genre(music_list: List[Music], genre: str) -> List[Music]:
+    return [music for music in music_list if music.genre.lower() == genre.lower()]
+
+
+def measure(label: str, func, args_list) -> None:
+    start = time.perf_counter()
+    for args in args_list:
+        func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed / len(args_list) * 1000:>12.4f} ms/op  ({len(args_list)} ops)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MelodyHub 카탈로그 조회 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="합성 음악 데이터 수")
+    parser.add_argument("--id-lookups", type=int, default=20, help="선형 탐색 id 조회 횟수")
+    parser.add_argument("--genre-lookups", type=int, default=5, help="장르 조회 횟수")
+    args = parser.parse_args()
+
+    print(f"합성 데이터 {args.rows:,}건 생성 중...")
+    catalog = make_catalog(args.rows)
+
+    start = time.perf_counter()
+    db = Database(catalog)
+    print(f"인덱스 구축: {time.perf_counter() - start:.2f}s\n")
+
+    rng = random.Random(42)
+    ids = [(rng.randint(1, args.rows),) for _ in range(args.id_lookups)]
+    genres = [(rng.choice(GENRES).upper(),) for _ in range(args.genre_lookups)]
+
+    print("[before] 선형 탐색")
+    measure("get_music_by_id", lambda i: linear_get_by_id(catalog, i), ids)
+    measure("get_music_by_genre", lambda g: linear_get_by_genre(catalog, g), genres)
+
+    print("\n[after] 인덱스 조회")
+    measure("get_music_by_id", db.get_music_by_id, ids * 1000)
+    measure("get_music_by_genre", db.get_music_by_genre, genres)
+
+
+if __name__ == "__main__":
+    main()
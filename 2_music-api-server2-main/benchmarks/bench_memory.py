@@ -0,0 +1,73 @@
+"""
+카탈로그 저장 방식별 메모리(RSS) 비교
+
+레이아웃마다 별도 프로세스에서 합성 데이터를 적재한 뒤 증가한 RSS를 100만 곡 기준으로 환산합니다.
+
+    python -m benchmarks.bench_memory --rows 1000000
+"""
+import argparse
+import gc
+import subprocess
+import sys
+
+from benchmarks.bench_lookup import GENRES
+from app.models import Music
+
+LAYOUTS = ("models", "columnar")
+
+
+def current_rss_kb() -> int:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    raise RuntimeError("VmRSS를 읽을 수 없습니다 (Linux 전용)")
+
+
+def iter_catalog(rows: int):
+    for i in range(1, rows + 1):
+        yield Music(
+            id=i,
+            title=f"Track {i}",
+            artist=f"Artist {i % 5000}",
+            album=f"Album {i % 20000}",
+            release_year=1980 + i % 45,
+            genre=GENRES[i % len(GENRES)],
+            duration=120 + i % 240,
+            likes=i % 100000
+        )
+
+
+def measure_layout(layout: str, rows: int) -> None:
+    from app.database import ColumnarDatabase, Database
+
+    gc.collect()
+    before = current_rss_kb()
+    store = (ColumnarDatabase if layout == "columnar" else Database)(iter_catalog(rows))
+    gc.collect()
+    used_kb = current_rss_kb() - before
+    per_million_mb = used_kb / 1024 * 1_000_000 / rows
+    print(f"{layout:<10} {used_kb / 1024:>10.1f} MB  {per_million_mb:>10.1f} MB/1M tracks  {used_kb * 1024 / rows:>8.1f} B/track")
+    del store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MelodyHub 저장 방식별 메모리 리포트")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="합성 음악 데이터 수")
+    parser.add_argument("--layout", choices=LAYOUTS, help="(내부용) 단일 레이아웃만 측정")
+    args = parser.parse_args()
+
+    if args.layout:
+        measure_layout(args.layout, args.rows)
+        return
+
+    print(f"합성 데이터 {args.rows:,}건 기준 RSS 증가량")
+    for layout in LAYOUTS:
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_memory", "--rows", str(args.rows), "--layout", layout],
+            check=True
+        )
+
+
+if __name__ == "__main__":
+    main()
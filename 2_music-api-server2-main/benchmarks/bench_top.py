@@ -0,0 +1,56 @@
+"""
+상위 n곡(좋아요 순) 조회 지연 시간 벤치마크
+
+요청마다 전체 목록을 정렬하는 방식과 LikeRanking 인덱스를 카탈로그 크기별로 비교합니다.
+
+    python -m benchmarks.bench_top --rows 10000 100000 1000000
+"""
+import argparse
+import heapq
+import random
+import time
+
+from app.database import Database
+from app.ranking import LikeRanking
+
+from .bench_lookup import GENRES, make_catalog, measure
+
+
+def scan_top(store, n: int, genre=None):
+    music_iter = store.iter_music() if genre is None else store.get_music_by_genre(genre)
+    return heapq.nlargest(n, music_iter, key=lambda music: (music.likes, music.id))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MelodyHub 상위 n곡 조회 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="합성 음악 데이터 수")
+    parser.add_argument("--n", type=int, default=10, help="조회할 곡 수")
+    parser.add_argument("--likes", type=int, default=100_000, help="좋아요 추가 횟수")
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        print(f"\n=== {rows:,}건 ===")
+        store = Database(make_catalog(rows))
+        start = time.perf_counter()
+        ranking = LikeRanking(store)
+        print(f"순위 인덱스 생성: {time.perf_counter() - start:.2f}s")
+
+        ids = [random.randint(1, rows) for _ in range(args.likes)]
+        start = time.perf_counter()
+        for music_id in ids:
+            store.add_like(music_id)
+        elapsed = time.perf_counter() - start
+        print(f"{'add_like (인덱스 갱신 포함)':<32} {elapsed / len(ids) * 1000:>12.4f} ms/op  ({len(ids)} ops)")
+
+        genre = random.choice(GENRES)
+        assert [m.id for m in ranking.top(args.n)] == [m.id for m in scan_top(store, args.n)]
+        assert [m.id for m in ranking.top(args.n, genre)] == [m.id for m in scan_top(store, args.n, genre)]
+
+        measure("전체 정렬 top (전체)", scan_top, [(store, args.n)] * 5)
+        measure("전체 정렬 top (장르)", scan_top, [(store, args.n, genre)] * 5)
+        measure("LikeRanking top (전체)", ranking.top, [(args.n,)] * 10000)
+        measure("LikeRanking top (장르)", ranking.top, [(args.n, genre)] * 10000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set
+
+# 캐시 설정: CACHE_BACKEND=memory(기본) | redis | none
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+CACHE_TTL = int(os.getenv("CACHE_TTL", "30"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# 이 태그가 붙은 항목은 좋아요 증가분을 DB에 반영할 때(LikeAggregator.flush) 한 번에 무효화됩니다.
+# (좋아요마다 무효화하면 전체 목록/상위 목록 캐시가 거의 적중하지 않으므로, 최대 LIKE_FLUSH_INTERVAL초 늦게 반영)
+ALL_TAG = "*"
+# 곡 수가 이보다 많은 응답은 곡별 태그 대신 ALL_TAG로 관리
+MAX_TAGS_PER_ENTRY = 1000
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+def entry_tags(music_ids: Iterable[int]) -> Set[str]:
+    tags = {str(music_id) for music_id in music_ids}
+    return {ALL_TAG} if len(tags) > MAX_TAGS_PER_ENTRY else tags
+
+
+class MemoryCache:
+    """
+    프로세스 내 LRU + TTL 캐시. 항목마다 포함된 곡 id를 태그로 기록해 두고
+    좋아요가 바뀐 곡의 태그가 붙은 항목만 무효화합니다.
+    """
+    name = "memory"
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, ttl: int = CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._keys_by_tag: Dict[str, Set[str]] = {}
+
+    def _drop(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        expires_at, value, _ = entry
+        if expires_at < time.monotonic():
+            self._drop(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, tags: Set[str]) -> None:
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (time.monotonic() + self.ttl, value, tags)
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    async def invalidate(self, music_id: int) -> None:
+        await self.invalidate_tag(str(music_id))
+
+    async def invalidate_tag(self, tag: str) -> None:
+        for key in list(self._keys_by_tag.get(tag, ())):
+            self._drop(key)
+            self.stats.invalidations += 1
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    async def metrics(self) -> Dict[str, object]:
+        return {"backend": self.name, "entries": len(self._entries), **self.stats.as_dict()}
+
+
+class RedisCache:
+    """
+    Redis 호환 서버를 사용하는 캐시. 여러 워커가 같은 캐시를 공유합니다.
+    태그별 키 목록은 Redis SET으로 관리하고, 만료와 메모리 제한(LRU)은 Redis 설정을 따릅니다.
+    """
+    name = "redis"
+
+    def __init__(self, url: str = REDIS_URL, ttl: int = CACHE_TTL, prefix: str = "melodyhub:"):
+        # redis 패키지는 이 백엔드를 사용할 때만 필요
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+        self.stats = CacheStats()
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}cache:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = await self.client.get(self._key(key))
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, tags: Set[str]) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(self._key(key), value, ex=self.ttl)
+            for tag in tags:
+                pipe.sadd(self._tag_key(tag), self._key(key))
+                pipe.expire(self._tag_key(tag), self.ttl)
+            await pipe.execute()
+
+    async def invalidate(self, music_id: int) -> None:
+        await self.invalidate_tag(str(music_id))
+
+    async def invalidate_tag(self, tag: str) -> None:
+        tag_key = self._tag_key(tag)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.smembers(tag_key)
+            pipe.delete(tag_key)
+            keys, _ = await pipe.execute()
+        if keys:
+            await self.client.delete(*keys)
+            self.stats.invalidations += len(keys)
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=f"{self.prefix}*", count=1000)]
+        for start in range(0, len(keys), 1000):
+            await self.client.delete(*keys[start:start + 1000])
+
+    async def metrics(self) -> Dict[str, object]:
+        info = await self.client.info("stats")
+        return {
+            "backend": self.name,
+            **self.stats.as_dict(),
+            "evictions": info.get("evicted_keys", 0),
+            "expirations": info.get("expired_keys", 0),
+        }
+
+
+class NullCache:
+    name = "none"
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        self.stats.misses += 1
+        return None
+
+    async def set(self, key: str, value: bytes, tags: Set[str]) -> None:
+        pass
+
+    async def invalidate(self, music_id: int) -> None:
+        pass
+
+    async def invalidate_tag(self, tag: str) -> None:
+        pass
+
+    async def clear(self) -> None:
+        pass
+
+    async def metrics(self) -> Dict[str, object]:
+        return {"backend": self.name, **self.stats.as_dict()}
+
+
+def create_cache():
+    if CACHE_BACKEND == "redis":
+        return RedisCache()
+    if CACHE_BACKEND == "none":
+        return NullCache()
+    return MemoryCache()
+
+
+response_cache = create_cache()
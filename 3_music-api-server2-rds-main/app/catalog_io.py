@@ -0,0 +1,239 @@
+"""
+음악 카탈로그 대량 가져오기/내보내기 (CSV, NDJSON)
+
+    python -m app.catalog_io import catalog.csv
+    python -m app.catalog_io import catalog.ndjson --batch-size 5000
+    python -m app.catalog_io export --format ndjson > catalog.ndjson
+"""
+import codecs
+import csv
+import io
+import json
+import os
+from typing import AsyncIterator, Dict, Iterable, List, Literal, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from . import models
+from .database import SessionLocal, engine
+
+CATALOG_BATCH_SIZE = int(os.getenv("CATALOG_BATCH_SIZE", "2000"))
+
+Format = Literal["csv", "ndjson"]
+
+# 가져오기/내보내기 컬럼 순서 (CSV 헤더)
+COLUMNS = ["id", "title", "artist", "album", "release_year", "genre", "duration", "likes"]
+INT_COLUMNS = {"id", "release_year", "duration", "likes"}
+# 이미 있는 곡을 다시 가져올 때 갱신하는 컬럼 (좋아요 수는 유지)
+UPSERT_COLUMNS = ["title", "artist", "album", "release_year", "genre", "duration"]
+
+
+class CatalogImportError(ValueError):
+    pass
+
+
+def parse_row(raw: Dict[str, object], line_no: int) -> Dict[str, object]:
+    row = {}
+    for column in COLUMNS:
+        value = raw.get(column)
+        if value in (None, ""):
+            if column in ("id", "likes"):
+                continue
+            raise CatalogImportError(f"{line_no}번째 줄: '{column}' 값이 없습니다.")
+        try:
+            row[column] = int(value) if column in INT_COLUMNS else str(value)
+        except (TypeError, ValueError):
+            raise CatalogImportError(f"{line_no}번째 줄: '{column}' 값이 올바르지 않습니다: {value!r}")
+    row.setdefault("likes", 0)
+    return row
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    바이트 청크 스트림을 줄 단위 문자열로 나눕니다. (줄 끝 문자 포함)
+    청크 경계에서 잘린 멀티바이트 문자는 다음 청크와 이어서 디코딩합니다.
+    파일 앞의 UTF-8 BOM(엑셀에서 저장한 CSV 등)은 제거합니다. (남아 있으면 첫 컬럼 이름이 'id'와 달라짐)
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    try:
+        async for chunk in chunks:
+            buffer += decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                yield line + "\n"
+        buffer += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as e:
+        raise CatalogImportError(f"UTF-8 형식 오류 ({e})")
+    if buffer:
+        yield buffer
+
+
+async def iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, List[str]]]:
+    """
+    줄 스트림을 (시작 줄 번호, CSV 레코드)로 나눕니다.
+    따옴표로 감싼 값 안의 줄바꿈(format_rows가 그대로 씀)은 다음 줄과 이어서 한 레코드로 읽습니다.
+    csv.reader는 동기 반복자만 받으므로, 따옴표가 닫힐 때까지(따옴표 수가 짝수) 줄을 모은 뒤 넘깁니다.
+    """
+    record, quotes, start_no = "", 0, 0
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not record:
+            start_no = line_no
+        record += line
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+        if record.strip():
+            try:
+                yield start_no, next(csv.reader([record]))
+            except csv.Error as e:
+                raise CatalogImportError(f"{start_no}번째 줄: CSV 형식 오류 ({e})")
+        record, quotes = "", 0
+    if record.strip():
+        raise CatalogImportError(f"{start_no}번째 줄: 따옴표가 닫히지 않았습니다.")
+
+
+async def iter_rows(lines: AsyncIterator[str], fmt: Format) -> AsyncIterator[Dict[str, object]]:
+    if fmt == "csv":
+        header: List[str] = []
+        async for line_no, values in iter_csv_records(lines):
+            if not header:
+                header = [name.strip() for name in values]
+                continue
+            yield parse_row(dict(zip(header, values)), line_no)
+        return
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            raw = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise CatalogImportError(f"{line_no}번째 줄: JSON 형식 오류 ({e})")
+        yield parse_row(raw, line_no)
+
+
+def upsert_statement():
+    """
+    같은 id가 있으면 곡 정보만 갱신하는 INSERT 문.
+    executemany로 실행하면 SQLAlchemy가 다중 행 VALUES로 묶어서 전송합니다 (insertmanyvalues).
+    """
+    table = models.MusicDB.__table__
+    if engine.dialect.name == "mysql":
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in UPSERT_COLUMNS})
+    stmt = sqlite_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={column: stmt.excluded[column] for column in UPSERT_COLUMNS}
+    )
+
+
+async def import_rows(rows: AsyncIterator[Dict[str, object]], batch_size: int = CATALOG_BATCH_SIZE) -> Dict[str, int]:
+    """
+    행 스트림을 batch_size 단위로 모아 저장합니다. 배치마다 커밋합니다.
+    """
+    table = models.MusicDB.__table__
+    upsert = upsert_statement()
+    stats = {"rows": 0, "batches": 0}
+
+    async def write(batch: List[Dict[str, object]]) -> None:
+        # id가 없는 행은 새 곡이므로 upsert 없이 추가
+        with_id = [row for row in batch if "id" in row]
+        without_id = [row for row in batch if "id" not in row]
+        async with engine.begin() as conn:
+            if with_id:
+                await conn.execute(upsert, with_id)
+            if without_id:
+                await conn.execute(table.insert(), without_id)
+        stats["rows"] += len(batch)
+        stats["batches"] += 1
+
+    batch: List[Dict[str, object]] = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            await write(batch)
+            batch = []
+    if batch:
+        await write(batch)
+    return stats
+
+
+def format_rows(music_list: Iterable[models.MusicDB], fmt: Format, with_header: bool = False) -> str:
+    if fmt == "ndjson":
+        return "".join(
+            json.dumps({column: getattr(music, column) for column in COLUMNS}, ensure_ascii=False) + "\n"
+            for music in music_list
+        )
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    if with_header:
+        writer.writerow(COLUMNS)
+    writer.writerows([getattr(music, column) for column in COLUMNS] for music in music_list)
+    return out.getvalue()
+
+
+async def export_rows(fmt: Format, chunk_size: int = CATALOG_BATCH_SIZE) -> AsyncIterator[bytes]:
+    """
+    서버 측 커서로 music 테이블을 id 순으로 읽어 CSV/NDJSON 청크를 생성합니다.
+    """
+    async with SessionLocal() as db:
+        result = await db.stream(
+            select(models.MusicDB)
+            .order_by(models.MusicDB.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        first = True
+        async for partition in result.scalars().partitions():
+            yield format_rows(partition, fmt, with_header=first).encode()
+            first = False
+        if first and fmt == "csv":
+            yield format_rows([], fmt, with_header=True).encode()
+
+
+async def _file_chunks(path: str) -> AsyncIterator[bytes]:
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            yield chunk
+
+
+async def _main() -> None:
+    import argparse
+    import sys
+    import time
+
+    parser = argparse.ArgumentParser(description="음악 카탈로그 가져오기/내보내기")
+    subparsers = parser.add_subparsers(dest="action", required=True)
+    import_parser = subparsers.add_parser("import", help="CSV/NDJSON 파일을 music 테이블로 가져오기")
+    import_parser.add_argument("path", help="가져올 파일 경로")
+    import_parser.add_argument("--format", choices=["csv", "ndjson"], help="파일 형식 (기본값: 확장자로 판단)")
+    import_parser.add_argument("--batch-size", type=int, default=CATALOG_BATCH_SIZE, help="다중 행 INSERT 한 번에 넣을 행 수")
+    export_parser = subparsers.add_parser("export", help="music 테이블을 표준 출력으로 내보내기")
+    export_parser.add_argument("--format", choices=["csv", "ndjson"], default="ndjson", help="출력 형식")
+    args = parser.parse_args()
+
+    try:
+        if args.action == "import":
+            fmt = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+            start = time.perf_counter()
+            stats = await import_rows(iter_rows(iter_lines(_file_chunks(args.path)), fmt), args.batch_size)
+            elapsed = time.perf_counter() - start
+            print(f"{stats['rows']:,}건 가져오기 완료 ({stats['batches']}개 배치, {elapsed:.1f}s, {stats['rows'] / max(elapsed, 1e-9):,.0f} rows/s)",
+                  file=sys.stderr)
+        else:
+            async for chunk in export_rows(args.format):
+                sys.stdout.buffer.write(chunk)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    asyncio.run(_main())
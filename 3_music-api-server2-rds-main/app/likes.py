@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import os
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Set
+
+from sqlalchemy import bindparam, update
+
+from . import models
+from .database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+_music = models.MusicDB.__table__
+# 여러 곡의 증가분을 executemany 한 번으로 반영
+music_table_update = (
+    update(_music)
+    .where(_music.c.id == bindparam("music_id"))
+    .values(likes=_music.c.likes + bindparam("n"))
+)
+
+# 좋아요 반영 주기(초)와 한 번에 반영할 최대 곡 수
+LIKE_FLUSH_INTERVAL = float(os.getenv("LIKE_FLUSH_INTERVAL", "1.0"))
+LIKE_FLUSH_BATCH_SIZE = int(os.getenv("LIKE_FLUSH_BATCH_SIZE", "500"))
+
+
+class LikeAggregator:
+    """
+    워커(프로세스)별 좋아요 집계기.
+
+    요청마다 DB 행을 읽고 쓰는 대신 메모리에 증가분만 모아 두었다가
+    주기적으로 `UPDATE music SET likes = likes + n` 배치로 반영합니다.
+    증가분은 이벤트 루프 스레드에서만 변경되므로 락이 필요 없고,
+    워커마다 독립된 샤드가 되어 DB에서 원자적으로 합쳐집니다.
+    """
+
+    def __init__(self, interval: float = LIKE_FLUSH_INTERVAL, batch_size: int = LIKE_FLUSH_BATCH_SIZE):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._pending: Dict[int, int] = defaultdict(int)
+        # DB로 반영 중인 증가분 (반영이 끝나기 전까지 조회 결과에 포함)
+        self._in_flight: Dict[int, int] = {}
+        self._known_ids: Set[int] = set()
+        # 증가분을 DB에 반영한 뒤 호출할 함수 (반영한 곡 id를 받음)
+        self._listeners: List[Callable[[Set[int]], Awaitable[None]]] = []
+        self._task = None
+
+    def subscribe(self, listener: Callable[[Set[int]], Awaitable[None]]) -> None:
+        self._listeners.append(listener)
+
+    def is_known(self, music_id: int) -> bool:
+        return music_id in self._known_ids
+
+    def mark_known(self, music_id: int) -> None:
+        self._known_ids.add(music_id)
+
+    def add(self, music_id: int, n: int = 1) -> None:
+        self._pending[music_id] += n
+
+    def pending(self, music_id: int) -> int:
+        return self._pending.get(music_id, 0) + self._in_flight.get(music_id, 0)
+
+    def pending_ids(self) -> Set[int]:
+        """
+        DB에 아직 반영되지 않은 증가분이 있는 곡 id
+        """
+        return set(self._pending) | set(self._in_flight)
+
+    def apply_pending(self, music: models.Music) -> models.Music:
+        """
+        아직 DB에 반영되지 않은 증가분을 응답 모델에 더합니다.
+        """
+        delta = self.pending(music.id)
+        if delta:
+            music.likes += delta
+        return music
+
+    async def flush(self) -> None:
+        if not self._pending or self._in_flight:
+            return
+        self._in_flight, self._pending = self._pending, defaultdict(int)
+        flushed: Set[int] = set()
+        try:
+            await self._write(dict(self._in_flight))
+            flushed = set(self._in_flight)
+        except Exception as e:
+            logger.error(f"좋아요 반영 실패, 다음 주기에 재시도합니다: {e}")
+            for music_id, n in self._in_flight.items():
+                self._pending[music_id] += n
+        finally:
+            self._in_flight = {}
+        # 반영 중에 만든 응답은 DB 값과 반영 중인 증가분이 겹칠 수 있으므로 _in_flight를 비운 뒤에 알림
+        if flushed:
+            for listener in self._listeners:
+                try:
+                    await listener(flushed)
+                except Exception as e:
+                    logger.error(f"좋아요 반영 후 처리 실패: {e}")
+
+    async def _write(self, deltas: Dict[int, int]) -> None:
+        items = list(deltas.items())
+        async with SessionLocal() as db:
+            async with db.begin():
+                for start in range(0, len(items), self.batch_size):
+                    params: List[dict] = [
+                        {"music_id": music_id, "n": n} for music_id, n in items[start:start + self.batch_size]
+                    ]
+                    await db.execute(music_table_update, params)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+like_aggregator = LikeAggregator()
@@ -1,50 +1,269 @@
-from fastapi import FastAPI, HTTPException, Depends
-from sqlalchemy.orm import Session
-from typing import List
+import hashlib
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, List, Literal, Optional, Set
 from . import models, database
-from .database import get_db
+from .cache import ALL_TAG, entry_tags, response_cache
+from .catalog_io import CatalogImportError, Format, export_rows, import_rows, iter_lines, iter_rows
+from .database import METRICS_ENABLED, SessionLocal, get_db
+from .likes import like_aggregator
+from .metrics import CONTENT_TYPE, MetricsMiddleware, render_metrics
+
+# after만 지정한 경우의 기본 페이지 크기
+DEFAULT_PAGE_SIZE = 100
+# NDJSON 스트리밍 시 서버 측 커서에서 한 번에 가져올 행 수
+STREAM_CHUNK_SIZE = 1000
+
+async def invalidate_like_totals(music_ids: Set[int]) -> None:
+    """
+    좋아요 증가분을 DB에 반영한 뒤 전체 목록/상위 목록 등 ALL_TAG 항목을 한 번에 무효화합니다.
+    """
+    await response_cache.invalidate_tag(ALL_TAG)
+
+like_aggregator.subscribe(invalidate_like_totals)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    like_aggregator.start()
+    yield
+    # 종료 전에 남은 좋아요 증가분을 반영
+    await like_aggregator.stop()
 
 app = FastAPI(
     title="MelodyHub",
     description="음악 정보를 제공하는 API 서버",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# 라우트별 요청 지연 시간 (Prometheus /metrics)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+music_list_adapter = TypeAdapter(List[models.Music])
+
+def to_response(music: models.MusicDB) -> models.Music:
+    return like_aggregator.apply_pending(models.Music.model_validate(music))
+
+def pack_entry(body: bytes, next_cursor: str = "") -> bytes:
+    """
+    캐시에 저장할 값을 만듭니다. 형식: ETag 줄, 다음 페이지 커서 줄, JSON 본문
+    """
+    etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+    return etag.encode() + b"\n" + next_cursor.encode() + b"\n" + body
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or any(value.removeprefix("W/") == etag for value in candidates)
+
+def json_response(request: Request, cached: bytes) -> Response:
+    etag, next_cursor, body = cached.split(b"\n", 2)
+    headers = {"ETag": etag.decode()}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor.decode()
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+async def cache_music_list(
+    key: str,
+    music_list: List[models.Music],
+    next_cursor: str = "",
+    tags: Optional[Set[str]] = None
+) -> bytes:
+    """
+    목록 응답을 직렬화해 캐시에 저장합니다. tags를 지정하지 않으면 포함된 곡 id로 태그를 붙입니다.
+    """
+    cached = pack_entry(music_list_adapter.dump_json(music_list), next_cursor)
+    await response_cache.set(key, cached, tags if tags is not None else entry_tags(music.id for music in music_list))
+    return cached
+
+async def iter_ndjson() -> AsyncIterator[bytes]:
+    # 응답 전송 중에도 세션이 유지되어야 하므로 요청 의존성과 별도로 세션을 엽니다.
+    async with SessionLocal() as db:
+        result = await db.stream(
+            select(models.MusicDB)
+            .order_by(models.MusicDB.id)
+            .execution_options(yield_per=STREAM_CHUNK_SIZE)
+        )
+        async for partition in result.scalars().partitions():
+            yield "".join(to_response(music).model_dump_json() + "\n" for music in partition).encode()
+
 @app.get("/api/music", response_model=List[models.Music])
-async def get_all_music(db: Session = Depends(get_db)):
+async def get_all_music(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="페이지 크기 (지정 시 id 순 커서 페이지네이션)"),
+    after: Optional[int] = Query(None, description="이전 페이지의 마지막 id (X-Next-Cursor 헤더 값)"),
+    stream: bool = Query(False, description="전체 목록을 NDJSON으로 스트리밍"),
+    db: AsyncSession = Depends(get_db)
+):
     """
     모든 음악 목록을 반환합니다.
+    limit/after를 지정하면 id 순으로 페이지 단위 조회하며, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달됩니다.
     """
-    music_list = db.query(models.MusicDB).all()
-    return music_list
+    if stream:
+        return StreamingResponse(iter_ndjson(), media_type="application/x-ndjson")
+
+    query = select(models.MusicDB)
+    if limit is not None or after is not None:
+        limit = limit or DEFAULT_PAGE_SIZE
+        query = query.order_by(models.MusicDB.id).limit(limit)
+        if after is not None:
+            query = query.where(models.MusicDB.id > after)
+
+    cache_key = f"all:{after}:{limit}"
+    cached = await response_cache.get(cache_key)
+    if cached is None:
+        result = await db.execute(query)
+        music_list = [to_response(music) for music in result.scalars().all()]
+        next_cursor = ""
+        if limit is not None and len(music_list) == limit:
+            next_cursor = str(music_list[-1].id)
+        cached = await cache_music_list(cache_key, music_list, next_cursor)
+
+    return json_response(request, cached)
+
+@app.get("/api/music/export")
+async def export_music(fmt: Format = Query("ndjson", alias="format", description="csv 또는 ndjson")):
+    """
+    전체 카탈로그를 CSV/NDJSON으로 스트리밍합니다.
+    """
+    media_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    return StreamingResponse(export_rows(fmt), media_type=media_type)
+
+@app.post("/api/music/import")
+async def import_music(request: Request, fmt: Format = Query("ndjson", alias="format", description="csv 또는 ndjson")):
+    """
+    요청 본문의 CSV/NDJSON 카탈로그를 배치 단위로 저장합니다.
+    id가 같은 곡은 정보만 갱신하고 좋아요 수는 유지합니다.
+    오류가 발생하면 그 이전 배치까지는 저장된 상태로 남습니다.
+    """
+    try:
+        stats = await import_rows(iter_rows(iter_lines(request.stream()), fmt))
+    except CatalogImportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        await response_cache.clear()
+    return {"message": "카탈로그를 가져왔습니다.", **stats}
+
+@app.get("/api/music/top", response_model=List[models.Music])
+async def get_top_music(
+    request: Request,
+    n: int = Query(10, ge=1, le=100, description="반환할 곡 수"),
+    genre: Optional[str] = Query(None, description="장르 (지정하지 않으면 전체)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    좋아요 수가 많은 순으로 상위 n곡을 반환합니다.
+    likes / (genre_key, likes) 인덱스를 역순으로 읽으므로 카탈로그 크기와 관계없이 n개 행만 읽습니다.
+    캐시된 순위는 좋아요 증가분을 DB에 반영할 때 무효화되므로 최대 LIKE_FLUSH_INTERVAL초 늦게 반영됩니다.
+    """
+    key = genre.strip().lower() if genre is not None else None
+    cache_key = f"top:{key}:{n}"
+    cached = await response_cache.get(cache_key)
+    if cached is None:
+        query = (
+            select(models.MusicDB)
+            .order_by(models.MusicDB.likes.desc(), models.MusicDB.id.desc())
+            .limit(n)
+        )
+        if key is not None:
+            query = query.where(models.MusicDB.genre_key == key)
+        result = await db.execute(query)
+        rows = {music.id: music for music in result.scalars().all()}
+        # 아직 DB에 반영되지 않은 좋아요로 상위 n곡에 들어올 수 있는 곡도 함께 읽음
+        pending_ids = like_aggregator.pending_ids() - rows.keys()
+        if pending_ids:
+            pending_query = select(models.MusicDB).where(models.MusicDB.id.in_(pending_ids))
+            if key is not None:
+                pending_query = pending_query.where(models.MusicDB.genre_key == key)
+            result = await db.execute(pending_query)
+            rows.update((music.id, music) for music in result.scalars().all())
+        music_list = [to_response(music) for music in rows.values()]
+        # 아직 DB에 반영되지 않은 좋아요 증가분을 포함해 다시 정렬
+        music_list.sort(key=lambda music: (music.likes, music.id), reverse=True)
+        music_list = music_list[:n]
+        # 목록에 없는 곡도 좋아요로 순위에 들어올 수 있으므로 ALL_TAG를 붙여 좋아요를 DB에 반영할 때마다 무효화
+        cached = await cache_music_list(cache_key, music_list, tags={ALL_TAG})
+
+    return json_response(request, cached)
 
 @app.get("/api/music/{music_id}", response_model=models.Music)
-async def get_music_by_id(music_id: int, db: Session = Depends(get_db)):
+async def get_music_by_id(music_id: int, request: Request, db: AsyncSession = Depends(get_db)):
     """
     특정 ID의 음악 정보를 반환합니다.
     """
-    music = db.query(models.MusicDB).filter(models.MusicDB.id == music_id).first()
-    if not music:
-        raise HTTPException(status_code=404, detail="음악을 찾을 수 없습니다.")
-    return music
+    cache_key = f"music:{music_id}"
+    cached = await response_cache.get(cache_key)
+    if cached is None:
+        music = await db.get(models.MusicDB, music_id)
+        if not music:
+            raise HTTPException(status_code=404, detail="음악을 찾을 수 없습니다.")
+        cached = pack_entry(to_response(music).model_dump_json().encode())
+        await response_cache.set(cache_key, cached, entry_tags([music_id]))
+    return json_response(request, cached)
 
 @app.get("/api/music/genre/{genre}", response_model=List[models.Music])
-async def get_music_by_genre(genre: str, db: Session = Depends(get_db)):
+async def get_music_by_genre(
+    genre: str,
+    request: Request,
+    match: Literal["exact", "prefix", "contains"] = Query("exact", description="exact: 일치, prefix: 접두어, contains: 부분 문자열(인덱스 미사용)"),
+    db: AsyncSession = Depends(get_db)
+):
     """
     특정 장르의 음악 목록을 반환합니다.
+    exact/prefix는 genre_key 인덱스를 사용하고, contains는 기존 부분 문자열 검색(전체 스캔)입니다.
     """
-    music_list = db.query(models.MusicDB).filter(models.MusicDB.genre.ilike(f"%{genre}%")).all()
-    return music_list
+    key = genre.strip().lower()
+    cache_key = f"genre:{match}:{key if match != 'contains' else genre.lower()}"
+    cached = await response_cache.get(cache_key)
+    if cached is None:
+        if match == "exact":
+            condition = models.MusicDB.genre_key == key
+        elif match == "prefix":
+            condition = models.MusicDB.genre_key.startswith(key, autoescape=True)
+        else:
+            condition = models.MusicDB.genre.ilike(f"%{genre}%")
+        result = await db.execute(select(models.MusicDB).where(condition))
+        music_list = [to_response(music) for music in result.scalars().all()]
+        cached = await cache_music_list(cache_key, music_list)
+
+    return json_response(request, cached)
 
 @app.post("/api/music/{music_id}/like")
-async def add_like(music_id: int, db: Session = Depends(get_db)):
+async def add_like(music_id: int, db: AsyncSession = Depends(get_db)):
     """
     특정 음악의 좋아요 수를 증가시킵니다.
+    증가분은 워커별로 모아 두었다가 주기적으로 DB에 일괄 반영됩니다.
+    """
+    if not like_aggregator.is_known(music_id):
+        result = await db.execute(select(models.MusicDB.id).where(models.MusicDB.id == music_id))
+        exists = result.first()
+        if not exists:
+            raise HTTPException(status_code=404, detail="음악을 찾을 수 없습니다.")
+        like_aggregator.mark_known(music_id)
+
+    like_aggregator.add(music_id)
+    # 이 곡이 포함된 캐시 응답만 무효화 (ALL_TAG 항목은 증가분을 DB에 반영할 때 무효화)
+    await response_cache.invalidate(music_id)
+    return {"message": "좋아요가 추가되었습니다."}
+
+@app.get("/api/metrics")
+async def get_metrics():
+    """
+    응답 캐시 적중/미스/축출 통계를 반환합니다.
+    """
+    return {"cache": await response_cache.metrics()} 
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """
+    요청/SQL 지연 시간 히스토그램, 오류 수, 커넥션 풀 상태를 Prometheus 텍스트 형식으로 반환합니다.
     """
-    music = db.query(models.MusicDB).filter(models.MusicDB.id == music_id).first()
-    if not music:
-        raise HTTPException(status_code=404, detail="음악을 찾을 수 없습니다.")
-    
-    music.likes += 1
-    db.commit()
-    return {"message": "좋아요가 추가되었습니다."} 
\ No newline at end of file
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
@@ -0,0 +1,361 @@
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from starlette.routing import Match
+import threading
+import time
+
+# Prometheus 형식 메트릭 (/metrics)
+# - 라우트별 요청 지연 히스토그램 (MetricsMiddleware)
+# - SQLAlchemy 문장, S3/DynamoDB 호출별 지연 히스토그램과 오류 카운터 (instrument_engine, instrument_boto3_client)
+# - 커넥션 풀 게이지(사용 중, 오버플로)와 커넥션 대기 시간 히스토그램
+# 외부 패키지 없이 동작하도록 작성했으며, 앱 설정을 import하지 않으므로 다른 서버(MelodyHub)에도 그대로 복사해 사용할 수 있습니다.
+
+# 초 단위 버킷 (Prometheus 기본값에 1ms, 2.5ms 추가)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 문장 종류 레이블 (그 밖의 문장은 OTHER로 묶어 레이블 수를 제한)
+_SQL_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "REPLACE", "WITH", "CREATE", "DROP", "ALTER", "SHOW", "PRAGMA"}
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class Counter:
+    """
+    Monotonic counter with a fixed set of label names
+    """
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        with self._lock:
+            return self._values.get(label_values, 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}" for labels, value in values]
+
+class Histogram:
+    """
+    Cumulative histogram with a fixed set of label names and bucket upper bounds (seconds)
+    """
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 값 -> [버킷별 개수(+Inf 포함, 누적 아님), 합계, 개수]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def snapshot(self, *label_values: str) -> Tuple[List[int], float, int]:
+        """
+        Return (non-cumulative bucket counts, sum, count) for one label set
+        """
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                return [0] * (len(self.buckets) + 1), 0.0, 0
+            return list(series[0]), series[1], series[2]
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((labels, (list(data[0]), data[1], data[2])) for labels, data in self._series.items())
+        lines = []
+        for labels, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {count}")
+        return lines
+
+class Gauge:
+    """
+    Gauge whose samples are read from a callback at scrape time
+    """
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._callbacks: List[Callable[[], Iterable[Tuple[Tuple[str, ...], float]]]] = []
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback: Callable[[], Iterable[Tuple[Tuple[str, ...], float]]]) -> None:
+        """
+        Register a callable returning (label values, value) pairs
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            callbacks = list(self._callbacks)
+        lines = []
+        for callback in callbacks:
+            for labels, value in callback():
+                lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}")
+        return lines
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            # 같은 이름으로 다시 등록하면 기존 메트릭을 돌려줌 (모듈을 다시 import해도 중복되지 않도록)
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, label_names))
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+registry = Registry()
+
+REQUEST_LATENCY = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template",
+    ("method", "route", "status")
+)
+DEPENDENCY_LATENCY = registry.histogram(
+    "dependency_call_duration_seconds", "Latency of calls to external dependencies (db, s3, dynamodb)",
+    ("dependency", "operation")
+)
+DEPENDENCY_ERRORS = registry.counter(
+    "dependency_call_errors_total", "Failed calls to external dependencies by error type",
+    ("dependency", "operation", "error")
+)
+POOL_CHECKED_OUT = registry.gauge("db_pool_checked_out", "Connections currently checked out of the pool", ("pool",))
+POOL_OVERFLOW = registry.gauge("db_pool_overflow", "Connections open beyond pool_size (negative while the pool is filling)", ("pool",))
+POOL_SIZE = registry.gauge("db_pool_size", "Configured pool size", ("pool",))
+POOL_WAIT = registry.histogram(
+    "db_pool_wait_seconds", "Time spent waiting for a pooled connection (includes opening new connections)",
+    ("pool",)
+)
+
+def render_metrics() -> str:
+    return registry.render()
+
+# ---------------------------------------------------------------------------
+# HTTP 요청 (ASGI 미들웨어)
+# ---------------------------------------------------------------------------
+
+def _route_template(scope) -> str:
+    # 경로 변수가 그대로 들어가지 않도록 실제 경로 대신 라우트 템플릿(/api/music/{music_id})을 레이블로 사용
+    route = scope.get("route")
+    regex = getattr(route, "path_regex", None)
+    if regex is not None:
+        # FastAPI 버전에 따라 scope["route"].path에 include_router의 prefix가 빠져 있으므로,
+        # 라우트 패턴과 일치하는 가장 긴 경로 끝부분을 찾고 그 앞부분을 prefix로 붙임
+        path = scope["path"]
+        for index in [0] + [i for i, char in enumerate(path) if char == "/" and i > 0] + [len(path)]:
+            if regex.match(path[index:]):
+                return path[:index] + route.path
+    # scope["route"]를 설정하지 않는 버전: 앱의 라우트와 다시 매칭 (PARTIAL은 메서드 불일치)
+    partial = None
+    for candidate in getattr(scope.get("app"), "routes", ()):
+        if not hasattr(candidate, "path"):
+            continue
+        match, _ = candidate.matches(scope)
+        if match == Match.FULL:
+            return candidate.path
+        if match == Match.PARTIAL and partial is None:
+            partial = candidate.path
+    return partial or "unmatched"
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request latency per (method, route template, status)
+
+        app.add_middleware(MetricsMiddleware)
+    """
+
+    def __init__(self, app, histogram: Optional[Histogram] = None):
+        self.app = app
+        self.histogram = histogram or REQUEST_LATENCY
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 스트리밍 응답은 본문 전송이 끝날 때까지의 시간
+            self.histogram.observe(time.perf_counter() - start, scope["method"], _route_template(scope), str(status))
+
+# ---------------------------------------------------------------------------
+# SQLAlchemy 문장과 커넥션 풀
+# ---------------------------------------------------------------------------
+
+def _sql_operation(statement: str) -> str:
+    words = statement.lstrip(" \n\t(").split(None, 1)
+    operation = words[0].upper() if words else ""
+    return operation if operation in _SQL_OPERATIONS else "OTHER"
+
+def _instrument_pool(pool, name: str) -> None:
+    # 풀에는 커넥션을 기다리는 시간을 알려 주는 이벤트가 없으므로 _do_get(대기 + 새 커넥션 생성)을 감쌈
+    # engine.dispose()는 풀을 새로 만들므로 dispose 후에는 다시 호출해야 함
+    if getattr(pool, "_metrics_instrumented", False):
+        return
+    do_get = pool._do_get
+
+    def timed_do_get():
+        start = time.perf_counter()
+        try:
+            return do_get()
+        finally:
+            POOL_WAIT.observe(time.perf_counter() - start, name)
+
+    pool._do_get = timed_do_get
+    pool._metrics_instrumented = True
+
+def instrument_engine(engine, name: str = "default") -> None:
+    """
+    Time every statement executed on an engine (sync or async) and expose its pool gauges
+    """
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_start = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_metrics_start", None)
+        if start is not None:
+            DEPENDENCY_LATENCY.observe(time.perf_counter() - start, "db", _sql_operation(statement))
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(exception_context):
+        statement = exception_context.statement or ""
+        operation = _sql_operation(statement) if statement else "CONNECT"
+        context = exception_context.execution_context
+        start = getattr(context, "_metrics_start", None)
+        if start is not None:
+            DEPENDENCY_LATENCY.observe(time.perf_counter() - start, "db", operation)
+        DEPENDENCY_ERRORS.inc("db", operation, type(exception_context.original_exception).__name__)
+
+    _instrument_pool(sync_engine.pool, name)
+
+    def pool_samples(method: str):
+        def samples():
+            # 스크레이프 시점의 풀을 읽음 (NullPool/StaticPool처럼 해당 값이 없는 풀은 생략)
+            pool = sync_engine.pool
+            reader = getattr(pool, method, None)
+            return [((name,), reader())] if reader is not None else []
+        return samples
+
+    POOL_CHECKED_OUT.add_callback(pool_samples("checkedout"))
+    POOL_OVERFLOW.add_callback(pool_samples("overflow"))
+    POOL_SIZE.add_callback(pool_samples("size"))
+
+# ---------------------------------------------------------------------------
+# boto3 (S3, DynamoDB)
+# ---------------------------------------------------------------------------
+
+def instrument_boto3_client(client, dependency: Optional[str] = None) -> None:
+    """
+    Time every API call made by a boto3 client (including retries) and count failed calls
+
+    Uses botocore's before-call/after-call events, so calls made from any thread are recorded.
+    """
+    dependency = dependency or client.meta.service_model.service_name
+
+    def before_call(model, context, **kwargs):
+        context["_metrics_call"] = (model.name, time.perf_counter())
+
+    def after_call(http_response, parsed, model, context, **kwargs):
+        call = context.pop("_metrics_call", None)
+        if call is None:
+            return
+        DEPENDENCY_LATENCY.observe(time.perf_counter() - call[1], dependency, call[0])
+        if http_response.status_code >= 300:
+            error = (parsed or {}).get("Error", {}).get("Code") or str(http_response.status_code)
+            DEPENDENCY_ERRORS.inc(dependency, call[0], error)
+
+    def after_call_error(exception, context, **kwargs):
+        # 재시도 후에도 응답을 받지 못한 경우 (연결/타임아웃 오류)
+        call = context.pop("_metrics_call", None)
+        if call is None:
+            return
+        DEPENDENCY_LATENCY.observe(time.perf_counter() - call[1], dependency, call[0])
+        DEPENDENCY_ERRORS.inc(dependency, call[0], type(exception).__name__)
+
+    events = client.meta.events
+    events.register("before-call", before_call, unique_id=f"metrics-before-call-{dependency}")
+    events.register("after-call", after_call, unique_id=f"metrics-after-call-{dependency}")
+    events.register("after-call-error", after_call_error, unique_id=f"metrics-after-call-error-{dependency}")
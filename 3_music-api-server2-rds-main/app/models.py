@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Computed, Index, Integer, String
 from sqlalchemy.orm import Mapped
 from pydantic import BaseModel
 from .database import Base
@@ -29,5 +29,13 @@ class MusicDB(Base):
     album: Mapped[str] = Column(String(100), nullable=False)
     release_year: Mapped[int] = Column(Integer, nullable=False)
     genre: Mapped[str] = Column(String(50), nullable=False)
+    # 장르 검색용 정규화 컬럼 (소문자, 앞뒤 공백 제거), DB가 자동으로 계산
+    genre_key: Mapped[str] = Column(String(50), Computed("LOWER(TRIM(genre))", persisted=True), index=True)
     duration: Mapped[int] = Column(Integer, nullable=False)
-    likes: Mapped[int] = Column(Integer, nullable=False, default=0) 
\ No newline at end of file
+    likes: Mapped[int] = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # 좋아요 순위 조회용 (전체, 장르별). 역순으로 읽어 상위 n개만 가져옵니다.
+        Index("ix_music_likes", "likes"),
+        Index("ix_music_genre_key_likes", "genre_key", "likes"),
+    ) 
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+카탈로그 내보내기 → 가져오기 왕복 벤치마크
+
+music 테이블에 테스트 데이터를 넣고 CSV/NDJSON으로 내보낸 뒤, 테이블을 비우고 같은 파일을 다시 가져옵니다.
+- 가져온 행이 원래 행과 같은지 확인 (따옴표 안 줄바꿈/쉼표/따옴표가 있는 제목, 앞에 UTF-8 BOM이 있는 파일 포함)
+- 형식별 내보내기/가져오기 처리량(rows/s)
+DATABASE_URL이 지정되어 있으면 해당 DB를, 아니면 임시 SQLite 파일을 사용합니다. (지정한 DB의 music 테이블은 다시 만듭니다)
+
+    python -m benchmarks.bench_catalog_io
+    python -m benchmarks.bench_catalog_io --rows 200000 --chunk-size 65536
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_catalog_io.db')}"
+
+from sqlalchemy import delete, insert, select
+
+from app import models
+from app.catalog_io import COLUMNS, export_rows, import_rows, iter_lines, iter_rows
+from app.database import Base, engine
+
+# 내보내기 시 따옴표로 감싸지는 값 (줄바꿈은 CSV에서 여러 줄에 걸쳐 기록됨)
+TRICKY_TITLES = ["Line1\nLine2", 'Say "Hi", Bye', "Windows\r\nLine", "  공백 ", "쉼표, 그리고\n\n빈 줄"]
+
+
+def make_rows(count: int) -> list:
+    return [
+        {
+            "id": i,
+            "title": TRICKY_TITLES[i % len(TRICKY_TITLES)] if i % 10 == 0 else f"Track {i}",
+            "artist": f"Artist {i % 5000}",
+            "album": f"앨범 {i % 20000}",
+            "release_year": 1980 + i % 45,
+            "genre": ["K-pop", "Pop", "Rock", "R&B"][i % 4],
+            "duration": 120 + i % 240,
+            "likes": i % 100,
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+async def read_table() -> list:
+    async with engine.connect() as conn:
+        result = await conn.execute(select(*(models.MusicDB.__table__.c[column] for column in COLUMNS)).order_by(models.MusicDB.id))
+        return [dict(row) for row in result.mappings()]
+
+
+async def chunked(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def run(args) -> None:
+    table = models.MusicDB.__table__
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(table), make_rows(args.rows))
+    expected = await read_table()
+    print(f"DB: {engine.url.render_as_string(hide_password=True)}, {args.rows:,}건, 청크 {args.chunk_size:,} bytes")
+
+    for fmt in ("csv", "ndjson"):
+        start = time.perf_counter()
+        data = b"".join([chunk async for chunk in export_rows(fmt)])
+        export_elapsed = time.perf_counter() - start
+
+        for label, payload in (("", data), (" (BOM)", b"\xef\xbb\xbf" + data)):
+            async with engine.begin() as conn:
+                await conn.execute(delete(table))
+            start = time.perf_counter()
+            stats = await import_rows(iter_rows(iter_lines(chunked(payload, args.chunk_size)), fmt))
+            import_elapsed = time.perf_counter() - start
+            assert stats["rows"] == args.rows, f"{fmt}{label}: {stats['rows']}건만 가져왔습니다"
+            assert await read_table() == expected, f"{fmt}{label}: 가져온 행이 내보낸 행과 다릅니다"
+            print(f"{fmt + label:<12} 내보내기 {args.rows / export_elapsed:>10,.0f} rows/s  "
+                  f"가져오기 {args.rows / import_elapsed:>10,.0f} rows/s  ({len(payload) / 1024 / 1024:.1f} MB)")
+    print("왕복 결과 확인 완료 (따옴표 안 줄바꿈, BOM 포함)")
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카탈로그 내보내기/가져오기 왕복 벤치마크")
+    parser.add_argument("--rows", type=int, default=50_000, help="테스트 데이터 수")
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024, help="가져오기 스트림 청크 크기(bytes)")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+장르 검색 방식별 쿼리 지연 시간 벤치마크
+
+exact/prefix(genre_key 인덱스 사용)와 contains(ILIKE '%genre%', 전체 스캔)를 비교합니다.
+DATABASE_URL이 지정되어 있으면 해당 DB를, 아니면 .env의 MySQL을 사용합니다.
+
+    python -m benchmarks.bench_genre --init-db --rows 1000000
+    python -m benchmarks.bench_genre
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy import insert, select, text
+
+from app import models
+from app.database import Base, engine
+
+BASE_GENRES = ["K-pop", "Pop", "Rock", "Hip-hop", "Jazz", "Ballad", "R&B", "EDM", "Classical", "Indie"]
+GENRES = [f"{genre} {i}" for genre in BASE_GENRES for i in range(50)]
+
+
+async def init_db(rows: int, batch_size: int = 10000) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    table = models.MusicDB.__table__
+    for start in range(1, rows + 1, batch_size):
+        async with engine.begin() as conn:
+            await conn.execute(insert(table), [
+                {
+                    "id": i,
+                    "title": f"Track {i}",
+                    "artist": f"Artist {i % 5000}",
+                    "album": f"Album {i % 20000}",
+                    "release_year": 1980 + i % 45,
+                    "genre": GENRES[i % len(GENRES)],
+                    "duration": 120 + i % 240,
+                    "likes": 0
+                }
+                for i in range(start, min(start + batch_size, rows + 1))
+            ])
+    print(f"테스트 데이터 {rows:,}건 생성 완료")
+
+
+def genre_query(mode: str, genre: str):
+    key = genre.strip().lower()
+    if mode == "exact":
+        condition = models.MusicDB.genre_key == key
+    elif mode == "prefix":
+        condition = models.MusicDB.genre_key.startswith(key, autoescape=True)
+    else:
+        condition = models.MusicDB.genre.ilike(f"%{genre}%")
+    return select(models.MusicDB.id).where(condition)
+
+
+async def run(queries: int) -> None:
+    rng = random.Random(42)
+    samples = [rng.choice(GENRES) for _ in range(queries)]
+    async with engine.connect() as conn:
+        if engine.dialect.name == "mysql":
+            for mode in ("exact", "prefix", "contains"):
+                compiled = genre_query(mode, samples[0]).compile(engine, compile_kwargs={"literal_binds": True})
+                plan = (await conn.execute(text(f"EXPLAIN {compiled}"))).mappings().first()
+                print(f"[EXPLAIN {mode}] type={plan['type']} key={plan['key']} rows={plan['rows']}")
+
+        for mode in ("exact", "prefix", "contains"):
+            start = time.perf_counter()
+            found = 0
+            for genre in samples:
+                # prefix는 장르 이름 앞부분만 사용
+                term = genre.split()[0] if mode == "prefix" else genre
+                found += len((await conn.execute(genre_query(mode, term))).all())
+            elapsed = time.perf_counter() - start
+            print(f"{mode:<10} {elapsed / queries * 1000:>10.2f} ms/query  (평균 {found // queries:,}건)")
+    await engine.dispose()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="MelodyHub 장르 검색 벤치마크")
+    parser.add_argument("--init-db", action="store_true", help="테이블을 다시 만들고 테스트 데이터를 넣은 뒤 종료")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="--init-db 시 생성할 데이터 수")
+    parser.add_argument("--queries", type=int, default=20, help="방식별 쿼리 횟수")
+    args = parser.parse_args()
+
+    if args.init_db:
+        await init_db(args.rows)
+        return
+    await run(args.queries)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
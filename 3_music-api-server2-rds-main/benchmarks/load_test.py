@@ -0,0 +1,103 @@
+"""
+MelodyHub 부하 테스트
+
+실행 중인 서버에 동시 클라이언트 1/8/64개로 요청을 보내 초당 처리량(req/s)을 측정합니다.
+로컬에서는 MySQL 대신 SQLite로 대체할 수 있습니다.
+
+    pip install aiosqlite
+    export DATABASE_URL=sqlite+aiosqlite:///./bench.db
+    python -m benchmarks.load_test --init-db --rows 1000
+    uvicorn app.main:app --workers 1 &
+    python -m benchmarks.load_test --path /api/music/1
+"""
+import argparse
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+
+async def init_db(rows: int) -> None:
+    from app import models
+    from app.database import Base, SessionLocal, engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with SessionLocal() as db:
+        db.add_all(
+            models.MusicDB(
+                id=i,
+                title=f"Track {i}",
+                artist=f"Artist {i % 100}",
+                album=f"Album {i % 500}",
+                release_year=2000 + i % 25,
+                genre=("K-pop", "Pop", "Rock", "Jazz")[i % 4],
+                duration=180,
+                likes=0
+            )
+            for i in range(1, rows + 1)
+        )
+        await db.commit()
+    await engine.dispose()
+    print(f"테스트 데이터 {rows:,}건 생성 완료")
+
+
+async def client(host: str, port: int, request: bytes, deadline: float, counts: list) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            writer.write(request)
+            await writer.drain()
+            status = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            counts[0 if status.split()[1].startswith(b"2") else 1] += 1
+    finally:
+        writer.close()
+
+
+async def run_level(url: str, method: str, concurrency: int, duration: float) -> None:
+    parts = urlsplit(url)
+    request = (
+        f"{method} {parts.path or '/'} HTTP/1.1\r\n"
+        f"Host: {parts.hostname}\r\n"
+        "Content-Length: 0\r\n\r\n"
+    ).encode()
+    counts = [0, 0]
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(
+        client(parts.hostname, parts.port or 80, request, deadline, counts)
+        for _ in range(concurrency)
+    ))
+    print(f"동시 {concurrency:>3}  {counts[0] / duration:>10.1f} req/s  (오류 {counts[1]})")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="MelodyHub 부하 테스트")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="서버 주소")
+    parser.add_argument("--path", default="/api/music/1", help="요청 경로")
+    parser.add_argument("--method", default="GET", help="HTTP 메서드")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 64], help="동시 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="단계별 측정 시간(초)")
+    parser.add_argument("--init-db", action="store_true", help="테이블을 다시 만들고 테스트 데이터를 넣은 뒤 종료")
+    parser.add_argument("--rows", type=int, default=1000, help="--init-db 시 생성할 데이터 수")
+    args = parser.parse_args()
+
+    if args.init_db:
+        await init_db(args.rows)
+        return
+
+    print(f"{args.method} {args.base_url}{args.path}")
+    for concurrency in args.concurrency:
+        await run_level(args.base_url + args.path, args.method, concurrency, args.duration)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,7 +7,11 @@ CREATE TABLE music (
     release_year INT NOT NULL,
     genre VARCHAR(50) NOT NULL,
     duration INT NOT NULL, -- 초 단위
-    likes INT NOT NULL DEFAULT 0
+    likes INT NOT NULL DEFAULT 0,
+    genre_key VARCHAR(50) AS (LOWER(TRIM(genre))) STORED, -- 장르 검색용 정규화 컬럼
+    INDEX ix_music_genre_key (genre_key),
+    INDEX ix_music_likes (likes), -- 좋아요 순위 조회용
+    INDEX ix_music_genre_key_likes (genre_key, likes)
 );
 
 -- 예시 데이터 삽입
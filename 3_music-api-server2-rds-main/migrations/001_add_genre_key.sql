@@ -0,0 +1,9 @@
+-- 장르 검색용 정규화 컬럼과 인덱스 추가
+-- 기존 music 테이블에 한 번만 실행합니다.
+-- STORED 생성 컬럼이므로 기존 행도 자동으로 채워지며, 이 과정에서 테이블이 재구성됩니다.
+ALTER TABLE music
+    ADD COLUMN genre_key VARCHAR(50) AS (LOWER(TRIM(genre))) STORED,
+    ADD INDEX ix_music_genre_key (genre_key);
+
+-- 되돌리기
+-- ALTER TABLE music DROP INDEX ix_music_genre_key, DROP COLUMN genre_key;
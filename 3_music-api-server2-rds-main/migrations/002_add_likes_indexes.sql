@@ -0,0 +1,8 @@
+-- 좋아요 순위(GET /api/music/top) 조회용 인덱스 추가
+-- 기존 music 테이블에 한 번만 실행합니다. 001_add_genre_key.sql 이후에 실행해야 합니다.
+ALTER TABLE music
+    ADD INDEX ix_music_likes (likes),
+    ADD INDEX ix_music_genre_key_likes (genre_key, likes);
+
+-- 되돌리기
+-- ALTER TABLE music DROP INDEX ix_music_likes, DROP INDEX ix_music_genre_key_likes;
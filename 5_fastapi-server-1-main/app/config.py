@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Literal, Optional
 
 class Settings(BaseSettings):
     # Database
@@ -8,11 +8,35 @@ class Settings(BaseSettings):
     DB_USER: str
     DB_PASSWORD: str
     DB_NAME: str
+    # SQL 문을 모두 로그로 출력 (디버그용)
+    DB_ECHO: bool = False
+
+    # 로깅: 기본 레벨, 로거별 레벨("이름=레벨,..."), 형식(json/text), 큐 크기
+    LOG_LEVEL: str = "INFO"
+    LOG_LEVELS: str = "boto3=WARNING,botocore=WARNING,urllib3=WARNING,sqlalchemy.engine=WARNING"
+    LOG_FORMAT: str = "json"
+    LOG_QUEUE_SIZE: int = 10000
+    # 로그가 많은 로거의 초당 레코드 수 제한과 샘플링 비율 (WARNING 이상은 항상 출력)
+    LOG_RATE_LIMITED_LOGGERS: str = "boto3,botocore,urllib3,sqlalchemy.engine"
+    LOG_RATE_LIMIT: float = 50
+    LOG_SAMPLE_RATE: float = 1.0
+    # Prometheus 메트릭(/metrics): 요청/SQL/S3/DynamoDB 지연 시간 측정 여부
+    METRICS_ENABLED: bool = True
 
     # JWT
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # 인증된 사용자 캐시: 유효 시간(초, 0이면 사용 안 함)과 최대 사용자 수
+    AUTH_USER_CACHE_TTL: float = 60
+    AUTH_USER_CACHE_SIZE: int = 10000
+    # 토큰의 클레임(sub, email, name)만으로 사용자를 만들고 users 테이블을 조회하지 않음
+    # (삭제된 사용자나 비밀번호 변경은 토큰이 만료될 때까지 반영되지 않음)
+    AUTH_STATELESS: bool = False
+    # 비밀번호 해시: bcrypt 비용(바꾸면 로그인 시 다시 해시), 해시용 프로세스 수, 실행 대기 최대 수
+    AUTH_BCRYPT_ROUNDS: int = 12
+    AUTH_HASH_WORKERS: int = 2
+    AUTH_HASH_QUEUE_SIZE: int = 256
 
     # AWS
     AWS_ACCESS_KEY_ID: str
@@ -20,6 +44,51 @@ class Settings(BaseSettings):
     AWS_REGION: str
     S3_BUCKET_NAME: str
     DYNAMODB_TABLE_NAME: str = "AssetMetadata"
+    # 저장 직후 항목을 다시 읽어 로그로 확인 (디버그용, 읽기 요청이 추가됨)
+    DYNAMODB_VERIFY_WRITES: bool = False
+    # 메타데이터 쓰기 지연 큐: BatchWriteItem 크기(최대 25), 저장 간격(초), 최대 대기 항목 수, UnprocessedItems 재시도 횟수
+    DYNAMODB_WRITE_BEHIND: bool = True
+    DYNAMODB_BATCH_SIZE: int = 25
+    DYNAMODB_FLUSH_INTERVAL: float = 0.2
+    DYNAMODB_WRITE_QUEUE_SIZE: int = 1000
+    DYNAMODB_BATCH_MAX_RETRIES: int = 8
+    # 저장한 메타데이터가 GSI(UserCreatedAtIndex)에 반영될 때까지 목록 조회에 겹쳐 보여줄 시간(초)
+    DYNAMODB_READ_MODEL_GRACE: float = 5.0
+    # S3 호환 저장소(MinIO, moto 등)나 DynamoDB Local을 사용할 때만 지정
+    S3_ENDPOINT_URL: Optional[str] = None
+    DYNAMODB_ENDPOINT_URL: Optional[str] = None
+
+    # AWS 클라이언트 공통 설정 (커넥션 풀, 타임아웃, 재시도, 호출용 스레드 수)
+    AWS_MAX_POOL_CONNECTIONS: int = 50
+    AWS_CONNECT_TIMEOUT: float = 5
+    AWS_READ_TIMEOUT: float = 60
+    AWS_MAX_ATTEMPTS: int = 3
+    AWS_RETRY_MODE: str = "standard"
+    AWS_EXECUTOR_WORKERS: int = 32
+
+    # 멀티파트 업로드: 파트 크기(최소 5MiB)와 동시에 전송할 파트 수
+    S3_MULTIPART_CHUNK_SIZE: int = 8 * 1024 * 1024
+    S3_MULTIPART_CONCURRENCY: int = 4
+
+    # 클라이언트 직접 업로드용 presigned URL 유효 시간(초)
+    S3_UPLOAD_URL_EXPIRATION: int = 3600
+
+    # 자산 조회용 presigned URL: 유효 시간(초), 캐시 크기, 유효 시간 중 재사용할 비율, 로컬 서명 사용 여부
+    S3_PRESIGNED_URL_EXPIRATION: int = 3600
+    S3_PRESIGNED_URL_CACHE_SIZE: int = 100000
+    S3_PRESIGNED_URL_REUSE_FRACTION: float = 0.5
+    S3_LOCAL_PRESIGN: bool = True
+
+    # 자산 검색: 접두어 검색(term*)의 최소 길이, 검색어 최대 개수, 자산당 최대 색인 단어 수,
+    # 태그 패싯 최대 개수와 패싯을 계산할 상위 결과 수
+    SEARCH_MIN_PREFIX_LENGTH: int = 2
+    SEARCH_MAX_QUERY_TERMS: int = 8
+    SEARCH_MAX_TERMS_PER_ASSET: int = 256
+    SEARCH_FACET_LIMIT: int = 20
+    SEARCH_FACET_SAMPLE_SIZE: int = 10000
+
+    # 자산 목록 기본 조회 경로: rds 또는 dynamodb (최신순 페이지 조회를 UserCreatedAtIndex로 처리, 요청별로 source로 지정 가능)
+    ASSET_LIST_SOURCE: Literal["rds", "dynamodb"] = "rds"
 
     class Config:
         env_file = ".env"
@@ -1,9 +1,11 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
 from app.database import get_db
 from app.models.user import User
-from app.utils.auth import decode_access_token
+from app.utils.auth import decode_access_token_claims, password_fingerprint
+from app.utils.user_cache import user_cache
 from sqlalchemy import select
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
@@ -12,20 +14,43 @@ async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db)
 ) -> User:
+    """
+    토큰의 사용자를 반환합니다.
+    - AUTH_STATELESS=true이고 토큰에 email/name 클레임이 있으면 DB를 조회하지 않음
+    - 그 외에는 사용자 캐시를 먼저 확인하고, 없을 때만 users 테이블을 조회
+    - 토큰의 비밀번호 지문(pwv)이 현재 비밀번호 버전과 다르면 거부 (비밀번호 변경 전에 발급된 토큰)
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    user_id = decode_access_token(token)
-    if user_id is None:
+    claims = decode_access_token_claims(token)
+    if claims is None:
         raise credentials_exception
-        
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    
-    if user is None:
+    try:
+        user_id = int(claims["sub"])
+    except ValueError:
+        raise credentials_exception
+
+    if settings.AUTH_STATELESS and "email" in claims and "name" in claims:
+        user_cache.record_stateless()
+        return User(id=user_id, email=claims["email"], name=claims["name"])
+
+    cached = user_cache.get(user_id) if user_cache.enabled else None
+    if cached is not None:
+        user, fingerprint = cached
+    else:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if user is None:
+            raise credentials_exception
+        fingerprint = password_fingerprint(user)
+        user_cache.put(user, fingerprint)
+
+    # pwv가 없는 토큰은 이 기능 이전에 발급된 토큰이므로 그대로 허용
+    if claims.get("pwv", fingerprint) != fingerprint:
         raise credentials_exception
         
-    return user 
\ No newline at end of file
+    return user
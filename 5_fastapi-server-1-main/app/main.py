@@ -1,25 +1,40 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-import logging
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.DEBUG,  # INFO에서 DEBUG로 변경
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler()  # 콘솔에 출력
-    ]
-)
+from app.utils.aws import shutdown_executors
+from app.config import settings
+from app.utils.dynamodb import check_table, metadata_writer
+from app.utils.s3 import url_cache
+from app.utils.user_cache import user_cache
+from app.utils.auth import password_hasher
+from app.utils.log_config import configure_logging, logging_metrics, stop_logging
+from app.utils.metrics import CONTENT_TYPE, MetricsMiddleware, render_metrics
+
+# 로깅 설정 (큐 기반 비동기 출력, 로거별 레벨은 LOG_LEVEL/LOG_LEVELS로 설정)
+configure_logging()
 
-# AWS SDK 로깅 설정
-logging.getLogger('boto3').setLevel(logging.DEBUG)
-logging.getLogger('botocore').setLevel(logging.DEBUG)
-logging.getLogger('urllib3').setLevel(logging.DEBUG)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # DynamoDB 테이블은 시작 시 한 번만 확인하고, 저장할 때는 다시 확인하지 않음
+    await check_table()
+    # 메타데이터 쓰기 지연 큐 시작
+    if settings.DYNAMODB_WRITE_BEHIND:
+        metadata_writer.start()
+    # 첫 로그인이 프로세스 시작을 기다리지 않도록 해시용 프로세스를 미리 시작
+    password_hasher.warm_up()
+    yield
+    # 큐에 남은 메타데이터를 모두 저장한 뒤 스레드 풀 정리
+    await metadata_writer.close()
+    shutdown_executors()
+    password_hasher.shutdown()
+    # 큐에 남은 로그를 모두 출력
+    stop_logging()
 
 app = FastAPI(
     title="Digital Asset Management API",
     description="API for managing digital assets",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -31,10 +46,39 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우트별 요청 지연 시간 (Prometheus /metrics)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 @app.get("/")
 async def root():
     return {"message": "Digital Asset Management API"}
 
+@app.get("/metrics")
+async def prometheus_metrics():
+    # 요청/SQL/S3/DynamoDB 지연 시간 히스토그램, 오류 수, 커넥션 풀 상태 (Prometheus 텍스트 형식)
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
+
+@app.get("/metrics/dynamodb")
+async def dynamodb_metrics():
+    # 쓰기 지연 큐 깊이, 배치 저장 지연 시간, 실패/재시도 횟수
+    return metadata_writer.metrics()
+
+@app.get("/metrics/s3")
+async def s3_metrics():
+    # presigned URL 캐시 크기와 적중/미스 횟수
+    return url_cache.metrics()
+
+@app.get("/metrics/auth")
+async def auth_metrics():
+    # 사용자 캐시 적중률과 줄어든 users 조회 횟수
+    return {**user_cache.metrics(), 'password_hasher': password_hasher.metrics()}
+
+@app.get("/metrics/logging")
+async def log_metrics():
+    # 큐가 가득 차서 버린 로그, 초당 개수 제한/샘플링으로 거른 로그 수
+    return logging_metrics()
+
 # 라우터 등록
 from app.routers import auth, assets, folders
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
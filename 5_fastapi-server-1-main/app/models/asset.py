@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, func, BigInteger, Text, Table
+from sqlalchemy import Column, String, DateTime, ForeignKey, func, BigInteger, SmallInteger, Text, Table, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 import uuid
@@ -13,6 +13,11 @@ asset_tags = Table(
 
 class Asset(Base):
     __tablename__ = "assets"
+    # 목록 조회의 (created_at, id) 커서 페이지네이션용 인덱스 (InnoDB 보조 인덱스는 끝에 id를 포함)
+    __table_args__ = (
+        Index("idx_assets_user_folder_created", "user_id", "folder_id", "created_at"),
+        Index("idx_assets_user_created", "user_id", "created_at"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False)
@@ -31,6 +36,10 @@ class Asset(Base):
 
 class Tag(Base):
     __tablename__ = "tags"
+    # 사용자별 태그 이름은 하나만 존재 (태그 생성 시 INSERT ... ON DUPLICATE KEY UPDATE의 기준)
+    __table_args__ = (
+        UniqueConstraint("user_id", "name", name="uq_tags_user_id_name"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     name = Column(String(100), nullable=False)
@@ -38,4 +47,23 @@ class Tag(Base):
     created_at = Column(DateTime, server_default=func.now())
 
     # Relationships
-    assets = relationship("Asset", secondary=asset_tags, back_populates="tags") 
\ No newline at end of file
+    assets = relationship("Asset", secondary=asset_tags, back_populates="tags")
+
+class AssetSearchTerm(Base):
+    """
+    자산 검색용 역색인: 사용자별 단어 -> 자산 (app/utils/search.py에서 자산 생성/삭제 시 함께 갱신)
+    """
+    __tablename__ = "asset_search_terms"
+    # 기본 키 (user_id, term, weight, asset_id): 한 단어의 자산을 가중치 순서대로 읽고(LIMIT만큼만),
+    # 접두어는 (user_id, term) 범위로 조회. 자산당 단어는 하나뿐이므로 weight를 키에 넣어도 중복되지 않음
+    # asset_id 인덱스는 자산 삭제 시 정리용
+    __table_args__ = (
+        Index("idx_asset_search_terms_asset_id", "asset_id"),
+    )
+
+    user_id = Column(BigInteger, ForeignKey("users.id"), primary_key=True)
+    # 접두어 범위 조회가 코드 포인트 순서를 따르도록 MySQL에서는 바이너리 정렬 사용
+    term = Column(String(64).with_variant(String(64, collation="utf8mb4_bin"), "mysql"), primary_key=True)
+    # 단어가 나온 필드의 가중치 합 (이름 4, 태그 2, 설명 1)
+    weight = Column(SmallInteger, primary_key=True, autoincrement=False)
+    asset_id = Column(BigInteger, ForeignKey("assets.id"), primary_key=True)
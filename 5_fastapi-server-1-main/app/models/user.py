@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, func, BigInteger
+from sqlalchemy import Column, String, DateTime, func, BigInteger, Integer
 from app.database import Base
 import uuid
 
@@ -8,6 +8,9 @@ class User(Base):
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     email = Column(String(255), unique=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
+    # 비밀번호를 바꿀 때마다 1씩 올림 (토큰의 pwv가 이 값에서 나오므로 이전 토큰이 거부됨)
+    # 로그인 시 bcrypt 비용 변경으로 다시 해시할 때는 올리지 않음
+    password_version = Column(Integer, nullable=False, default=1, server_default="1")
     name = Column(String(100), nullable=False)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now()) 
\ No newline at end of file
@@ -1,15 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, UploadFile, File, Form
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.database import get_db
-from app.models.asset import Asset, Tag
+from app.models.asset import Asset, Tag, asset_tags
 from app.models.folder import Folder
-from app.schemas.asset import AssetCreate, AssetResponse, TagCreate
+from app.schemas.asset import (
+    AssetCreate, AssetResponse, AssetURLResponse, TagCreate, AssetSearchHit, AssetSearchResponse,
+    AssetUploadRequest, AssetUploadResponse, AssetUploadPartURL, AssetUploadComplete
+)
+from app.config import settings
 from app.dependencies import get_current_user
 from app.models.user import User
-from app.utils.s3 import upload_file, delete_file, generate_presigned_url
-from app.utils.dynamodb import put_asset_metadata, delete_asset_metadata, get_asset_metadata
+from app.utils.s3 import (
+    upload_file, delete_file, generate_presigned_url, get_presigned_urls, make_s3_key,
+    generate_presigned_put, generate_presigned_post, create_presigned_multipart,
+    complete_multipart, head_file
+)
+from app.utils.dynamodb import put_asset_metadata, delete_asset_metadata, get_asset_metadata, list_asset_metadata
+from app.utils import search
+from datetime import datetime
 from typing import List, Optional
+import base64
 import json
 import logging
 
@@ -18,101 +33,122 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-@router.post("", response_model=AssetResponse)
-async def upload_asset(
-    file: UploadFile = File(...),
-    name: str = Form(...),
-    description: Optional[str] = Form(None),
-    folder_id: Optional[str] = Form(None),
-    tags: str = Form("[]"),  # JSON string of tag names
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    # 폴더 확인
-    if folder_id:
-        result = await db.execute(
-            select(Folder).where(
-                Folder.id == folder_id,
-                Folder.user_id == current_user.id
-            )
+async def _check_folder(db: AsyncSession, folder_id, user: User) -> None:
+    result = await db.execute(
+        select(Folder).where(
+            Folder.id == folder_id,
+            Folder.user_id == user.id
         )
-        if not result.scalar_one_or_none():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Folder not found"
-            )
-
-    # 파일 업로드
-    s3_key, file_size = await upload_file(file)
-    if not s3_key:
+    )
+    if not result.scalar_one_or_none():
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to upload file"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Folder not found"
         )
 
-    # 태그 처리
-    tag_names = json.loads(tags)
-    tag_objects = []
-    for tag_name in tag_names:
-        # 기존 태그 찾기 또는 새로 생성
+def _insert_tags_statement(db: AsyncSession):
+    """
+    이미 있는 (user_id, name) 태그는 건너뛰는 INSERT 문
+    """
+    table = Tag.__table__
+    if db.bind.dialect.name == "mysql":
+        # id = id: 중복 키면 아무것도 바꾸지 않음 (대소문자만 다른 이름으로 기존 태그를 바꾸지 않도록)
+        return mysql_insert(table).on_duplicate_key_update(id=table.c.id)
+    return sqlite_insert(table).on_conflict_do_nothing(index_elements=[table.c.user_id, table.c.name])
+
+async def _resolve_tags(db: AsyncSession, user: User, tag_names: List[str]) -> List[Tag]:
+    """
+    태그 이름 목록을 Tag 객체로 변환합니다. 태그 수와 관계없이 SELECT 1회,
+    새 태그가 있으면 다중 행 INSERT 1회와 새 태그 SELECT 1회가 추가됩니다.
+    """
+    names = list(dict.fromkeys(tag_names))
+    if not names:
+        return []
+
+    result = await db.execute(
+        select(Tag).where(Tag.user_id == user.id, Tag.name.in_(names))
+    )
+    tags = list(result.scalars())
+    found = {tag.name for tag in tags}
+    missing = [name for name in names if name not in found]
+
+    if missing:
+        # 동시에 같은 태그를 만드는 요청이 있어도 유니크 인덱스로 중복 없이 처리
+        await db.execute(
+            _insert_tags_statement(db).values([{"name": name, "user_id": user.id} for name in missing])
+        )
         result = await db.execute(
-            select(Tag).where(
-                Tag.name == tag_name,
-                Tag.user_id == current_user.id
-            )
+            select(Tag).where(Tag.user_id == user.id, Tag.name.in_(missing))
         )
-        tag = result.scalar_one_or_none()
-        if not tag:
-            tag = Tag(name=tag_name, user_id=current_user.id)
-            db.add(tag)
-            await db.flush()  # ID를 얻기 위해 flush
-        tag_objects.append(tag)
+        tags.extend(tag for tag in result.scalars() if tag not in tags)
+
+    # 요청한 순서대로 정렬
+    order = {name: i for i, name in enumerate(names)}
+    tags.sort(key=lambda tag: order.get(tag.name, len(names)))
+    return tags
+
+async def _create_asset(
+    db: AsyncSession,
+    current_user: User,
+    name: str,
+    description: Optional[str],
+    folder_id,
+    tag_names: List[str],
+    mime_type: Optional[str],
+    size: int,
+    s3_key: str,
+    checksum: Optional[str] = None
+) -> AssetResponse:
+    """
+    S3에 올라간 파일로 자산/태그 행과 DynamoDB 메타데이터를 만들고 응답을 반환합니다.
+    """
+    # 태그 처리 (기존 태그 조회와 새 태그 생성을 한 번에)
+    tag_objects = await _resolve_tags(db, current_user, tag_names)
 
     # 자산 생성
     asset = Asset(
         name=name,
         description=description,
-        mime_type=file.content_type,
-        size=file_size,
+        mime_type=mime_type,
+        size=size,
         s3_key=s3_key,
         folder_id=folder_id,
         user_id=current_user.id,
         tags=tag_objects
     )
     db.add(asset)
+    await db.flush()
+    # 검색 색인도 같은 트랜잭션에서 저장
+    await search.index_asset(db, current_user.id, asset.id, name, description, [tag.name for tag in tag_objects])
     await db.commit()
     await db.refresh(asset)
 
     # DynamoDB에 메타데이터 저장
-    tag_data = [{"id": tag.id, "name": tag.name} for tag in tag_objects]
+    tag_data = [{"id": tag.id, "name": tag.name, "created_at": tag.created_at} for tag in tag_objects]
     try:
         dynamodb_success = await put_asset_metadata(
             user_id=str(current_user.id),
             asset_id=str(asset.id),
             name=name,
             description=description,
-            mime_type=file.content_type or "application/octet-stream",
-            size=file_size,
+            mime_type=mime_type or "application/octet-stream",
+            size=size,
             s3_key=s3_key,
             folder_id=str(folder_id) if folder_id else None,
-            tags=tag_data
+            tags=tag_data,
+            checksum=checksum,
+            created_at=asset.created_at
         )
         
         if not dynamodb_success:
-            logger.error(f"DynamoDB 저장 실패 - asset_id: {asset.id}, user_id: {current_user.id}")
+            logger.error("DynamoDB 저장 실패 - asset_id: %s, user_id: %s", asset.id, current_user.id)
         else:
-            logger.info(f"DynamoDB 저장 성공 - asset_id: {asset.id}, user_id: {current_user.id}")
+            logger.info("DynamoDB 저장 성공 - asset_id: %s, user_id: %s", asset.id, current_user.id)
             
     except Exception as e:
-        logger.error(f"DynamoDB 저장 중 예외 발생 - asset_id: {asset.id}, error: {str(e)}")
-
-    # 태그 정보 명시적으로 가져오기
-    result = await db.execute(
-        select(Tag).where(Tag.id.in_([tag.id for tag in tag_objects]))
-    )
-    tags = result.scalars().all()
+        logger.error("DynamoDB 저장 중 예외 발생 - asset_id: %s, error: %s", asset.id, e)
 
-    # 응답 생성
+    # 응답 생성 (태그는 이미 불러온 객체 사용)
     return AssetResponse(
         id=asset.id,
         name=asset.name,
@@ -123,68 +159,557 @@ async def upload_asset(
         file_url=generate_presigned_url(asset.s3_key),
         created_at=asset.created_at,
         updated_at=asset.updated_at,
-        tags=[{"id": tag.id, "name": tag.name, "created_at": tag.created_at} for tag in tags]
+        tags=[{"id": tag.id, "name": tag.name, "created_at": tag.created_at} for tag in tag_objects]
     )
 
-@router.get("", response_model=List[AssetResponse])
-async def get_assets(
-    folder_id: Optional[int] = None,
-    tag: Optional[str] = None,
+def _upload_prefix(user: User) -> str:
+    # 직접 업로드 키는 사용자별 경로에 예약해서, 완료 시 다른 사용자의 객체를 등록할 수 없게 합니다.
+    return f"uploads/{user.id}"
+
+@router.post("", response_model=AssetResponse)
+async def upload_asset(
+    file: UploadFile = File(...),
+    name: str = Form(...),
+    description: Optional[str] = Form(None),
+    folder_id: Optional[str] = Form(None),
+    tags: str = Form("[]"),  # JSON string of tag names
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    # 기본 쿼리 생성
-    query = select(Asset).where(Asset.user_id == current_user.id)
-    
+    # 폴더 확인
+    if folder_id:
+        await _check_folder(db, folder_id, current_user)
+
+    # 파일 업로드
+    s3_key, file_size, checksum = await upload_file(file)
+    if not s3_key:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to upload file"
+        )
+
+    return await _create_asset(
+        db, current_user,
+        name=name,
+        description=description,
+        folder_id=folder_id,
+        tag_names=json.loads(tags),
+        mime_type=file.content_type,
+        size=file_size,
+        s3_key=s3_key,
+        checksum=checksum
+    )
+
+@router.post("/uploads", response_model=AssetUploadResponse)
+async def create_upload(
+    upload: AssetUploadRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    클라이언트가 S3에 직접 업로드할 수 있도록 s3_key를 예약하고 presigned URL을 발급합니다.
+    업로드가 끝나면 POST /uploads/complete로 자산을 등록합니다.
+    """
+    s3_key = make_s3_key(upload.filename, _upload_prefix(current_user))
+    content_type = upload.content_type or "application/octet-stream"
+    expires_in = settings.S3_UPLOAD_URL_EXPIRATION
+    method = upload.method or ("multipart" if upload.size > settings.S3_MULTIPART_CHUNK_SIZE else "put")
+
+    if method == "put":
+        url = generate_presigned_put(s3_key, content_type, expires_in)
+        return AssetUploadResponse(s3_key=s3_key, method=method, expires_in=expires_in, url=url)
+
+    if method == "post":
+        form = generate_presigned_post(s3_key, content_type, upload.size, expires_in)
+        return AssetUploadResponse(
+            s3_key=s3_key, method=method, expires_in=expires_in,
+            url=form["url"], fields=form["fields"]
+        )
+
+    multipart = await create_presigned_multipart(s3_key, content_type, upload.size, expires_in)
+    if multipart is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to start multipart upload"
+        )
+    upload_id, part_size, urls = multipart
+    return AssetUploadResponse(
+        s3_key=s3_key, method=method, expires_in=expires_in,
+        upload_id=upload_id, part_size=part_size,
+        parts=[AssetUploadPartURL(part_number=i, url=url) for i, url in enumerate(urls, start=1)]
+    )
+
+@router.post("/uploads/complete", response_model=AssetResponse)
+async def complete_upload(
+    upload: AssetUploadComplete,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    직접 업로드한 객체를 HEAD로 확인한 뒤 자산으로 등록합니다.
+    """
+    if not upload.s3_key.startswith(_upload_prefix(current_user) + "/"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Upload does not belong to the current user"
+        )
+
+    # 폴더 확인
+    if upload.folder_id:
+        await _check_folder(db, upload.folder_id, current_user)
+
+    # 같은 객체를 두 번 등록하지 않음
+    result = await db.execute(
+        select(Asset.id).where(
+            Asset.user_id == current_user.id,
+            Asset.s3_key == upload.s3_key
+        )
+    )
+    if result.first():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Upload already completed"
+        )
+
+    if upload.upload_id:
+        parts = None
+        if upload.parts:
+            parts = [{"PartNumber": part.part_number, "ETag": part.etag} for part in upload.parts]
+        if not await complete_multipart(upload.s3_key, upload.upload_id, parts):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Failed to complete multipart upload"
+            )
+
+    head = await head_file(upload.s3_key)
+    if head is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded file not found"
+        )
+
+    return await _create_asset(
+        db, current_user,
+        name=upload.name,
+        description=upload.description,
+        folder_id=upload.folder_id,
+        tag_names=upload.tags or [],
+        mime_type=head.get("ContentType"),
+        size=head["ContentLength"],
+        s3_key=upload.s3_key
+    )
+
+# 목록 조회: 정렬 기준별 컬럼, 커서만 지정한 경우의 기본 페이지 크기
+_SORT_COLUMNS = {
+    "created_at": Asset.created_at,
+    "name": Asset.name,
+    "size": Asset.size,
+}
+DEFAULT_PAGE_SIZE = 100
+_ASSET_COLUMNS = ("name", "description", "folder_id", "mime_type", "size", "created_at", "updated_at")
+_LIST_FIELDS = {"id", "file_url", "tags", *_ASSET_COLUMNS}
+# DynamoDB 목록 조회: 커서의 정렬 기준 자리에 넣는 값, 응답 필드 -> 메타데이터 속성
+# (메타데이터에는 updated_at이 없으므로 created_at으로 대신함)
+DYNAMODB_CURSOR = "dynamodb"
+_DYNAMODB_ATTRIBUTES = {
+    "id": "asset_id",
+    "name": "name",
+    "description": "description",
+    "folder_id": "folder_id",
+    "mime_type": "mime_type",
+    "size": "size",
+    "created_at": "created_at",
+    "updated_at": "created_at",
+    "file_url": "s3_key",
+    "tags": "tags",
+}
+
+def _encode_cursor(sort: str, value, asset_id: int) -> str:
+    """
+    다음 페이지 커서: [정렬 기준, 마지막 자산의 정렬 값, 마지막 자산 id]를 base64url로 인코딩
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, asset_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def _load_cursor(cursor: str):
+    return json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+
+def _cursor_sort(cursor: str) -> Optional[str]:
+    """
+    커서를 만든 정렬 기준 (DynamoDB 목록의 커서는 DYNAMODB_CURSOR), 형식이 잘못되었으면 None
+    """
+    try:
+        return _load_cursor(cursor)[0]
+    except (ValueError, TypeError, KeyError, IndexError):
+        return None
+
+def _decode_cursor(cursor: str, sort: str) -> tuple:
+    try:
+        cursor_sort, value, asset_id = _load_cursor(cursor)
+        # 다른 정렬 기준으로 만든 커서는 사용할 수 없음
+        if cursor_sort != sort:
+            raise ValueError(cursor_sort)
+        if sort.lstrip("-") == "created_at":
+            value = datetime.fromisoformat(value)
+        return value, int(asset_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+def _parse_fields(fields: Optional[str]) -> Optional[set]:
+    if fields is None:
+        return None
+    wanted = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = wanted - _LIST_FIELDS
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return wanted | {"id"}
+
+async def _load_tags(db: AsyncSession, asset_ids: List[int]) -> dict:
+    """
+    자산 id별 태그 목록을 한 번의 쿼리로 조회
+    """
+    asset_tags_by_id = {}
+    if not asset_ids:
+        return asset_tags_by_id
+    tag_result = await db.execute(
+        select(asset_tags.c.asset_id, Tag.id, Tag.name, Tag.created_at)
+        .join(Tag, Tag.id == asset_tags.c.tag_id)
+        .where(asset_tags.c.asset_id.in_(asset_ids))
+    )
+    for asset_id, tag_id, tag_name, tag_created_at in tag_result:
+        asset_tags_by_id.setdefault(asset_id, []).append({
+            "id": tag_id,
+            "name": tag_name,
+            "created_at": tag_created_at
+        })
+    return asset_tags_by_id
+
+async def _list_rds_page(
+    db: AsyncSession,
+    user: User,
+    folder_id: Optional[int],
+    tag: Optional[str],
+    limit: Optional[int],
+    cursor: Optional[str],
+    sort: str,
+    wanted: Optional[set],
+    include_tags: bool,
+    include_url: bool
+) -> tuple:
+    """
+    RDS에서 자산 목록(한 페이지 또는 전체)을 조회해 (행 목록, 자산 id별 태그, 다음 페이지 커서)를 반환
+    """
+    sort_name = sort.lstrip("-")
+    sort_column = _SORT_COLUMNS[sort_name]
+
+    # 필요한 컬럼만 조회 (정렬 컬럼은 커서를 만들 때 필요)
+    names = [name for name in _ASSET_COLUMNS if wanted is None or name in wanted]
+    names = ["id", *names, *([sort_name] if sort_name not in names else []), *(["s3_key"] if include_url else [])]
+    query = select(*(getattr(Asset, name) for name in names)).where(Asset.user_id == user.id)
+
     # 필터 적용
     if folder_id:
         query = query.where(Asset.folder_id == folder_id)
-    
+
     if tag:
         query = query.join(Asset.tags).where(Tag.name == tag)
-    
+
+    # 정렬과 커서 (같은 정렬 값은 id로 구분)
+    if sort.startswith("-"):
+        query = query.order_by(sort_column.desc(), Asset.id.desc())
+    else:
+        query = query.order_by(sort_column, Asset.id)
+    if cursor is not None:
+        value, last_id = _decode_cursor(cursor, sort)
+        if sort.startswith("-"):
+            query = query.where(or_(sort_column < value, and_(sort_column == value, Asset.id < last_id)))
+        else:
+            query = query.where(or_(sort_column > value, and_(sort_column == value, Asset.id > last_id)))
+    if limit is not None or cursor is not None:
+        limit = limit or DEFAULT_PAGE_SIZE
+        # 한 건 더 읽어서 다음 페이지가 있는지 확인
+        query = query.limit(limit + 1)
+
     # 자산 목록 조회
     result = await db.execute(query)
-    assets = result.scalars().all()
-
-    # 모든 자산의 태그 정보를 한 번에 가져오기
-    asset_ids = [asset.id for asset in assets]
-    if asset_ids:
-        tag_result = await db.execute(
-            select(Tag, Asset)
-            .join(Asset.tags)
-            .where(Asset.id.in_(asset_ids))
-        )
-        # 자산 ID별로 태그 정보 매핑
-        asset_tags = {}
-        for tag, asset in tag_result:
-            if asset.id not in asset_tags:
-                asset_tags[asset.id] = []
-            asset_tags[asset.id].append({
-                "id": tag.id,
-                "name": tag.name,
-                "created_at": tag.created_at
-            })
+    rows = [row._mapping for row in result]
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(sort, rows[-1][sort_name], rows[-1]["id"])
+
+    # 페이지에 있는 자산의 태그 정보를 한 번에 가져오기
+    asset_tags_by_id = await _load_tags(db, [row["id"] for row in rows]) if include_tags else {}
+    return rows, asset_tags_by_id, next_cursor
+
+async def _list_dynamodb_page(
+    user: User,
+    limit: int,
+    after: Optional[tuple],
+    wanted: Optional[set],
+    include_tags: bool,
+    include_url: bool
+) -> tuple:
+    """
+    DynamoDB UserCreatedAtIndex에서 최신순으로 한 페이지를 읽어 RDS 조회와 같은 형태로 반환
+    (필요한 속성만 ProjectionExpression으로 읽고, 태그는 메타데이터에 함께 저장된 값을 사용)
+    """
+    fields = set(wanted or _LIST_FIELDS)
+    if not include_tags:
+        fields.discard("tags")
+    if not include_url:
+        fields.discard("file_url")
+    items, next_after = await list_asset_metadata(
+        str(user.id), limit, after, {_DYNAMODB_ATTRIBUTES[name] for name in fields}
+    )
+
+    rows = []
+    asset_tags_by_id = {}
+    for item in items:
+        created_at = datetime.fromisoformat(item["created_at"])
+        asset_id = int(item["asset_id"])
+        rows.append({
+            "id": asset_id,
+            "name": item.get("name"),
+            "description": item.get("description"),
+            "folder_id": int(item["folder_id"]) if "folder_id" in item else None,
+            "mime_type": item.get("mime_type"),
+            "size": item.get("size"),
+            "created_at": created_at,
+            "updated_at": created_at,
+            "s3_key": item.get("s3_key"),
+        })
+        # 태그 생성 시각이 없는 이전 항목은 자산 생성 시각으로 대신함
+        asset_tags_by_id[asset_id] = [{
+            "id": int(tag["id"]),
+            "name": tag["name"],
+            "created_at": datetime.fromisoformat(tag["created_at"]) if "created_at" in tag else created_at
+        } for tag in item.get("tags", [])]
+
+    next_cursor = None
+    if next_after is not None:
+        next_cursor = _encode_cursor(DYNAMODB_CURSOR, next_after[0], int(next_after[1]))
+    return rows, asset_tags_by_id, next_cursor
+
+@router.get("", response_model=List[AssetResponse])
+async def get_assets(
+    response: Response,
+    folder_id: Optional[int] = None,
+    tag: Optional[str] = None,
+    include_url: bool = True,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="페이지 크기 (지정 시 커서 페이지네이션)"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 X-Next-Cursor 헤더 값"),
+    sort: str = Query("-created_at", pattern="^-?(created_at|name|size)$", description="정렬 기준 (-는 내림차순)"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표로 구분, 예: id,name,size)"),
+    source: Optional[str] = Query(None, pattern="^(rds|dynamodb)$", description="조회 경로 (기본: ASSET_LIST_SOURCE 설정)"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    자산 목록을 조회합니다.
+    - limit/cursor를 지정하면 (정렬 값, id) 순서로 페이지 단위 조회하며, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달
+    - sort: created_at, name, size (앞에 -를 붙이면 내림차순, 기본 -created_at)
+    - fields를 지정하면 해당 필드만 반환 (tags, file_url을 빼면 태그 조회와 URL 서명을 하지 않음)
+    - include_url=false이면 presigned URL(file_url)을 만들지 않음 (필요할 때 GET /{asset_id}/url로 조회)
+    - source=dynamodb이면 필터 없는 최신순 페이지 조회를 DynamoDB(UserCreatedAtIndex)에서 처리 (그 외에는 RDS)
+    """
+    wanted = _parse_fields(fields)
+    include_tags = wanted is None or "tags" in wanted
+    include_url = include_url and (wanted is None or "file_url" in wanted)
+
+    # DynamoDB는 필터 없는 최신순 페이지 조회만 처리하며, 다음 페이지는 커서를 만든 쪽에서 조회
+    if cursor is not None:
+        use_dynamodb = _cursor_sort(cursor) == DYNAMODB_CURSOR
     else:
-        asset_tags = {}
+        use_dynamodb = (source or settings.ASSET_LIST_SOURCE) == "dynamodb" and limit is not None
+    use_dynamodb = use_dynamodb and sort == "-created_at" and not folder_id and not tag
+
+    page = None
+    served_by = "rds"
+    if use_dynamodb:
+        after = None
+        if cursor is not None:
+            created_at, last_id = _decode_cursor(cursor, DYNAMODB_CURSOR)
+            after = (str(created_at), str(last_id))
+        try:
+            page = await _list_dynamodb_page(
+                current_user, limit or DEFAULT_PAGE_SIZE, after, wanted, include_tags, include_url
+            )
+            served_by = "dynamodb"
+        except Exception as e:
+            if cursor is not None:
+                logger.error("DynamoDB 자산 목록 조회 실패 - user_id: %s, error: %s", current_user.id, e)
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Asset listing is temporarily unavailable"
+                )
+            # 첫 페이지는 RDS로 대신 조회 (다음 페이지도 RDS 커서로 이어짐)
+            logger.warning("DynamoDB 자산 목록 조회 실패, RDS로 조회합니다 - user_id: %s, error: %s", current_user.id, e)
+    if page is None:
+        page = await _list_rds_page(
+            db, current_user, folder_id, tag, limit, cursor, sort, wanted, include_tags, include_url
+        )
+    rows, asset_tags_by_id, next_cursor = page
 
-    # 응답 생성
+    # presigned URL은 캐시된 URL을 재사용하고 나머지만 한 번에 서명
+    file_urls = await get_presigned_urls(row["s3_key"] for row in rows) if include_url else {}
+
+    # 응답 생성 (X-Asset-Source: 목록을 조회한 곳)
+    headers = {"X-Asset-Source": served_by}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    if wanted is not None:
+        items = []
+        for row in rows:
+            item = {name: row[name] for name in wanted if name in row}
+            if "tags" in wanted:
+                item["tags"] = asset_tags_by_id.get(row["id"], [])
+            if "file_url" in wanted:
+                # include_url=false이면 s3_key를 읽지 않으므로 null로 반환
+                item["file_url"] = file_urls.get(row["s3_key"]) if include_url else None
+            items.append(item)
+        return JSONResponse(jsonable_encoder(items), headers=headers)
+
+    response.headers.update(headers)
     return [
         AssetResponse(
-            id=asset.id,
-            name=asset.name,
-            description=asset.description,
-            folder_id=asset.folder_id,
-            mime_type=asset.mime_type,
-            size=asset.size,
-            file_url=generate_presigned_url(asset.s3_key),
-            created_at=asset.created_at,
-            updated_at=asset.updated_at,
-            tags=asset_tags.get(asset.id, [])
-        )
-        for asset in assets
+            **{name: row[name] for name in ("id", *_ASSET_COLUMNS)},
+            file_url=file_urls.get(row["s3_key"]) if include_url else None,
+            tags=asset_tags_by_id.get(row["id"], [])
+        )
+        for row in rows
     ]
 
+DEFAULT_SEARCH_PAGE_SIZE = 20
+
+@router.get("/search", response_model=AssetSearchResponse)
+async def search_assets(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (모든 단어가 이름/설명/태그에 있는 자산, rep*는 접두어 검색)"),
+    folder_id: Optional[int] = None,
+    tag: Optional[str] = Query(None, description="이 태그가 붙은 자산만 (태그 패싯 선택)"),
+    include_url: bool = True,
+    facets: bool = Query(True, description="첫 페이지에 전체 결과 수와 태그 패싯 포함"),
+    limit: int = Query(DEFAULT_SEARCH_PAGE_SIZE, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 X-Next-Cursor 헤더 값"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    자산 이름, 설명, 태그를 검색합니다.
+    - 검색어를 단어로 나눠 모든 단어가 들어 있는 자산을 점수(단어가 나온 필드의 가중치 합: 이름 > 태그 > 설명) 순으로 반환
+    - 단어 뒤에 *를 붙이면 그 단어로 시작하는 단어도 일치 (예: "rep*" -> "report", SEARCH_MIN_PREFIX_LENGTH자 이상)
+    - 첫 페이지에는 전체 결과 수(total)와 결과에 많이 붙은 태그(tag_facets)를 포함
+      (태그 개수는 점수 상위 SEARCH_FACET_SAMPLE_SIZE개 결과 기준)
+    - 다음 페이지 커서는 X-Next-Cursor 헤더로 전달
+    """
+    terms = search.parse_query(q)
+    if not terms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Query has no searchable terms"
+        )
+    matched = search.match_query(current_user.id, terms)
+
+    # 폴더/태그 필터 (색인은 사용자별이므로 user_id 조건은 필요 없음)
+    filters = []
+    if folder_id:
+        filters.append(Asset.folder_id == folder_id)
+    if tag:
+        filters.append(Asset.id.in_(
+            select(asset_tags.c.asset_id)
+            .join(Tag, Tag.id == asset_tags.c.tag_id)
+            .where(Tag.user_id == current_user.id, Tag.name == tag)
+        ))
+
+    # 점수 내림차순, 같은 점수는 최신 자산(id) 먼저. 커서는 같은 검색어로 만든 것만 사용
+    cursor_key = "search:" + " ".join(term + ("*" if is_prefix else "") for term, is_prefix in terms)
+    # 페이지는 색인만으로 정하고, 폴더/태그 필터가 있을 때만 assets와 조인
+    page = select(matched.c.asset_id, matched.c.score)
+    if filters:
+        page = page.join(Asset, Asset.id == matched.c.asset_id).where(*filters)
+    if cursor is not None:
+        score, last_id = _decode_cursor(cursor, cursor_key)
+        page = page.where(or_(matched.c.score < score, and_(matched.c.score == score, matched.c.asset_id < last_id)))
+    page = page.order_by(matched.c.score.desc(), matched.c.asset_id.desc()).limit(limit + 1)
+    hits = (await db.execute(page)).all()
+    if len(hits) > limit:
+        hits = hits[:limit]
+        response.headers["X-Next-Cursor"] = _encode_cursor(cursor_key, int(hits[-1].score), hits[-1].asset_id)
+
+    # 페이지에 들어갈 자산만 기본 키로 조회
+    # (색인 행은 현재 사용자 것만 읽었으므로 user_id 조건을 다시 걸지 않음, 걸면 SQLite는 user_id 인덱스를 고름)
+    rows_by_id = {}
+    if hits:
+        result = await db.execute(
+            select(Asset.id, *(getattr(Asset, name) for name in _ASSET_COLUMNS), Asset.s3_key)
+            .where(Asset.id.in_([hit.asset_id for hit in hits]))
+        )
+        rows_by_id = {row.id: row._mapping for row in result}
+    rows = [(rows_by_id[hit.asset_id], hit.score) for hit in hits if hit.asset_id in rows_by_id]
+
+    total = None
+    tag_facets = []
+    if facets and cursor is None:
+        # 필터를 적용한 전체 검색 결과 수와, 점수 상위 결과의 태그 패싯
+        matched_ids = select(matched.c.asset_id, matched.c.score)
+        if filters:
+            matched_ids = matched_ids.join(Asset, Asset.id == matched.c.asset_id).where(*filters)
+        total = await db.scalar(select(func.count()).select_from(matched_ids.subquery()))
+        top_hits = (
+            matched_ids.order_by(matched.c.score.desc(), matched.c.asset_id.desc())
+            .limit(settings.SEARCH_FACET_SAMPLE_SIZE)
+            .subquery("top_hits")
+        )
+        tag_facets = await search.tag_facets(db, top_hits)
+
+    asset_tags_by_id = await _load_tags(db, [row["id"] for row, _ in rows])
+    file_urls = await get_presigned_urls(row["s3_key"] for row, _ in rows) if include_url else {}
+    return AssetSearchResponse(
+        items=[
+            AssetSearchHit(
+                **{name: row[name] for name in ("id", *_ASSET_COLUMNS)},
+                file_url=file_urls.get(row["s3_key"]),
+                tags=asset_tags_by_id.get(row["id"], []),
+                score=score
+            )
+            for row, score in rows
+        ],
+        total=total,
+        tag_facets=tag_facets
+    )
+
+@router.get("/{asset_id}/url", response_model=AssetURLResponse)
+async def get_asset_url(
+    asset_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    result = await db.execute(
+        select(Asset.s3_key).where(
+            Asset.id == asset_id,
+            Asset.user_id == current_user.id
+        )
+    )
+    s3_key = result.scalar_one_or_none()
+    if not s3_key:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Asset not found"
+        )
+    return AssetURLResponse(
+        id=asset_id,
+        file_url=generate_presigned_url(s3_key),
+        expires_in=settings.S3_PRESIGNED_URL_EXPIRATION
+    )
+
 @router.delete("/{asset_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_asset(
     asset_id: str,
@@ -206,7 +731,7 @@ async def delete_asset(
         )
     
     # S3에서 파일 삭제
-    if not delete_file(asset.s3_key):
+    if not await delete_file(asset.s3_key):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete file from S3"
@@ -216,12 +741,13 @@ async def delete_asset(
     try:
         dynamodb_success = await delete_asset_metadata(str(current_user.id), str(asset_id))
         if not dynamodb_success:
-            logger.error(f"DynamoDB 삭제 실패 - asset_id: {asset_id}, user_id: {current_user.id}")
+            logger.error("DynamoDB 삭제 실패 - asset_id: %s, user_id: %s", asset_id, current_user.id)
         else:
-            logger.info(f"DynamoDB 삭제 성공 - asset_id: {asset_id}, user_id: {current_user.id}")
+            logger.info("DynamoDB 삭제 성공 - asset_id: %s, user_id: %s", asset_id, current_user.id)
     except Exception as e:
-        logger.error(f"DynamoDB 삭제 중 예외 발생 - asset_id: {asset_id}, error: {str(e)}")
+        logger.error("DynamoDB 삭제 중 예외 발생 - asset_id: %s, error: %s", asset_id, e)
     
-    # 데이터베이스에서 자산 삭제
+    # 데이터베이스에서 자산과 검색 색인 삭제
+    await search.remove_asset(db, asset.id)
     await db.delete(asset)
     await db.commit() 
\ No newline at end of file
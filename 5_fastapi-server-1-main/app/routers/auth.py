@@ -4,9 +4,10 @@ from datetime import timedelta
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, Token
-from app.utils.auth import verify_password, get_password_hash, create_access_token
+from app.utils.auth import create_access_token, user_token_claims, password_hasher, PasswordHasherBusy
 from app.config import settings
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -15,24 +16,46 @@ class LoginRequest(BaseModel):
     email: str
     password: str
 
+def _hasher_busy() -> HTTPException:
+    # 해시 대기열이 가득 찬 경우 (로그인 폭주)
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+def _email_registered() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Email already registered"
+    )
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     # 이메일 중복 확인
     result = await db.execute(select(User).where(User.email == user.email))
     if result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
+        raise _email_registered()
     
-    # 새 사용자 생성
+    # 새 사용자 생성 (해시는 프로세스 풀에서 계산)
+    # 해시를 기다리는 동안 DB 커넥션을 잡고 있지 않도록 트랜잭션을 먼저 끝냄
+    await db.commit()
+    try:
+        password_hash = await password_hasher.hash(user.password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
     db_user = User(
         email=user.email,
-        password_hash=get_password_hash(user.password),
+        password_hash=password_hash,
         name=user.name
     )
     db.add(db_user)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 해시를 계산하는 동안 같은 이메일로 가입한 요청이 먼저 저장된 경우 (users.email 유니크 제약)
+        await db.rollback()
+        raise _email_registered()
     await db.refresh(db_user)
     
     return db_user
@@ -42,17 +65,31 @@ async def login(request: LoginRequest, db: AsyncSession = Depends(get_db)):
     # 사용자 찾기
     result = await db.execute(select(User).where(User.email == request.email))
     user = result.scalar_one_or_none()
-    if not user or not verify_password(request.password, user.password_hash):
+    valid, new_hash = False, None
+    if user:
+        # 해시를 기다리는 동안 DB 커넥션을 잡고 있지 않도록 트랜잭션을 먼저 끝냄
+        await db.commit()
+        try:
+            valid, new_hash = await password_hasher.verify(request.password, user.password_hash)
+        except PasswordHasherBusy:
+            raise _hasher_busy()
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    # bcrypt 비용이 바뀌었으면 새 비용으로 다시 해시해 저장
+    # 비밀번호는 그대로이므로 password_version은 올리지 않음 (다른 토큰 유지)
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
     
     # 액세스 토큰 생성
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": str(user.id)},  # BIGINT를 문자열로 변환
+        data=user_token_claims(user),
         expires_delta=access_token_expires
     )
     
@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, literal
 from app.database import get_db
 from app.models.folder import Folder
 from app.schemas.folder import FolderCreate, FolderResponse, FolderTreeResponse
 from app.dependencies import get_current_user
 from app.models.user import User
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
+from collections import defaultdict
 
 router = APIRouter()
 
@@ -52,34 +53,99 @@ async def get_folders(
     )
     return result.scalars().all()
 
+# 트리 응답의 최대 단계 수. 중첩된 FolderTreeResponse는 약 255단계를 넘으면 응답 검증에 실패하므로 여유를 두고 제한
+MAX_TREE_DEPTH = 200
+
+# 트리 응답에 필요한 컬럼만 조회 (ORM 객체를 만들지 않음)
+_TREE_COLUMNS = (
+    Folder.id, Folder.name, Folder.parent_id, Folder.user_id, Folder.created_at, Folder.updated_at
+)
+
+def _build_tree(rows, root_ids: Optional[set], depth: int) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    폴더 행 목록을 부모 -> 자식 맵으로 묶어 O(n)에 트리를 만듭니다.
+    root_ids가 없으면 parent_id가 없는 폴더가 루트이고, 루트 아래 depth 단계까지만 포함합니다.
+    깊은 트리에서도 재귀 호출이 없도록 단계별로 연결합니다.
+    반환: (루트 목록, depth보다 깊은 폴더가 있는지)
+    """
+    roots = []
+    children = defaultdict(list)
+    for row in rows:
+        node = {**row._mapping, "children": []}
+        if (node["id"] in root_ids) if root_ids else node["parent_id"] is None:
+            roots.append(node)
+        else:
+            children[node["parent_id"]].append(node)
+
+    level, frontier = 0, roots
+    while frontier and level < depth:
+        next_frontier = []
+        for node in frontier:
+            node["children"] = children.get(node["id"], [])
+            next_frontier.extend(node["children"])
+        level, frontier = level + 1, next_frontier
+    return roots, any(node["id"] in children for node in frontier)
+
+def _tree_too_deep() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Folder tree is deeper than {MAX_TREE_DEPTH} levels; use depth or root_id"
+    )
+
 @router.get("/tree", response_model=List[FolderTreeResponse])
 async def get_folder_tree(
+    root_id: Optional[int] = None,
+    depth: Optional[int] = Query(None, ge=0, le=MAX_TREE_DEPTH),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    # 루트 폴더들 가져오기
-    result = await db.execute(
-        select(Folder).where(
-            Folder.user_id == current_user.id,
-            Folder.parent_id == None
-        )
-    )
-    root_folders = result.scalars().all()
-    
-    # 전체 폴더 트리 구성
-    async def build_tree(folder):
+    """
+    폴더 트리를 쿼리 한 번으로 조회합니다.
+    - root_id가 없으면 사용자의 모든 폴더를 조회해 루트 폴더별 트리를 반환
+    - root_id가 있으면 재귀 CTE로 그 폴더의 하위 트리만 조회
+    - depth: 루트 아래 포함할 단계 수 (0이면 루트만, 최대 MAX_TREE_DEPTH)
+    - depth 없이 조회한 트리가 MAX_TREE_DEPTH 단계보다 깊으면 400
+    """
+    max_depth = MAX_TREE_DEPTH if depth is None else depth
+    if root_id is None:
         result = await db.execute(
-            select(Folder).where(
-                Folder.parent_id == folder.id,
-                Folder.user_id == current_user.id
-            )
+            select(*_TREE_COLUMNS)
+            .where(Folder.user_id == current_user.id)
+            .order_by(Folder.id)
         )
-        children = result.scalars().all()
-        folder_dict = FolderTreeResponse.from_orm(folder)
-        folder_dict.children = [await build_tree(child) for child in children]
-        return folder_dict
+        tree, deeper = _build_tree(result.all(), None, max_depth)
+        if deeper and depth is None:
+            raise _tree_too_deep()
+        return tree
 
-    return [await build_tree(folder) for folder in root_folders]
+    # 재귀 CTE: 루트에서 시작해 자식 폴더를 단계별로 추가
+    # depth가 없으면 최대 단계보다 한 단계 더 읽어 너무 깊은 트리인지 확인
+    read_depth = max_depth if depth is not None else MAX_TREE_DEPTH + 1
+    subtree = (
+        select(Folder.id, literal(0).label("level"))
+        .where(Folder.id == root_id, Folder.user_id == current_user.id)
+        .cte("subtree", recursive=True)
+    )
+    child = select(Folder.id, (subtree.c.level + 1).label("level")).join(
+        subtree, Folder.parent_id == subtree.c.id
+    ).where(Folder.user_id == current_user.id, subtree.c.level < read_depth)
+    subtree = subtree.union_all(child)
+
+    result = await db.execute(
+        select(*_TREE_COLUMNS)
+        .join(subtree, Folder.id == subtree.c.id)
+        .order_by(Folder.id)
+    )
+    rows = result.all()
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Folder not found"
+        )
+    tree, deeper = _build_tree(rows, {root_id}, max_depth)
+    if deeper and depth is None:
+        raise _tree_too_deep()
+    return tree
 
 @router.delete("/{folder_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_folder(
@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Literal, Optional, List
 
 class TagBase(BaseModel):
     name: str
@@ -30,10 +30,60 @@ class AssetResponse(AssetBase):
     id: int
     mime_type: str
     size: int
-    file_url: str  # S3 URL
+    file_url: Optional[str] = None  # S3 presigned URL (include_url=false이면 생략)
     created_at: datetime
     updated_at: datetime
     tags: List[TagResponse] = []
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+class AssetURLResponse(BaseModel):
+    id: int
+    file_url: str
+    expires_in: int
+
+class AssetSearchHit(AssetResponse):
+    score: int  # 일치한 단어의 가중치 합 (이름 4, 태그 2, 설명 1, 접두어 검색은 가장 높은 가중치)
+
+class TagFacet(BaseModel):
+    name: str
+    count: int
+
+class AssetSearchResponse(BaseModel):
+    items: List[AssetSearchHit]
+    total: Optional[int] = None  # 첫 페이지(cursor 없음)에서만 계산
+    tag_facets: List[TagFacet] = []
+
+# 클라이언트가 S3에 직접 업로드하는 흐름
+# put: presigned PUT URL, post: presigned POST 폼, multipart: 파트별 presigned URL
+UploadMethod = Literal["put", "post", "multipart"]
+
+class AssetUploadRequest(BaseModel):
+    filename: str
+    content_type: Optional[str] = None
+    size: int = Field(..., gt=0, le=5 * 1024 ** 4)  # S3 객체 최대 크기 5TiB
+    method: Optional[UploadMethod] = None  # 지정하지 않으면 크기에 따라 put 또는 multipart
+
+class AssetUploadPartURL(BaseModel):
+    part_number: int
+    url: str
+
+class AssetUploadResponse(BaseModel):
+    s3_key: str
+    method: UploadMethod
+    expires_in: int
+    url: Optional[str] = None  # put, post
+    fields: Optional[Dict[str, str]] = None  # post 폼 필드
+    upload_id: Optional[str] = None  # multipart
+    part_size: Optional[int] = None
+    parts: List[AssetUploadPartURL] = []
+
+class AssetUploadCompletedPart(BaseModel):
+    part_number: int
+    etag: str
+
+class AssetUploadComplete(AssetCreate):
+    s3_key: str
+    upload_id: Optional[str] = None  # multipart인 경우
+    parts: Optional[List[AssetUploadCompletedPart]] = None  # 생략하면 S3에서 업로드된 파트를 조회
@@ -1,10 +1,23 @@
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.config import settings
+import asyncio
+import hashlib
+import hmac
+import multiprocessing
+import time
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 최소/최대 rounds를 설정 값으로 고정해, 비용이 다른 기존 해시는 로그인 시 다시 해시하도록 함
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.AUTH_BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.AUTH_BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.AUTH_BCRYPT_ROUNDS
+)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -12,6 +25,118 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and return a new hash when the stored one uses outdated cost parameters
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+class PasswordHasherBusy(Exception):
+    """해시 대기열이 가득 차서 요청을 받을 수 없음"""
+
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 전용 프로세스 풀에서 실행하는 서비스
+
+    bcrypt는 CPU를 오래 쓰므로 이벤트 루프나 스레드(GIL)에서 실행하면 다른 요청이 멈춥니다.
+    - 동시에 실행하는 해시는 AUTH_HASH_WORKERS개 (프로세스 수)
+    - 실행 대기는 AUTH_HASH_QUEUE_SIZE개까지만 받고, 넘으면 PasswordHasherBusy를 발생 (503 응답)
+    - 프로세스 풀은 처음 사용할 때 만들고, shutdown()으로 종료
+    """
+
+    def __init__(self, workers: int, queue_size: int):
+        self._workers = max(workers, 1)
+        self._limit = self._workers + max(queue_size, 0)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        self._counters = {
+            'hashed': 0,
+            'verified': 0,
+            'rehashed': 0,
+            'rejected': 0,
+        }
+        self._max_latency = 0.0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # 서버 프로세스의 스레드(boto3 풀 등)를 물려받지 않도록 fork 대신 spawn 사용
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    async def _submit(self, func, *args):
+        if self._in_flight >= self._limit:
+            self._counters['rejected'] += 1
+            raise PasswordHasherBusy()
+        self._in_flight += 1
+        start = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_pool(), func, *args)
+        finally:
+            self._in_flight -= 1
+            self._max_latency = max(self._max_latency, time.perf_counter() - start)
+
+    async def hash(self, password: str) -> str:
+        password_hash = await self._submit(get_password_hash, password)
+        self._counters['hashed'] += 1
+        return password_hash
+
+    async def verify(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password; the second value is a new hash when the stored one should be upgraded
+        """
+        valid, new_hash = await self._submit(verify_and_update_password, password, password_hash)
+        self._counters['verified'] += 1
+        if new_hash:
+            self._counters['rehashed'] += 1
+        return valid, new_hash
+
+    def warm_up(self) -> None:
+        """
+        Start the worker processes ahead of the first login
+        """
+        pool = self._get_pool()
+        for _ in range(self._workers):
+            pool.submit(time.sleep, 0)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            'workers': self._workers,
+            'in_flight': self._in_flight,
+            'max_in_flight': self._limit,
+            **self._counters,
+            'max_latency_seconds': round(self._max_latency, 4),
+        }
+
+password_hasher = PasswordHasher(settings.AUTH_HASH_WORKERS, settings.AUTH_HASH_QUEUE_SIZE)
+
+def password_fingerprint(user) -> str:
+    """
+    Short keyed digest of the user's password version, stored in tokens so a password change revokes them.
+    Derived from password_version rather than the hash, so rehashing with a new bcrypt cost keeps tokens valid
+    """
+    message = f"{user.id}:{user.password_version or 1}".encode()
+    digest = hmac.new(settings.JWT_SECRET_KEY.encode(), message, hashlib.sha256)
+    return digest.hexdigest()[:16]
+
+def user_token_claims(user) -> Dict[str, Any]:
+    """
+    Claims for a user's access token: sub, the password fingerprint (pwv) and the profile used in stateless mode
+    """
+    return {
+        "sub": str(user.id),  # BIGINT를 문자열로 변환
+        "pwv": password_fingerprint(user),
+        "email": user.email,
+        "name": user.name,
+    }
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
@@ -26,16 +151,19 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     )
     return encoded_jwt
 
-def decode_access_token(token: str) -> Optional[str]:
+def decode_access_token_claims(token: str) -> Optional[Dict[str, Any]]:
     try:
         payload = jwt.decode(
             token, 
             settings.JWT_SECRET_KEY, 
             algorithms=[settings.JWT_ALGORITHM]
         )
-        user_id: str = payload.get("sub")
-        if user_id is None:
+        if payload.get("sub") is None:
             return None
-        return user_id
+        return payload
     except JWTError:
-        return None 
\ No newline at end of file
+        return None
+
+def decode_access_token(token: str) -> Optional[str]:
+    payload = decode_access_token_claims(token)
+    return payload["sub"] if payload else None 
\ No newline at end of file
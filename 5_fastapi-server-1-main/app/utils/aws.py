@@ -0,0 +1,97 @@
+import boto3
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict
+from app.config import settings
+from app.utils.metrics import instrument_boto3_client
+import asyncio
+import threading
+
+# 프로세스 전체에서 공유하는 AWS 클라이언트와 서비스별 스레드 풀
+# boto3 클라이언트는 스레드 안전하지만 생성 비용(자격 증명, 엔드포인트 설정, 커넥션 풀)이 크므로
+# 서비스마다 한 번만 만들어 재사용합니다.
+
+_session = boto3.session.Session(
+    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+    region_name=settings.AWS_REGION
+)
+
+client_config = Config(
+    max_pool_connections=settings.AWS_MAX_POOL_CONNECTIONS,
+    connect_timeout=settings.AWS_CONNECT_TIMEOUT,
+    read_timeout=settings.AWS_READ_TIMEOUT,
+    tcp_keepalive=True,
+    retries={
+        'max_attempts': settings.AWS_MAX_ATTEMPTS,
+        'mode': settings.AWS_RETRY_MODE
+    }
+)
+
+_endpoint_urls = {
+    's3': settings.S3_ENDPOINT_URL,
+    'dynamodb': settings.DYNAMODB_ENDPOINT_URL,
+}
+
+_clients: Dict[str, Any] = {}
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+
+def get_client(service_name: str):
+    """
+    Return the shared boto3 client for a service, creating it on first use
+    """
+    client = _clients.get(service_name)
+    if client is None:
+        # Session은 스레드 안전하지 않으므로 생성은 잠금 안에서만 합니다.
+        with _lock:
+            client = _clients.get(service_name)
+            if client is None:
+                client = _session.client(
+                    service_name,
+                    config=client_config,
+                    endpoint_url=_endpoint_urls.get(service_name)
+                )
+                if settings.METRICS_ENABLED:
+                    # 호출별 지연 시간(재시도 포함)과 오류를 /metrics로 노출
+                    instrument_boto3_client(client, service_name)
+                _clients[service_name] = client
+    return client
+
+def get_credentials():
+    """
+    Return the session's current (frozen) credentials, refreshing them if they are about to expire
+    """
+    credentials = _session.get_credentials()
+    return credentials.get_frozen_credentials() if credentials is not None else None
+
+def get_executor(service_name: str) -> ThreadPoolExecutor:
+    """
+    Return the bounded thread pool used for blocking calls to a service
+    """
+    executor = _executors.get(service_name)
+    if executor is None:
+        with _lock:
+            executor = _executors.get(service_name)
+            if executor is None:
+                # 커넥션 풀보다 스레드가 많으면 나머지는 커넥션을 기다리기만 하므로 풀 크기로 제한
+                executor = ThreadPoolExecutor(
+                    max_workers=min(settings.AWS_EXECUTOR_WORKERS, settings.AWS_MAX_POOL_CONNECTIONS),
+                    thread_name_prefix=f"aws-{service_name}"
+                )
+                _executors[service_name] = executor
+    return executor
+
+async def run_in_executor(service_name: str, func: Callable, *args, **kwargs):
+    """
+    Run a blocking boto3 call in the service's thread pool
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(service_name), partial(func, *args, **kwargs))
+
+def shutdown_executors() -> None:
+    with _lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=True)
+        _executors.clear()
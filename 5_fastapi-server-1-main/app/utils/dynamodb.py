@@ -1,24 +1,50 @@
-import boto3
 from botocore.exceptions import ClientError
 from app.config import settings
-from typing import Dict, Any, Optional, List
+from app.utils.aws import get_client, run_in_executor
+from typing import Dict, Any, Iterable, Optional, List, Tuple
+from collections import OrderedDict, deque
 from datetime import datetime
-import json
-import logging
 import asyncio
+import logging
+import random
+import time
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# 테이블 존재 확인은 프로세스당 한 번만 수행 (앱 시작 시 또는 첫 저장 시)
+_table_checked = False
+
+# 사용자별 최신순 목록 조회용 GSI (파티션 키 user_id, 정렬 키 created_at, dynamodb_setup.py에서 생성)
+USER_CREATED_AT_INDEX = 'UserCreatedAtIndex'
+
 def get_dynamodb_client():
-    """DynamoDB 클라이언트 생성"""
-    return boto3.client(
-        'dynamodb',
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_REGION
-    )
+    """공유 DynamoDB 클라이언트 반환"""
+    return get_client('dynamodb')
+
+def _check_table_sync() -> bool:
+    """테이블 존재 여부 확인 (동기 버전, 성공하면 결과를 캐시)"""
+    global _table_checked
+    if _table_checked:
+        return True
+    try:
+        get_dynamodb_client().describe_table(TableName=settings.DYNAMODB_TABLE_NAME)
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceNotFoundException':
+            logger.error("DynamoDB 테이블 '%s'이 존재하지 않습니다.", settings.DYNAMODB_TABLE_NAME)
+            return False
+        raise
+    _table_checked = True
+    return True
+
+async def check_table() -> bool:
+    """DynamoDB 테이블 존재 여부 확인 (앱 시작 시 호출)"""
+    try:
+        return await run_in_executor('dynamodb', _check_table_sync)
+    except Exception as e:
+        logger.error("DynamoDB 테이블 확인 중 오류 발생: %s", e)
+        return False
 
 async def put_asset_metadata(
     user_id: str,
@@ -29,18 +55,75 @@ async def put_asset_metadata(
     size: int,
     s3_key: str,
     folder_id: Optional[str],
-    tags: List[Dict[str, Any]]
+    tags: List[Dict[str, Any]],
+    checksum: Optional[str] = None,
+    created_at: Optional[datetime] = None
 ) -> bool:
-    """자산 메타데이터를 DynamoDB에 저장"""
+    """
+    자산 메타데이터를 DynamoDB에 저장
+    쓰기 지연 큐가 실행 중이면 큐에 넣고 바로 반환하며, 실제 저장은 BatchWriteItem으로 묶어서 처리
+    """
+    if metadata_writer.running:
+        item = _build_item(user_id, asset_id, name, description, mime_type, size, s3_key, folder_id, tags, checksum, created_at)
+        await metadata_writer.put(item)
+        return True
     try:
-        # 비동기 처리를 위해 executor 사용
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _put_asset_metadata_sync, 
-                                        user_id, asset_id, name, description, 
-                                        mime_type, size, s3_key, folder_id, tags)
+        # DynamoDB 전용 스레드 풀에서 실행
+        item = _build_item(user_id, asset_id, name, description, mime_type, size, s3_key, folder_id, tags, checksum, created_at)
+        saved = await run_in_executor('dynamodb', _put_item_sync, item)
     except Exception as e:
-        logger.error(f"DynamoDB 비동기 저장 중 오류 발생: {str(e)}")
+        logger.error("DynamoDB 비동기 저장 중 오류 발생: %s", e)
         return False
+    if saved:
+        # GSI는 비동기로 반영되므로 잠시 동안 목록 조회에 저장 내용을 겹쳐 보여줌
+        metadata_writer.remember({'PutRequest': {'Item': item}})
+    return saved
+
+def _build_item(
+    user_id: str,
+    asset_id: str,
+    name: str,
+    description: Optional[str],
+    mime_type: str,
+    size: int,
+    s3_key: str,
+    folder_id: Optional[str],
+    tags: List[Dict[str, Any]],
+    checksum: Optional[str] = None,
+    created_at: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    DynamoDB 저장 형식의 메타데이터 항목 생성
+    created_at은 RDS 자산의 created_at을 사용 (두 목록 경로의 값과 순서가 같도록). 없으면 현재 UTC 시각
+    """
+    item = {
+        'user_id': {'S': str(user_id)},
+        'asset_id': {'S': str(asset_id)},
+        'name': {'S': name},
+        'mime_type': {'S': mime_type},
+        'size': {'N': str(size)},
+        's3_key': {'S': s3_key},
+        'created_at': {'S': (created_at or datetime.utcnow()).isoformat()}
+    }
+
+    if description:
+        item['description'] = {'S': description}
+    if folder_id:
+        item['folder_id'] = {'S': str(folder_id)}
+    if checksum:
+        item['checksum_sha256'] = {'S': checksum}
+    if tags:
+        item['tags'] = {'L': [{'M': _build_tag(tag)} for tag in tags]}
+    return item
+
+def _build_tag(tag: Dict[str, Any]) -> Dict[str, Any]:
+    value = {
+        'id': {'S': str(tag['id'])},
+        'name': {'S': tag['name']}
+    }
+    if tag.get('created_at'):
+        value['created_at'] = {'S': tag['created_at'].isoformat()}
+    return value
 
 def _put_asset_metadata_sync(
     user_id: str,
@@ -51,81 +134,78 @@ def _put_asset_metadata_sync(
     size: int,
     s3_key: str,
     folder_id: Optional[str],
-    tags: List[Dict[str, Any]]
+    tags: List[Dict[str, Any]],
+    checksum: Optional[str] = None,
+    created_at: Optional[datetime] = None
 ) -> bool:
     """자산 메타데이터를 DynamoDB에 저장 (동기 버전)"""
+    item = _build_item(user_id, asset_id, name, description, mime_type, size, s3_key, folder_id, tags, checksum, created_at)
+    return _put_item_sync(item)
+
+def _put_item_sync(item: Dict[str, Any]) -> bool:
+    """메타데이터 항목을 조건부 put_item으로 저장 (동기 버전)"""
+    user_id = item['user_id']['S']
+    asset_id = item['asset_id']['S']
     try:
         dynamodb = get_dynamodb_client()
-        created_at = datetime.utcnow().isoformat()
+        logger.debug("DynamoDB에 저장할 데이터: %s", item)
 
-        item = {
-            'user_id': {'S': str(user_id)},
-            'asset_id': {'S': str(asset_id)},
-            'name': {'S': name},
-            'mime_type': {'S': mime_type},
-            'size': {'N': str(size)},
-            's3_key': {'S': s3_key},
-            'created_at': {'S': created_at}
-        }
-
-        if description:
-            item['description'] = {'S': description}
-        if folder_id:
-            item['folder_id'] = {'S': str(folder_id)}
-        if tags:
-            item['tags'] = {'L': [{'M': {
-                'id': {'S': str(tag['id'])},
-                'name': {'S': tag['name']}
-            }} for tag in tags]}
+        # 테이블 존재 확인 (이미 확인했으면 요청 없음)
+        if not _check_table_sync():
+            return False
 
-        # 저장할 데이터 로깅
-        logger.info(f"DynamoDB에 저장할 데이터: {json.dumps(item, indent=2, ensure_ascii=False)}")
-
-        # 테이블 존재 확인
-        try:
-            dynamodb.describe_table(TableName=settings.DYNAMODB_TABLE_NAME)
-        except ClientError as e:
-            if e.response['Error']['Code'] == 'ResourceNotFoundException':
-                logger.error(f"DynamoDB 테이블 '{settings.DYNAMODB_TABLE_NAME}'이 존재하지 않습니다.")
-                return False
-            raise
-
-        # 데이터 저장
+        # 데이터 저장. 같은 키의 항목이 이미 있으면 덮어쓰지 않고 실패
         response = dynamodb.put_item(
             TableName=settings.DYNAMODB_TABLE_NAME,
             Item=item,
+            ConditionExpression='attribute_not_exists(asset_id)',
             ReturnConsumedCapacity='TOTAL'
         )
 
         # 저장 성공 로깅
-        logger.info(f"DynamoDB 데이터 저장 성공 - 테이블: {settings.DYNAMODB_TABLE_NAME}, user_id: {user_id}, asset_id: {asset_id}")
-        logger.info(f"DynamoDB 응답: {response}")
+        logger.info("DynamoDB 데이터 저장 성공 - 테이블: %s, user_id: %s, asset_id: %s", settings.DYNAMODB_TABLE_NAME, user_id, asset_id)
+        logger.debug("DynamoDB 소비 용량: %s", response.get('ConsumedCapacity'))
 
-        # 저장된 데이터 확인
-        saved_item = _get_asset_metadata_sync(user_id, asset_id)
-        if saved_item:
-            logger.info(f"DynamoDB에서 확인된 저장 데이터: {json.dumps(saved_item, indent=2, ensure_ascii=False)}")
-        else:
-            logger.warning(f"DynamoDB 데이터 저장 확인 실패 - user_id: {user_id}, asset_id: {asset_id}")
+        # 저장된 데이터 확인 (디버그용, DYNAMODB_VERIFY_WRITES=true일 때만)
+        if settings.DYNAMODB_VERIFY_WRITES:
+            saved_item = _get_asset_metadata_sync(user_id, asset_id)
+            if saved_item:
+                logger.info("DynamoDB에서 확인된 저장 데이터: %s", saved_item)
+            else:
+                logger.warning("DynamoDB 데이터 저장 확인 실패 - user_id: %s, asset_id: %s", user_id, asset_id)
 
         return True
     except ClientError as e:
-        logger.error(f"DynamoDB 저장 중 ClientError 발생: {str(e)}")
-        logger.error(f"Error Code: {e.response['Error']['Code']}")
-        logger.error(f"Error Message: {e.response['Error']['Message']}")
+        if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+            logger.error("DynamoDB에 같은 자산 메타데이터가 이미 있습니다 - user_id: %s, asset_id: %s", user_id, asset_id)
+            return False
+        logger.error("DynamoDB 저장 중 ClientError 발생: %s", e)
+        logger.error("Error Code: %s", e.response['Error']['Code'])
+        logger.error("Error Message: %s", e.response['Error']['Message'])
         return False
     except Exception as e:
-        logger.error(f"DynamoDB 저장 중 예외 발생: {str(e)}")
+        logger.error("DynamoDB 저장 중 예외 발생: %s", e)
         return False
 
 async def delete_asset_metadata(user_id: str, asset_id: str) -> bool:
-    """자산 메타데이터를 DynamoDB에서 삭제"""
+    """자산 메타데이터를 DynamoDB에서 삭제 (쓰기 지연 큐가 실행 중이면 큐에 넣고 바로 반환)"""
+    if metadata_writer.running:
+        await metadata_writer.delete({
+            'user_id': {'S': str(user_id)},
+            'asset_id': {'S': str(asset_id)}
+        })
+        return True
     try:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _delete_asset_metadata_sync, user_id, asset_id)
+        deleted = await run_in_executor('dynamodb', _delete_asset_metadata_sync, user_id, asset_id)
     except Exception as e:
-        logger.error(f"DynamoDB 비동기 삭제 중 오류 발생: {str(e)}")
+        logger.error("DynamoDB 비동기 삭제 중 오류 발생: %s", e)
         return False
+    if deleted:
+        metadata_writer.remember({'DeleteRequest': {'Key': {
+            'user_id': {'S': str(user_id)},
+            'asset_id': {'S': str(asset_id)}
+        }}})
+    return deleted
 
 def _delete_asset_metadata_sync(user_id: str, asset_id: str) -> bool:
     """자산 메타데이터를 DynamoDB에서 삭제 (동기 버전)"""
@@ -139,20 +219,23 @@ def _delete_asset_metadata_sync(user_id: str, asset_id: str) -> bool:
             },
             ReturnConsumedCapacity='TOTAL'
         )
-        logger.info(f"DynamoDB 데이터 삭제 성공 - user_id: {user_id}, asset_id: {asset_id}")
-        logger.info(f"DynamoDB 삭제 응답: {response}")
+        logger.info("DynamoDB 데이터 삭제 성공 - user_id: %s, asset_id: %s", user_id, asset_id)
+        logger.debug("DynamoDB 삭제 응답: %s", response)
         return True
     except ClientError as e:
-        logger.error(f"DynamoDB 삭제 중 오류 발생: {str(e)}")
+        logger.error("DynamoDB 삭제 중 오류 발생: %s", e)
         return False
 
 async def get_asset_metadata(user_id: str, asset_id: str) -> Optional[Dict[str, Any]]:
     """자산 메타데이터를 DynamoDB에서 조회"""
+    # 아직 저장되지 않은 요청이 큐에 있으면 그 내용을 반환
+    pending = metadata_writer.pending(str(user_id), str(asset_id))
+    if pending is not None:
+        return _parse_item(pending['PutRequest']['Item']) if 'PutRequest' in pending else None
     try:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _get_asset_metadata_sync, user_id, asset_id)
+        return await run_in_executor('dynamodb', _get_asset_metadata_sync, user_id, asset_id)
     except Exception as e:
-        logger.error(f"DynamoDB 비동기 조회 중 오류 발생: {str(e)}")
+        logger.error("DynamoDB 비동기 조회 중 오류 발생: %s", e)
         return None
 
 def _get_asset_metadata_sync(user_id: str, asset_id: str) -> Optional[Dict[str, Any]]:
@@ -169,29 +252,348 @@ def _get_asset_metadata_sync(user_id: str, asset_id: str) -> Optional[Dict[str,
         
         if 'Item' not in response:
             return None
+        return _parse_item(response['Item'])
+    except ClientError as e:
+        logger.error("DynamoDB 조회 중 오류 발생: %s", e)
+        return None
 
-        item = response['Item']
-        result = {
-            'user_id': item['user_id']['S'],
-            'asset_id': item['asset_id']['S'],
-            'name': item['name']['S'],
-            'mime_type': item['mime_type']['S'],
-            'size': int(item['size']['N']),
-            's3_key': item['s3_key']['S'],
-            'created_at': item['created_at']['S']
-        }
-
-        if 'description' in item:
-            result['description'] = item['description']['S']
-        if 'folder_id' in item:
-            result['folder_id'] = item['folder_id']['S']
-        if 'tags' in item:
-            result['tags'] = [{
+def _parse_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """DynamoDB 항목을 일반 dict로 변환 (ProjectionExpression으로 읽지 않은 속성은 빠짐)"""
+    result = {
+        name: item[name]['S']
+        for name in ('user_id', 'asset_id', 'name', 'mime_type', 's3_key', 'created_at',
+                     'description', 'folder_id', 'checksum_sha256')
+        if name in item
+    }
+    if 'size' in item:
+        result['size'] = int(item['size']['N'])
+    if 'tags' in item:
+        result['tags'] = []
+        for tag in item['tags']['L']:
+            value = {
                 'id': tag['M']['id']['S'],
                 'name': tag['M']['name']['S']
-            } for tag in item['tags']['L']]
+            }
+            # 태그 생성 시각은 이후 저장된 항목에만 있음
+            if 'created_at' in tag['M']:
+                value['created_at'] = tag['M']['created_at']['S']
+            result['tags'].append(value)
 
-        return result
-    except ClientError as e:
-        logger.error(f"DynamoDB 조회 중 오류 발생: {str(e)}")
-        return None 
\ No newline at end of file
+    return result
+
+def _position(item: Dict[str, Any]) -> Tuple[str, str]:
+    """UserCreatedAtIndex에서의 항목 순서 (created_at, asset_id)"""
+    return item['created_at'], item['asset_id']
+
+async def list_asset_metadata(
+    user_id: str,
+    limit: int,
+    after: Optional[Tuple[str, str]] = None,
+    attributes: Optional[Iterable[str]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, str]]]:
+    """
+    사용자의 자산 메타데이터를 최신순으로 한 페이지 조회 (UserCreatedAtIndex Query)
+
+    - after: 이전 페이지 마지막 항목의 (created_at, asset_id). ExclusiveStartKey로 이어서 조회
+    - attributes: 읽을 속성 (ProjectionExpression, asset_id와 created_at은 항상 포함)
+    - 반환: (항목 목록, 다음 페이지가 있으면 이 페이지 마지막 항목의 위치)
+    쓰기 지연 큐에 있거나 방금 저장되어 GSI에 아직 반영되지 않았을 수 있는 요청은 목록에 겹쳐 적용합니다.
+    (put은 추가/교체, delete는 제외) 조회 오류는 호출한 쪽에서 처리하도록 그대로 전달합니다.
+    """
+    # 한 건 더 읽어서 다음 페이지가 있는지 확인
+    items, more = await run_in_executor(
+        'dynamodb', _query_user_assets_sync, str(user_id), limit + 1, after, attributes
+    )
+    # 다음 페이지가 남았으면 이번에 읽은 범위는 마지막 항목까지
+    lower = _position(items[-1]) if more and items else None
+
+    overlay = metadata_writer.user_requests(str(user_id))
+    if overlay:
+        items = [item for item in items if item['asset_id'] not in overlay]
+        for request in overlay.values():
+            if 'PutRequest' not in request:
+                continue
+            item = _parse_item(request['PutRequest']['Item'])
+            position = _position(item)
+            # 이번 페이지 범위에 들어가는 항목만 추가 (범위 밖은 앞/뒤 페이지에서 추가됨)
+            if (after is None or position < after) and (lower is None or position > lower):
+                items.append(item)
+        items.sort(key=_position, reverse=True)
+
+    if len(items) > limit or more:
+        items = items[:limit]
+        return items, _position(items[-1]) if items else lower
+    return items, None
+
+def _query_user_assets_sync(
+    user_id: str,
+    limit: int,
+    after: Optional[Tuple[str, str]],
+    attributes: Optional[Iterable[str]]
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """UserCreatedAtIndex를 created_at 내림차순으로 Query (동기 버전)"""
+    params = {
+        'TableName': settings.DYNAMODB_TABLE_NAME,
+        'IndexName': USER_CREATED_AT_INDEX,
+        'KeyConditionExpression': '#user_id = :user_id',
+        'ExpressionAttributeNames': {'#user_id': 'user_id'},
+        'ExpressionAttributeValues': {':user_id': {'S': user_id}},
+        'ScanIndexForward': False,
+        'Limit': limit
+    }
+    if attributes is not None:
+        # name, size 등은 예약어이므로 모두 속성 이름 자리 표시자로 지정
+        names = sorted({'asset_id', 'created_at', *attributes})
+        params['ProjectionExpression'] = ', '.join(f'#{name}' for name in names)
+        params['ExpressionAttributeNames'].update({f'#{name}': name for name in names})
+    if after is not None:
+        # GSI의 ExclusiveStartKey는 인덱스 키와 테이블 기본 키를 모두 포함
+        created_at, asset_id = after
+        params['ExclusiveStartKey'] = {
+            'user_id': {'S': user_id},
+            'asset_id': {'S': asset_id},
+            'created_at': {'S': created_at}
+        }
+    response = get_dynamodb_client().query(**params)
+    return [_parse_item(item) for item in response.get('Items', [])], 'LastEvaluatedKey' in response
+
+
+class MetadataWriter:
+    """
+    메타데이터 쓰기 지연(write-behind) 큐
+
+    put/delete 요청을 키(user_id, asset_id)별로 모아 두었다가 BatchWriteItem(최대 25개)으로 저장합니다.
+    - 대기 항목이 배치 크기만큼 쌓이거나 DYNAMODB_FLUSH_INTERVAL이 지나면 저장
+    - 같은 키에 대한 요청은 마지막 요청 하나로 합침 (BatchWriteItem은 한 요청에 같은 키를 허용하지 않음)
+    - UnprocessedItems는 지수 백오프(지터 포함)로 다시 보내고, 재시도를 다 쓰면 오류 로그를 남김
+    - 대기 항목이 DYNAMODB_WRITE_QUEUE_SIZE에 도달하면 put/delete가 자리가 날 때까지 대기 (백프레셔)
+    - close()는 남은 항목을 모두 저장한 뒤 종료
+
+    BatchWriteItem은 조건식을 지원하지 않으므로 큐를 거친 put은 같은 키의 항목을 덮어씁니다.
+
+    저장한 요청은 GSI(UserCreatedAtIndex)에 반영될 때까지 DYNAMODB_READ_MODEL_GRACE초 동안 기억해 두고,
+    목록 조회(list_asset_metadata)가 대기 중인 요청과 함께 결과에 겹쳐 적용합니다.
+    """
+
+    def __init__(self):
+        self._pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Condition] = None
+        self._closing = False
+        self._in_flight: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # 최근 저장한 요청: 키 -> (요청, 기억할 기한), 저장 순서대로
+        self._recent: 'OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], float]]' = OrderedDict()
+        # 지표
+        self._flush_latencies = deque(maxlen=1000)
+        self._counters = {
+            'enqueued': 0,
+            'coalesced': 0,
+            'written': 0,
+            'failed': 0,
+            'batches': 0,
+            'unprocessed_retries': 0,
+            'backpressure_waits': 0,
+        }
+        self._backpressure_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._closing
+
+    def start(self) -> None:
+        """현재 이벤트 루프에서 백그라운드 저장 작업 시작 (앱 시작 시 호출)"""
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Condition()
+        self._closing = False
+        self._task = asyncio.create_task(self._run(), name="dynamodb-metadata-writer")
+        logger.info(
+            "DynamoDB 쓰기 지연 큐 시작 - 배치 %s개, 간격 %ss, 큐 크기 %s",
+            self._batch_size, settings.DYNAMODB_FLUSH_INTERVAL, settings.DYNAMODB_WRITE_QUEUE_SIZE
+        )
+
+    async def close(self) -> None:
+        """새 요청을 막고 남은 항목을 모두 저장한 뒤 종료 (앱 종료 시 호출)"""
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        logger.info("DynamoDB 쓰기 지연 큐 종료 - %s", self.metrics())
+
+    async def put(self, item: Dict[str, Any]) -> None:
+        await self._enqueue((item['user_id']['S'], item['asset_id']['S']), {'PutRequest': {'Item': item}})
+
+    async def delete(self, key: Dict[str, Any]) -> None:
+        await self._enqueue((key['user_id']['S'], key['asset_id']['S']), {'DeleteRequest': {'Key': key}})
+
+    async def flush(self) -> None:
+        """대기 중인 항목을 바로 저장하도록 요청하고 큐가 빌 때까지 대기"""
+        if self._task is None:
+            return
+        async with self._space:
+            self._wakeup.set()
+            await self._space.wait_for(lambda: not self._pending and not self._in_flight)
+
+    def pending(self, user_id: str, asset_id: str) -> Optional[Dict[str, Any]]:
+        """아직 저장되지 않은 요청 (PutRequest 또는 DeleteRequest)"""
+        key = (user_id, asset_id)
+        return self._pending.get(key) or self._in_flight.get(key)
+
+    def remember(self, request: Dict[str, Any]) -> None:
+        """저장을 마친 요청을 DYNAMODB_READ_MODEL_GRACE초 동안 기억 (GSI 반영 지연 대비)"""
+        if settings.DYNAMODB_READ_MODEL_GRACE <= 0:
+            return
+        key = _request_key(request)
+        now = time.monotonic()
+        self._recent.pop(key, None)
+        self._recent[key] = (request, now + settings.DYNAMODB_READ_MODEL_GRACE)
+        self._expire_recent(now)
+
+    def user_requests(self, user_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        사용자의 아직 저장되지 않았거나 최근 저장한 요청 (asset_id -> PutRequest 또는 DeleteRequest)
+
+        같은 자산은 최근 저장 < 저장 중 < 대기 순서로 나중 요청을 사용합니다.
+        """
+        self._expire_recent(time.monotonic())
+        requests = {}
+        for key, (request, _) in self._recent.items():
+            if key[0] == user_id:
+                requests[key[1]] = request
+        for queue in (self._in_flight, self._pending):
+            for key, request in queue.items():
+                if key[0] == user_id:
+                    requests[key[1]] = request
+        return requests
+
+    def _expire_recent(self, now: float) -> None:
+        while self._recent:
+            key, (_, expires_at) = next(iter(self._recent.items()))
+            if expires_at > now:
+                break
+            del self._recent[key]
+
+    def metrics(self) -> Dict[str, Any]:
+        """큐 깊이, 저장 지연 시간 등 지표 스냅샷"""
+        latencies = sorted(self._flush_latencies)
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 2)
+        return {
+            'running': self.running,
+            'queue_depth': len(self._pending),
+            'in_flight': len(self._in_flight),
+            'recent': len(self._recent),
+            'queue_capacity': settings.DYNAMODB_WRITE_QUEUE_SIZE,
+            **self._counters,
+            'backpressure_seconds': round(self._backpressure_seconds, 3),
+            'flush_latency_ms': {
+                'p50': percentile(0.5),
+                'p99': percentile(0.99),
+                'max': round(latencies[-1] * 1000, 2) if latencies else None,
+            },
+        }
+
+    @property
+    def _batch_size(self) -> int:
+        return max(1, min(settings.DYNAMODB_BATCH_SIZE, 25))
+
+    async def _enqueue(self, key: Tuple[str, str], request: Dict[str, Any]) -> None:
+        async with self._space:
+            if key not in self._pending and len(self._pending) >= settings.DYNAMODB_WRITE_QUEUE_SIZE:
+                # 큐가 가득 차면 저장될 때까지 대기
+                self._counters['backpressure_waits'] += 1
+                started = time.perf_counter()
+                self._wakeup.set()
+                await self._space.wait_for(
+                    lambda: key in self._pending or len(self._pending) < settings.DYNAMODB_WRITE_QUEUE_SIZE
+                )
+                self._backpressure_seconds += time.perf_counter() - started
+            if key in self._pending:
+                # 순서를 유지하기 위해 기존 요청을 지우고 뒤에 다시 넣음
+                del self._pending[key]
+                self._counters['coalesced'] += 1
+            self._pending[key] = request
+            self._counters['enqueued'] += 1
+            if len(self._pending) >= self._batch_size:
+                self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.DYNAMODB_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            while self._pending:
+                await self._flush_pending()
+            if self._closing:
+                return
+
+    async def _flush_pending(self) -> None:
+        """대기 항목을 배치로 나눠 동시에 저장 (같은 키는 대기 목록에 하나뿐이므로 배치 간 충돌 없음)"""
+        async with self._space:
+            self._in_flight = self._pending
+            self._pending = {}
+            requests = list(self._in_flight.values())
+            self._space.notify_all()
+        batches = [requests[i:i + self._batch_size] for i in range(0, len(requests), self._batch_size)]
+        try:
+            await asyncio.gather(*(self._write_batch(batch) for batch in batches))
+        finally:
+            async with self._space:
+                self._in_flight = {}
+                self._space.notify_all()
+
+    async def _write_batch(self, requests: List[Dict[str, Any]]) -> None:
+        table = settings.DYNAMODB_TABLE_NAME
+        started = time.perf_counter()
+        unprocessed = {table: requests}
+        attempt = 0
+        while unprocessed:
+            try:
+                response = await run_in_executor(
+                    'dynamodb', get_dynamodb_client().batch_write_item, RequestItems=unprocessed
+                )
+                unprocessed = response.get('UnprocessedItems') or {}
+            except ClientError as e:
+                # botocore 재시도까지 실패한 경우 (처리량 초과 등) 배치 전체를 다시 시도
+                logger.warning("DynamoDB BatchWriteItem 오류: %s", e.response['Error']['Code'])
+            except Exception as e:
+                logger.error("DynamoDB BatchWriteItem 중 예외 발생: %s", e)
+                break
+            if not unprocessed:
+                break
+            attempt += 1
+            if attempt > settings.DYNAMODB_BATCH_MAX_RETRIES:
+                break
+            self._counters['unprocessed_retries'] += 1
+            # 지수 백오프 (전체 지터), 최대 5초
+            await asyncio.sleep(random.uniform(0, min(5.0, 0.05 * 2 ** attempt)))
+
+        failed = unprocessed.get(table, [])
+        failed_keys = {_request_key(request) for request in failed}
+        for request in requests:
+            if _request_key(request) not in failed_keys:
+                self.remember(request)
+        self._counters['batches'] += 1
+        self._counters['written'] += len(requests) - len(failed)
+        self._counters['failed'] += len(failed)
+        self._flush_latencies.append(time.perf_counter() - started)
+        for request in failed:
+            user_id, asset_id = _request_key(request)
+            kind = 'put' if 'PutRequest' in request else 'delete'
+            logger.error("DynamoDB 배치 저장 실패 (%s) - user_id: %s, asset_id: %s", kind, user_id, asset_id)
+
+def _request_key(request: Dict[str, Any]) -> Tuple[str, str]:
+    """BatchWriteItem 요청의 (user_id, asset_id)"""
+    key = request['PutRequest']['Item'] if 'PutRequest' in request else request['DeleteRequest']['Key']
+    return key['user_id']['S'], key['asset_id']['S']
+
+# 프로세스 전체에서 공유하는 쓰기 지연 큐 (app.main lifespan에서 시작/종료)
+metadata_writer = MetadataWriter()
@@ -1,15 +1,11 @@
-import boto3
 from botocore.exceptions import ClientError
 from app.config import settings
+from app.utils.aws import get_client
+from app.utils.dynamodb import USER_CREATED_AT_INDEX
 
 def create_asset_metadata_table():
     """AssetMetadata 테이블 생성"""
-    dynamodb = boto3.client(
-        'dynamodb',
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_REGION
-    )
+    dynamodb = get_client('dynamodb')
 
     table_name = settings.DYNAMODB_TABLE_NAME
 
@@ -52,7 +48,7 @@ def create_asset_metadata_table():
             ],
             GlobalSecondaryIndexes=[
                 {
-                    'IndexName': 'UserCreatedAtIndex',
+                    'IndexName': USER_CREATED_AT_INDEX,
                     'KeySchema': [
                         {
                             'AttributeName': 'user_id',
@@ -94,12 +90,7 @@ def create_asset_metadata_table():
 
 def delete_asset_metadata_table():
     """AssetMetadata 테이블 삭제 (필요한 경우)"""
-    dynamodb = boto3.client(
-        'dynamodb',
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_REGION
-    )
+    dynamodb = get_client('dynamodb')
 
     table_name = settings.DYNAMODB_TABLE_NAME
 
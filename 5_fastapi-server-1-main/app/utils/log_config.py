@@ -0,0 +1,157 @@
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+from app.config import settings
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+import time
+
+# 로깅 설정
+# 요청을 처리하는 코드는 로그 레코드를 큐에 넣기만 하고, 메시지 포맷과 출력은 별도 스레드(QueueListener)가 합니다.
+# boto3/botocore/urllib3/SQLAlchemy처럼 로그가 많은 로거는 초당 개수 제한과 샘플링을 적용합니다.
+
+# LogRecord 기본 속성 (이 밖의 속성은 extra로 넘긴 구조화 필드로 보고 JSON에 포함)
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+_counters = {
+    'dropped': 0,
+    'rate_limited': 0,
+    'sampled_out': 0,
+}
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+class JsonFormatter(logging.Formatter):
+    """
+    한 줄 JSON 로그: ts, level, logger, message와 extra 필드, 예외(exc_info)
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """
+    레코드를 포맷하지 않고 그대로 큐에 넣는 핸들러 (메시지 포맷은 리스너 스레드에서)
+
+    큐가 가득 차면 요청을 막지 않고 레코드를 버린 뒤 개수만 셉니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _counters['dropped'] += 1
+
+class RateLimitFilter(logging.Filter):
+    """
+    로거 이름별 초당 레코드 수 제한(토큰 버킷)과 샘플링. WARNING 이상은 항상 통과합니다.
+    """
+
+    def __init__(self, prefixes, rate: float, sample_rate: float):
+        super().__init__()
+        self._prefixes = tuple(prefixes)
+        self._rate = rate
+        self._sample_rate = sample_rate
+        # 로거 이름 -> (남은 토큰, 마지막 갱신 시각)
+        self._buckets: Dict[str, tuple] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not record.name.startswith(self._prefixes):
+            return True
+        if self._sample_rate < 1 and random.random() >= self._sample_rate:
+            _counters['sampled_out'] += 1
+            return False
+        if self._rate <= 0:
+            return True
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(record.name, (self._rate, now))
+        tokens = min(self._rate, tokens + (now - updated) * self._rate)
+        if tokens < 1:
+            self._buckets[record.name] = (tokens, now)
+            _counters['rate_limited'] += 1
+            return False
+        self._buckets[record.name] = (tokens - 1, now)
+        return True
+
+def parse_levels(levels: str) -> Dict[str, str]:
+    """
+    "boto3=WARNING,sqlalchemy.engine=INFO" 형식의 로거별 레벨 설정을 dict로 변환
+    """
+    result = {}
+    for item in levels.split(","):
+        if "=" in item:
+            name, level = item.split("=", 1)
+            result[name.strip()] = level.strip().upper()
+    return result
+
+def configure_logging(
+    level: Optional[str] = None,
+    levels: Optional[str] = None,
+    fmt: Optional[str] = None,
+    stream=None
+) -> None:
+    """
+    Install the queue-based root handler and per-logger levels (defaults come from Settings)
+
+    Calling it again replaces the previous configuration.
+    """
+    global _listener
+    level = (level or settings.LOG_LEVEL).upper()
+    levels = settings.LOG_LEVELS if levels is None else levels
+    fmt = fmt or settings.LOG_FORMAT
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    if fmt == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+    queue_handler = _NonBlockingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+    prefixes = [name.strip() for name in settings.LOG_RATE_LIMITED_LOGGERS.split(",") if name.strip()]
+    if prefixes:
+        queue_handler.addFilter(RateLimitFilter(prefixes, settings.LOG_RATE_LIMIT, settings.LOG_SAMPLE_RATE))
+
+    with _lock:
+        stop_logging()
+        root = logging.getLogger()
+        for existing in root.handlers[:]:
+            root.removeHandler(existing)
+        root.addHandler(queue_handler)
+        root.setLevel(level)
+        for name, logger_level in parse_levels(levels).items():
+            logging.getLogger(name).setLevel(logger_level)
+        _listener = QueueListener(queue_handler.queue, handler, respect_handler_level=True)
+        _listener.start()
+
+def stop_logging() -> None:
+    """
+    Flush queued records and stop the listener thread
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+def logging_metrics() -> Dict[str, int]:
+    return dict(_counters)
+
+atexit.register(stop_logging)
@@ -0,0 +1,129 @@
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+import hashlib
+import hmac
+import threading
+
+# 자산 목록용 S3 GET presigned URL의 로컬 서명과 s3_key별 URL 캐시
+# boto3의 generate_presigned_url은 URL마다 이벤트 훅, 엔드포인트 해석, 서명 키 유도(HMAC 4회)를 반복합니다.
+# 여기서는 서명 키를 날짜별로 한 번만 만들고, URL 하나는 SHA-256 1회와 HMAC 1회로 서명합니다.
+
+_ALGORITHM = "AWS4-HMAC-SHA256"
+_SAFE = "-_.~"
+
+class LocalPresigner:
+    """
+    S3 GET 요청용 SigV4 쿼리 서명기
+
+    - 엔드포인트를 지정하지 않으면 가상 호스트 방식(bucket.s3.region.amazonaws.com)
+    - 점이 있는 버킷이나 S3_ENDPOINT_URL(MinIO, moto 등)은 경로 방식
+    """
+
+    def __init__(self, bucket: str, region: str, endpoint_url: Optional[str] = None):
+        if endpoint_url:
+            parts = urlsplit(endpoint_url)
+            self._base = f"{parts.scheme}://{parts.netloc}"
+            self._host = parts.netloc
+            self._prefix = f"{parts.path.rstrip('/')}/{quote(bucket, safe=_SAFE)}"
+        elif '.' in bucket:
+            # 점이 있는 버킷은 가상 호스트 방식이면 TLS 인증서가 맞지 않음
+            self._host = f"s3.{region}.amazonaws.com"
+            self._base = f"https://{self._host}"
+            self._prefix = f"/{bucket}"
+        else:
+            self._host = f"{bucket}.s3.{region}.amazonaws.com"
+            self._base = f"https://{self._host}"
+            self._prefix = ""
+        self._region = region
+        # (secret_key, 날짜) -> 서명 키
+        self._signing_key: Tuple[str, str, bytes] = ("", "", b"")
+        self._lock = threading.Lock()
+
+    def _get_signing_key(self, secret_key: str, date: str) -> bytes:
+        cached_secret, cached_date, key = self._signing_key
+        if cached_secret == secret_key and cached_date == date:
+            return key
+        key = ("AWS4" + secret_key).encode()
+        for part in (date, self._region, "s3", "aws4_request"):
+            key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+        with self._lock:
+            self._signing_key = (secret_key, date, key)
+        return key
+
+    def sign(self, s3_keys: List[str], credentials, expiration: int, now: Optional[datetime] = None) -> List[str]:
+        """
+        Presign GET URLs for the given keys with one signing key and one shared query string
+        """
+        now = now or datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date = amz_date[:8]
+        scope = f"{date}/{self._region}/s3/aws4_request"
+        signing_key = self._get_signing_key(credentials.secret_key, date)
+
+        params = {
+            "X-Amz-Algorithm": _ALGORITHM,
+            "X-Amz-Credential": f"{credentials.access_key}/{scope}",
+            "X-Amz-Date": amz_date,
+            "X-Amz-Expires": str(expiration),
+            "X-Amz-SignedHeaders": "host",
+        }
+        if credentials.token:
+            params["X-Amz-Security-Token"] = credentials.token
+        query = "&".join(f"{quote(k, safe=_SAFE)}={quote(v, safe=_SAFE)}" for k, v in sorted(params.items()))
+        canonical_tail = f"\nhost:{self._host}\n\nhost\nUNSIGNED-PAYLOAD"
+        string_to_sign_head = f"{_ALGORITHM}\n{amz_date}\n{scope}\n"
+
+        urls = []
+        for s3_key in s3_keys:
+            path = f"{self._prefix}/{quote(s3_key, safe='/' + _SAFE)}"
+            canonical_request = f"GET\n{path}\n{query}{canonical_tail}"
+            string_to_sign = string_to_sign_head + hashlib.sha256(canonical_request.encode()).hexdigest()
+            signature = hmac.new(signing_key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+            urls.append(f"{self._base}{path}?{query}&X-Amz-Signature={signature}")
+        return urls
+
+class PresignedURLCache:
+    """
+    s3_key별 presigned URL 캐시 (LRU)
+
+    URL은 유효 시간의 reuse_fraction이 지날 때까지 같은 값을 돌려주므로,
+    목록을 다시 조회해도 URL이 바뀌지 않아 브라우저/CDN 캐시가 그대로 동작합니다.
+    """
+
+    def __init__(self, max_size: int, reuse_fraction: float):
+        self._max_size = max_size
+        self._reuse_fraction = min(max(reuse_fraction, 0.0), 1.0)
+        # s3_key -> (url, 유효 시간, 재사용 기한)
+        self._entries: "OrderedDict[str, Tuple[str, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, s3_key: str, expiration: int, now: float) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(s3_key)
+            if entry is None or entry[1] != expiration or entry[2] <= now:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(s3_key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, s3_key: str, url: str, expiration: int, signed_at: float) -> None:
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._entries[s3_key] = (url, expiration, signed_at + expiration * self._reuse_fraction)
+            self._entries.move_to_end(s3_key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, s3_key: str) -> None:
+        with self._lock:
+            self._entries.pop(s3_key, None)
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self._hits, 'misses': self._misses}
@@ -1,68 +1,340 @@
-import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 from app.config import settings
+from app.utils.aws import get_client, get_credentials, run_in_executor
+from app.utils.presign import LocalPresigner, PresignedURLCache
+from datetime import datetime, timezone
 from fastapi import UploadFile
+from typing import Any, Dict, Iterable, List, Optional
+import asyncio
+import hashlib
+import logging
+import math
+import time
 import uuid
 
-s3_client = boto3.client(
-    's3',
-    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-    region_name=settings.AWS_REGION
-)
+# 로거 설정
+logger = logging.getLogger(__name__)
 
-def generate_presigned_url(s3_key: str, expiration: int = 3600) -> str:
+# S3 멀티파트 업로드의 최소 파트 크기 (마지막 파트 제외)와 최대 파트 수
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10000
+
+s3_client = get_client('s3')
+
+async def _call(method, **kwargs):
+    """
+    Run a blocking boto3 call in the S3 thread pool
+    """
+    return await run_in_executor('s3', method, **kwargs)
+
+presigner = LocalPresigner(settings.S3_BUCKET_NAME, settings.AWS_REGION, settings.S3_ENDPOINT_URL)
+url_cache = PresignedURLCache(settings.S3_PRESIGNED_URL_CACHE_SIZE, settings.S3_PRESIGNED_URL_REUSE_FRACTION)
+
+# 캐시에 없는 URL이 이보다 많으면 이벤트 루프 대신 S3 스레드 풀에서 서명
+_INLINE_SIGN_LIMIT = 32
+
+def _cached_urls(s3_keys: Iterable[str], expiration: int, now: float) -> tuple[Dict[str, str], List[str]]:
+    urls = {}
+    missing = []
+    for s3_key in dict.fromkeys(s3_keys):
+        url = url_cache.get(s3_key, expiration, now)
+        if url is None:
+            missing.append(s3_key)
+        else:
+            urls[s3_key] = url
+    return urls, missing
+
+def _sign_urls(s3_keys: List[str], expiration: int, now: float) -> Dict[str, str]:
+    """
+    Sign GET URLs for the given keys in one batch and store them in the cache
+    """
+    credentials = get_credentials() if settings.S3_LOCAL_PRESIGN else None
+    if credentials is not None:
+        signed = presigner.sign(s3_keys, credentials, expiration, datetime.fromtimestamp(now, timezone.utc))
+    else:
+        signed = [
+            s3_client.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': settings.S3_BUCKET_NAME, 'Key': s3_key},
+                ExpiresIn=expiration
+            )
+            for s3_key in s3_keys
+        ]
+    for s3_key, url in zip(s3_keys, signed):
+        url_cache.put(s3_key, url, expiration, now)
+    return dict(zip(s3_keys, signed))
+
+def generate_presigned_urls(s3_keys: Iterable[str], expiration: Optional[int] = None) -> Dict[str, str]:
+    """
+    Return presigned GET URLs by S3 key, reusing cached URLs and signing the rest in one batch
+    """
+    expiration = expiration or settings.S3_PRESIGNED_URL_EXPIRATION
+    now = time.time()
+    urls, missing = _cached_urls(s3_keys, expiration, now)
+    if missing:
+        urls.update(_sign_urls(missing, expiration, now))
+    return urls
+
+async def get_presigned_urls(s3_keys: Iterable[str], expiration: Optional[int] = None) -> Dict[str, str]:
+    """
+    Async variant of generate_presigned_urls that signs large batches in the S3 thread pool
+    """
+    expiration = expiration or settings.S3_PRESIGNED_URL_EXPIRATION
+    now = time.time()
+    urls, missing = _cached_urls(s3_keys, expiration, now)
+    if len(missing) > _INLINE_SIGN_LIMIT:
+        urls.update(await _call(_sign_urls, s3_keys=missing, expiration=expiration, now=now))
+    elif missing:
+        urls.update(_sign_urls(missing, expiration, now))
+    return urls
+
+def generate_presigned_url(s3_key: str, expiration: Optional[int] = None) -> str:
     """
     Generate a presigned URL for accessing an S3 object
     """
     try:
-        url = s3_client.generate_presigned_url(
-            'get_object',
+        return generate_presigned_urls([s3_key], expiration)[s3_key]
+    except (BotoCoreError, ClientError) as e:
+        logger.error("S3 presigned URL 생성 실패 - key: %s, error: %s", s3_key, e)
+        return None
+
+def make_s3_key(filename: str, folder_path: str = "") -> str:
+    """
+    Generate a unique S3 key that keeps the file extension
+    """
+    file_extension = filename.split('.')[-1] if '.' in filename else ''
+    return f"{folder_path}/{str(uuid.uuid4())}.{file_extension}".strip('/')
+
+def generate_presigned_put(s3_key: str, content_type: str, expiration: int = 3600) -> str:
+    """
+    Generate a presigned URL for uploading an object with a single PUT request
+    """
+    return s3_client.generate_presigned_url(
+        'put_object',
+        Params={
+            'Bucket': settings.S3_BUCKET_NAME,
+            'Key': s3_key,
+            'ContentType': content_type
+        },
+        ExpiresIn=expiration
+    )
+
+def generate_presigned_post(s3_key: str, content_type: str, max_size: int, expiration: int = 3600) -> Dict[str, Any]:
+    """
+    Generate a presigned POST form (url, fields) limited to the given content type and size
+    """
+    return s3_client.generate_presigned_post(
+        Bucket=settings.S3_BUCKET_NAME,
+        Key=s3_key,
+        Fields={'Content-Type': content_type},
+        Conditions=[
+            {'Content-Type': content_type},
+            ['content-length-range', 0, max_size]
+        ],
+        ExpiresIn=expiration
+    )
+
+def multipart_part_size(size: int) -> int:
+    """
+    Part size for a multipart upload of the given size, kept within S3's part count limit
+    """
+    return max(settings.S3_MULTIPART_CHUNK_SIZE, MIN_PART_SIZE, math.ceil(size / MAX_PARTS))
+
+async def create_presigned_multipart(
+    s3_key: str,
+    content_type: str,
+    size: int,
+    expiration: int = 3600
+) -> Optional[tuple[str, int, List[str]]]:
+    """
+    Start a multipart upload and return the upload ID, part size and a presigned URL for each part
+    """
+    try:
+        response = await _call(
+            s3_client.create_multipart_upload,
+            Bucket=settings.S3_BUCKET_NAME,
+            Key=s3_key,
+            ContentType=content_type
+        )
+    except (BotoCoreError, ClientError) as e:
+        logger.error("S3 멀티파트 업로드 시작 실패 - key: %s, error: %s", s3_key, e)
+        return None
+    upload_id = response["UploadId"]
+    part_size = multipart_part_size(size)
+    part_count = max(math.ceil(size / part_size), 1)
+    # 파트 URL은 최대 10,000개이므로 이벤트 루프를 막지 않도록 S3 스레드 풀에서 서명
+    urls = await _call(
+        _sign_part_urls, s3_key=s3_key, upload_id=upload_id, part_count=part_count, expiration=expiration
+    )
+    return upload_id, part_size, urls
+
+def _sign_part_urls(s3_key: str, upload_id: str, part_count: int, expiration: int) -> List[str]:
+    return [
+        s3_client.generate_presigned_url(
+            'upload_part',
             Params={
                 'Bucket': settings.S3_BUCKET_NAME,
-                'Key': s3_key
+                'Key': s3_key,
+                'UploadId': upload_id,
+                'PartNumber': part_number
             },
             ExpiresIn=expiration
         )
-        return url
+        for part_number in range(1, part_count + 1)
+    ]
+
+def _list_parts_sync(s3_key: str, upload_id: str) -> List[dict]:
+    paginator = s3_client.get_paginator('list_parts')
+    return [
+        {"PartNumber": part["PartNumber"], "ETag": part["ETag"]}
+        for page in paginator.paginate(Bucket=settings.S3_BUCKET_NAME, Key=s3_key, UploadId=upload_id)
+        for part in page.get("Parts", [])
+    ]
+
+async def complete_multipart(s3_key: str, upload_id: str, parts: Optional[List[dict]] = None) -> bool:
+    """
+    Complete a client-side multipart upload. When parts are not given they are listed from S3.
+    """
+    try:
+        if parts is None:
+            parts = await _call(_list_parts_sync, s3_key=s3_key, upload_id=upload_id)
+        await _call(
+            s3_client.complete_multipart_upload,
+            Bucket=settings.S3_BUCKET_NAME,
+            Key=s3_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": sorted(parts, key=lambda part: part["PartNumber"])}
+        )
+        return True
+    except (BotoCoreError, ClientError) as e:
+        logger.error("S3 멀티파트 업로드 완료 실패 - key: %s, upload_id: %s, error: %s", s3_key, upload_id, e)
+        return False
+
+async def head_file(s3_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the object's metadata (ContentLength, ContentType, ETag, ...) or None if it does not exist
+    """
+    try:
+        return await _call(s3_client.head_object, Bucket=settings.S3_BUCKET_NAME, Key=s3_key)
     except ClientError as e:
-        print(e)
+        if e.response['Error']['Code'] not in ('404', 'NoSuchKey', 'NotFound'):
+            logger.error("S3 HEAD 실패 - key: %s, error: %s", s3_key, e)
         return None
 
-async def upload_file(file: UploadFile, folder_path: str = "") -> tuple[str, int]:
+async def _upload_part(s3_key: str, upload_id: str, part_number: int, body: bytes) -> dict:
+    response = await _call(
+        s3_client.upload_part,
+        Bucket=settings.S3_BUCKET_NAME,
+        Key=s3_key,
+        UploadId=upload_id,
+        PartNumber=part_number,
+        Body=body
+    )
+    return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+async def upload_file(file: UploadFile, folder_path: str = "") -> tuple[Optional[str], int, Optional[str]]:
     """
-    Upload a file to S3 and return the S3 key and file size
+    Stream a file to S3 and return the S3 key, file size and SHA-256 checksum
+
+    The file is read in S3_MULTIPART_CHUNK_SIZE chunks and sent as a multipart upload
+    with at most S3_MULTIPART_CONCURRENCY parts in flight, so memory use does not grow
+    with the file size. Files smaller than one chunk are sent with a single put_object.
     """
-    # Generate unique file name
-    file_extension = file.filename.split('.')[-1] if '.' in file.filename else ''
-    s3_key = f"{folder_path}/{str(uuid.uuid4())}.{file_extension}".strip('/')
-    
-    # Read file content
-    content = await file.read()
-    file_size = len(content)
-    
+    s3_key = make_s3_key(file.filename, folder_path)
+    content_type = file.content_type or "application/octet-stream"
+    chunk_size = max(settings.S3_MULTIPART_CHUNK_SIZE, MIN_PART_SIZE)
+    concurrency = max(settings.S3_MULTIPART_CONCURRENCY, 1)
+    loop = asyncio.get_running_loop()
+    checksum = hashlib.sha256()
+
+    chunk = await file.read(chunk_size)
+    await loop.run_in_executor(None, checksum.update, chunk)
+
+    # 파트 하나보다 작은 파일은 단일 요청으로 업로드
+    if len(chunk) < chunk_size:
+        try:
+            await _call(
+                s3_client.put_object,
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=s3_key,
+                Body=chunk,
+                ContentType=content_type
+            )
+            return s3_key, len(chunk), checksum.hexdigest()
+        except (BotoCoreError, ClientError) as e:
+            logger.error("S3 업로드 실패 - key: %s, error: %s", s3_key, e)
+            return None, 0, None
+
     try:
-        s3_client.put_object(
+        response = await _call(
+            s3_client.create_multipart_upload,
             Bucket=settings.S3_BUCKET_NAME,
             Key=s3_key,
-            Body=content,
-            ContentType=file.content_type
+            ContentType=content_type
         )
-        return s3_key, file_size
-    except ClientError as e:
-        print(e)
-        return None, 0
+    except (BotoCoreError, ClientError) as e:
+        logger.error("S3 멀티파트 업로드 시작 실패 - key: %s, error: %s", s3_key, e)
+        return None, 0, None
+    upload_id = response["UploadId"]
 
-def delete_file(s3_key: str) -> bool:
+    parts = []
+    pending = set()
+    file_size = 0
+    part_number = 0
+    try:
+        while chunk:
+            # 전송 중인 파트가 가득 차면 하나가 끝날 때까지 다음 청크를 읽지 않음
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                parts.extend(task.result() for task in done)
+            part_number += 1
+            file_size += len(chunk)
+            pending.add(asyncio.ensure_future(_upload_part(s3_key, upload_id, part_number, chunk)))
+
+            chunk = await file.read(chunk_size)
+            if chunk:
+                await loop.run_in_executor(None, checksum.update, chunk)
+
+        parts.extend(await asyncio.gather(*pending))
+        pending = set()
+        parts.sort(key=lambda part: part["PartNumber"])
+        await _call(
+            s3_client.complete_multipart_upload,
+            Bucket=settings.S3_BUCKET_NAME,
+            Key=s3_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts}
+        )
+        return s3_key, file_size, checksum.hexdigest()
+    except BaseException as e:
+        # 전송 중인 파트가 끝난 뒤에 중단해야 업로드된 파트가 남지 않음
+        await asyncio.gather(*pending, return_exceptions=True)
+        try:
+            await _call(
+                s3_client.abort_multipart_upload,
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=s3_key,
+                UploadId=upload_id
+            )
+        except (BotoCoreError, ClientError) as abort_error:
+            logger.error("S3 멀티파트 업로드 중단 실패 - key: %s, upload_id: %s, error: %s", s3_key, upload_id, abort_error)
+        if isinstance(e, (BotoCoreError, ClientError)):
+            logger.error("S3 멀티파트 업로드 실패 - key: %s, error: %s", s3_key, e)
+            return None, 0, None
+        raise
+
+async def delete_file(s3_key: str) -> bool:
     """
     Delete a file from S3
     """
+    url_cache.invalidate(s3_key)
     try:
-        s3_client.delete_object(
+        await _call(
+            s3_client.delete_object,
             Bucket=settings.S3_BUCKET_NAME,
             Key=s3_key
         )
         return True
-    except ClientError as e:
-        print(e)
+    except (BotoCoreError, ClientError) as e:
+        logger.error("S3 삭제 실패 - key: %s, error: %s", s3_key, e)
         return False 
\ No newline at end of file
@@ -0,0 +1,193 @@
+from sqlalchemy import delete, func, insert, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.config import settings
+from app.models.asset import Asset, AssetSearchTerm, Tag, asset_tags
+import re
+
+# 자산 검색용 역색인
+# 자산의 이름/설명/태그를 단어로 나눠 asset_search_terms(user_id, term, weight, asset_id)에 저장하고,
+# 자산 생성/삭제와 같은 트랜잭션에서 갱신합니다. 조회는 사용자 범위의 기본 키 범위 조회만 사용하므로
+# MySQL과 SQLite에서 같은 쿼리로 동작합니다.
+
+# 필드별 가중치 (같은 단어가 여러 필드에 있으면 합산)
+NAME_WEIGHT = 4
+TAG_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+MAX_TERM_LENGTH = 64
+
+# 글자/숫자 연속 구간을 단어로 봄 (한글 포함, 밑줄과 구두점은 구분자)
+_TOKEN = re.compile(r"[^\W_]+")
+# 검색어: 단어 뒤에 *를 붙이면 접두어 검색 (MySQL FULLTEXT BOOLEAN MODE와 같은 형식)
+_QUERY_TOKEN = re.compile(r"([^\W_]+)(\*?)")
+# 접두어 범위의 상한 (term >= prefix AND term < prefix + _PREFIX_END)
+_PREFIX_END = "\U0010ffff"
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Split text into lowercase word tokens (truncated to MAX_TERM_LENGTH)
+    """
+    if not text:
+        return []
+    return [token[:MAX_TERM_LENGTH] for token in _TOKEN.findall(text.lower())]
+
+def asset_terms(name: str, description: Optional[str], tag_names: Iterable[str]) -> Dict[str, int]:
+    """
+    Return term -> weight for an asset, keeping at most SEARCH_MAX_TERMS_PER_ASSET terms
+    """
+    weights: Dict[str, int] = {}
+    # 이름, 태그, 설명 순서로 추가하므로 단어 수 제한에 걸려도 이름과 태그 단어는 남음
+    fields = [(tokenize(name), NAME_WEIGHT)]
+    fields.extend((tokenize(tag_name), TAG_WEIGHT) for tag_name in tag_names)
+    fields.append((tokenize(description), DESCRIPTION_WEIGHT))
+    seen_in_field = set()
+    for index, (tokens, weight) in enumerate(fields):
+        for token in tokens:
+            if (index, token) in seen_in_field:
+                continue
+            if token not in weights and len(weights) >= settings.SEARCH_MAX_TERMS_PER_ASSET:
+                continue
+            seen_in_field.add((index, token))
+            weights[token] = weights.get(token, 0) + weight
+    return weights
+
+def parse_query(q: str) -> List[Tuple[str, bool]]:
+    """
+    Split a search query into unique (term, is_prefix) pairs (at most SEARCH_MAX_QUERY_TERMS)
+
+    "rep*" is a prefix term when it has at least SEARCH_MIN_PREFIX_LENGTH characters, otherwise exact.
+    """
+    terms = {}
+    for word, star in _QUERY_TOKEN.findall(q.lower()):
+        term = word[:MAX_TERM_LENGTH]
+        is_prefix = bool(star) and len(term) >= settings.SEARCH_MIN_PREFIX_LENGTH
+        # 같은 단어가 접두어와 단어로 모두 있으면 접두어 검색이 단어 검색을 포함
+        terms[term] = terms.get(term, False) or is_prefix
+    return list(terms.items())[:settings.SEARCH_MAX_QUERY_TERMS]
+
+async def index_asset(
+    db: AsyncSession,
+    user_id: int,
+    asset_id: int,
+    name: str,
+    description: Optional[str],
+    tag_names: Iterable[str]
+) -> None:
+    """
+    Replace the index rows of one asset (call inside the transaction that writes the asset)
+    """
+    await remove_asset(db, asset_id)
+    terms = asset_terms(name, description, tag_names)
+    if terms:
+        await db.execute(insert(AssetSearchTerm), [
+            {"user_id": user_id, "term": term, "asset_id": asset_id, "weight": weight}
+            for term, weight in terms.items()
+        ])
+
+async def remove_asset(db: AsyncSession, asset_id: int) -> None:
+    await db.execute(delete(AssetSearchTerm).where(AssetSearchTerm.asset_id == asset_id))
+
+def match_query(user_id: int, terms: List[Tuple[str, bool]]):
+    """
+    Subquery (asset_id, score) of the user's assets containing every term
+
+    score is the sum over query terms of the matching word's weight (for a prefix term, the best word).
+    A single exact term reads its index rows in score order, so only one page of rows is scanned.
+    """
+    table = AssetSearchTerm.__table__
+    parts = []
+    for term, is_prefix in terms:
+        if is_prefix:
+            # 자산 하나에 접두어로 시작하는 단어가 여러 개일 수 있으므로 가장 높은 가중치만 사용
+            parts.append(
+                select(table.c.asset_id, func.max(table.c.weight).label("score"))
+                .where(table.c.user_id == user_id, table.c.term >= term, table.c.term < term + _PREFIX_END)
+                .group_by(table.c.asset_id)
+            )
+        else:
+            parts.append(
+                select(table.c.asset_id, table.c.weight.label("score"))
+                .where(table.c.user_id == user_id, table.c.term == term)
+            )
+    if len(parts) == 1:
+        return parts[0].subquery("matched")
+    # 검색어별 일치 결과를 합쳐 모든 검색어가 일치한 자산만 남김
+    combined = union_all(*parts).subquery("term_matches")
+    return (
+        select(combined.c.asset_id, func.sum(combined.c.score).label("score"))
+        .group_by(combined.c.asset_id)
+        .having(func.count() == len(parts))
+        .subquery("matched")
+    )
+
+async def tag_facets(db: AsyncSession, hits, limit: Optional[int] = None) -> List[dict]:
+    """
+    Count tags over the assets of a subquery with an asset_id column, most frequent first
+    """
+    count = func.count().label("count")
+    result = await db.execute(
+        select(Tag.name, count)
+        .select_from(hits)
+        .join(asset_tags, asset_tags.c.asset_id == hits.c.asset_id)
+        .join(Tag, Tag.id == asset_tags.c.tag_id)
+        .group_by(Tag.name)
+        .order_by(count.desc(), Tag.name)
+        .limit(limit or settings.SEARCH_FACET_LIMIT)
+    )
+    return [{"name": name, "count": tag_count} for name, tag_count in result]
+
+async def rebuild_index(db: AsyncSession, user_id: Optional[int] = None, batch_size: int = 1000) -> int:
+    """
+    Re-index every asset (of one user, or all users) in id order and return the number indexed
+
+    Used once to fill the index for assets created before search existed.
+    """
+    indexed = 0
+    last_id = 0
+    while True:
+        query = select(Asset.id, Asset.user_id, Asset.name, Asset.description).where(Asset.id > last_id)
+        if user_id is not None:
+            query = query.where(Asset.user_id == user_id)
+        rows = (await db.execute(query.order_by(Asset.id).limit(batch_size))).all()
+        if not rows:
+            return indexed
+        ids = [row.id for row in rows]
+        tag_names: Dict[int, List[str]] = {}
+        tag_result = await db.execute(
+            select(asset_tags.c.asset_id, Tag.name)
+            .join(Tag, Tag.id == asset_tags.c.tag_id)
+            .where(asset_tags.c.asset_id.in_(ids))
+        )
+        for asset_id, tag_name in tag_result:
+            tag_names.setdefault(asset_id, []).append(tag_name)
+
+        await db.execute(delete(AssetSearchTerm).where(AssetSearchTerm.asset_id.in_(ids)))
+        values = [
+            {"user_id": row.user_id, "term": term, "asset_id": row.id, "weight": weight}
+            for row in rows
+            for term, weight in asset_terms(row.name, row.description, tag_names.get(row.id, [])).items()
+        ]
+        if values:
+            await db.execute(insert(AssetSearchTerm), values)
+        await db.commit()
+        indexed += len(rows)
+        last_id = ids[-1]
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+    from app.database import AsyncSessionLocal
+    # 관계 설정용
+    from app.models import folder, user  # noqa: F401
+
+    parser = argparse.ArgumentParser(description='자산 검색 색인 다시 만들기')
+    parser.add_argument('--user-id', type=int, help='이 사용자의 자산만 다시 색인')
+    args = parser.parse_args()
+
+    async def main():
+        async with AsyncSessionLocal() as db:
+            count = await rebuild_index(db, args.user_id)
+        print(f"자산 {count}개를 색인했습니다.")
+
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+from collections import OrderedDict
+from sqlalchemy import event
+from typing import Any, Dict, Optional, Tuple
+from app.config import settings
+from app.models.user import User
+import threading
+import time
+
+# 인증된 사용자(principal) 캐시
+# get_current_user는 요청마다 users 테이블을 조회하므로, 조회한 사용자를 user_id별로 TTL 동안 프로세스 메모리에 보관합니다.
+# 캐시에는 응답에 필요한 컬럼과 비밀번호 지문(password_version에서 계산)만 저장하고 비밀번호 해시는 저장하지 않습니다.
+
+_SNAPSHOT_COLUMNS = ("id", "email", "name", "created_at", "updated_at")
+
+class UserCache:
+    """
+    user_id별 사용자 캐시 (TTL + LRU)
+
+    - 항목은 ttl초 동안 유효하고, max_size를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - 사용자 수정/삭제 시 invalidate()로 바로 제거 (User 매퍼 이벤트로 자동 호출)
+    - 요청마다 새 User 객체를 만들어 돌려주므로 세션 간에 ORM 객체를 공유하지 않음
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self._max_size = max_size
+        self._ttl = ttl
+        # user_id -> (사용자 컬럼, 비밀번호 지문, 만료 시각)
+        self._entries: "OrderedDict[int, Tuple[Dict[str, Any], str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            'hits': 0,
+            'misses': 0,
+            'stateless': 0,
+            'invalidations': 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0 and self._ttl > 0
+
+    def get(self, user_id: int) -> Optional[Tuple[User, str]]:
+        """
+        Return a fresh User built from the cached row and its password fingerprint, or None on a miss
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[2] <= now:
+                if entry is not None:
+                    del self._entries[user_id]
+                self._counters['misses'] += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self._counters['hits'] += 1
+        values, fingerprint, _ = entry
+        return User(**values), fingerprint
+
+    def put(self, user: User, fingerprint: str) -> None:
+        if not self.enabled:
+            return
+        values = {column: getattr(user, column) for column in _SNAPSHOT_COLUMNS}
+        with self._lock:
+            self._entries[user.id] = (values, fingerprint, time.monotonic() + self._ttl)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drop a user from the cache (call after deleting a user or changing the password)
+        """
+        with self._lock:
+            if self._entries.pop(int(user_id), None) is not None:
+                self._counters['invalidations'] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def record_stateless(self) -> None:
+        with self._lock:
+            self._counters['stateless'] += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            size = len(self._entries)
+        lookups = counters['hits'] + counters['misses']
+        return {
+            'size': size,
+            **counters,
+            'hit_rate': counters['hits'] / lookups if lookups else 0.0,
+            # 캐시 적중과 stateless 인증은 users 조회를 한 번씩 줄임
+            'db_round_trips_saved': counters['hits'] + counters['stateless'],
+        }
+
+user_cache = UserCache(settings.AUTH_USER_CACHE_SIZE, settings.AUTH_USER_CACHE_TTL)
+
+# ORM으로 사용자를 수정/삭제하면 캐시에서 제거 (이 프로세스의 변경만 감지하므로 다른 워커는 TTL 후 반영)
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target: User) -> None:
+    user_cache.invalidate(target.id)
@@ -0,0 +1,131 @@
+"""
+자산 목록 조회 벤치마크
+
+전체 목록을 한 번에 반환하는 조회와, 커서 페이지네이션(limit/cursor)과 부분 응답(fields)으로
+조회하는 경우의 첫 페이지 지연 시간과 응답 크기를 비교합니다.
+커서를 따라 모든 페이지를 읽은 결과가 전체 목록과 같은 순서인지 정렬 기준별로 확인합니다.
+presigned URL은 로컬에서 서명하므로 AWS 연결 없이 측정합니다.
+
+    python -m benchmarks.bench_asset_list
+    python -m benchmarks.bench_asset_list --assets 100000 --database-url mysql+aiomysql://user:pw@127.0.0.1:3306/bench
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from .bench_tags import configure_env  # noqa: F401 (SQLite BIGINT 자동 증가 설정 포함)
+
+
+async def run(args) -> None:
+    import httpx
+    from fastapi import FastAPI
+    from sqlalchemy import insert
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from app.database import Base, get_db
+    from app.dependencies import get_current_user
+    from app.models.asset import Asset, Tag, asset_tags
+    from app.models.folder import Folder  # noqa: F401 (관계 설정용)
+    from app.models.user import User
+    from app.routers import assets
+
+    engine = create_async_engine(args.database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(0)
+    start_time = datetime(2024, 1, 1)
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        user = User(id=1, email="bench@example.com", password_hash="x", name="bench")
+        db.add(user)
+        await db.flush()
+        await db.execute(insert(Tag), [{"id": i + 1, "name": f"tag-{i}", "user_id": 1} for i in range(20)])
+        # 같은 created_at이 여러 건 있어야 (정렬 값, id) 커서를 확인할 수 있음
+        await db.execute(insert(Asset), [
+            {"id": i + 1, "name": f"asset-{rng.randrange(args.assets)}", "mime_type": "image/png",
+             "size": rng.randrange(1000), "s3_key": f"uploads/1/{i}.png", "user_id": 1,
+             "created_at": start_time + timedelta(seconds=i // 3), "updated_at": start_time}
+            for i in range(args.assets)
+        ])
+        await db.execute(insert(asset_tags), [
+            {"asset_id": i + 1, "tag_id": tag_id}
+            for i in range(args.assets) for tag_id in rng.sample(range(1, 21), 3)
+        ])
+        await db.commit()
+
+    app = FastAPI()
+    app.include_router(assets.router, prefix="/assets")
+
+    async def override_db():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        # 커서를 따라 읽은 결과가 전체 목록과 같은지 확인
+        for sort in ("-created_at", "created_at", "name", "-size"):
+            full = (await client.get("/assets", params={"sort": sort, "fields": "id"})).json()
+            paged, cursor = [], None
+            while True:
+                params = {"sort": sort, "fields": "id", "limit": args.page_size}
+                if cursor:
+                    params["cursor"] = cursor
+                response = await client.get("/assets", params=params)
+                response.raise_for_status()
+                paged.extend(response.json())
+                cursor = response.headers.get("X-Next-Cursor")
+                if not cursor:
+                    break
+            assert paged == full, f"{sort}: 페이지를 이어 붙인 결과가 전체 목록과 다릅니다"
+        print(f"커서 페이지네이션 확인 완료 (정렬 4종, 페이지 크기 {args.page_size})")
+
+        # file_url을 요청해도 include_url=false이면 null
+        response = await client.get("/assets", params={"fields": "id,file_url", "include_url": "false", "limit": 5})
+        response.raise_for_status()
+        assert all(item["file_url"] is None for item in response.json()), "include_url=false인데 file_url이 있습니다"
+
+        print(f"DB: {engine.url.render_as_string(hide_password=True)}, 자산 {args.assets}개, 반복 {args.iterations}회")
+        print(f"{'경우':<36} {'평균 ms':>10} {'응답 KB':>10}")
+        cases = [
+            ("전체 목록", {}),
+            ("전체 목록, fields=id,name,size", {"fields": "id,name,size"}),
+            (f"첫 페이지 limit={args.page_size}", {"limit": args.page_size}),
+            (f"첫 페이지 limit={args.page_size}, fields=id,name", {"limit": args.page_size, "fields": "id,name"}),
+        ]
+        for label, params in cases:
+            latencies = []
+            for _ in range(args.iterations):
+                start = time.perf_counter()
+                response = await client.get("/assets", params=params)
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+            print(f"{label:<36} {statistics.mean(latencies) * 1000:>10.1f} {len(response.content) / 1024:>10.1f}")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자산 목록 조회 벤치마크")
+    parser.add_argument("--database-url", help="SQLAlchemy 비동기 DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--assets", type=int, default=20000, help="자산 수")
+    parser.add_argument("--page-size", type=int, default=100, help="페이지 크기")
+    parser.add_argument("--iterations", type=int, default=3, help="경우별 반복 횟수")
+    args = parser.parse_args()
+
+    configure_env()
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.database_url is None:
+            args.database_url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench_asset_list.db')}"
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+인증 의존성(get_current_user) 벤치마크
+
+요청마다 users 테이블을 조회하던 기존 방식과, 사용자 캐시 / stateless 토큰으로 인증하는 경우의
+인증된 요청 지연 시간과 요청당 SQL 문 수를 비교합니다.
+RDS까지의 네트워크 왕복은 --rtt-ms 만큼 문장마다 지연을 넣어 흉내 냅니다.
+비밀번호를 바꾸면 캐시가 비워지고 이전 토큰이 거부되는지도 확인합니다.
+
+    python -m benchmarks.bench_auth
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from .bench_tags import configure_env  # noqa: F401 (SQLite BIGINT 자동 증가 설정 포함)
+
+
+async def run(args) -> None:
+    import httpx
+    from fastapi import Depends, FastAPI
+    from sqlalchemy import event, select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from app import dependencies
+    from app.config import settings
+    from app.database import Base, get_db
+    from app.models.asset import Asset  # noqa: F401 (관계 설정용)
+    from app.models.folder import Folder  # noqa: F401 (관계 설정용)
+    from app.models.user import User
+    from app.utils.auth import create_access_token, decode_access_token, get_password_hash, user_token_claims
+    from app.utils.user_cache import user_cache
+
+    engine = create_async_engine(args.database_url)
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(*_):
+        nonlocal statements
+        statements += 1
+        time.sleep(args.rtt_ms / 1000)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        user = User(email="bench@example.com", password_hash=get_password_hash("bench"), name="bench")
+        db.add(user)
+        await db.commit()
+    token = create_access_token(user_token_claims(user))
+
+    async def legacy_get_current_user(
+        token: str = Depends(dependencies.oauth2_scheme), db: AsyncSession = Depends(get_db)
+    ) -> User:
+        # 변경 전 get_current_user (요청마다 users 조회)
+        result = await db.execute(select(User).where(User.id == decode_access_token(token)))
+        return result.scalar_one()
+
+    app = FastAPI()
+
+    @app.get("/legacy")
+    async def legacy(current_user: User = Depends(legacy_get_current_user)):
+        return {"id": current_user.id}
+
+    @app.get("/current")
+    async def current(current_user: User = Depends(dependencies.get_current_user)):
+        return {"id": current_user.id}
+
+    async def override_db():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_db
+
+    print(f"DB: {engine.url.render_as_string(hide_password=True)}, 문장당 지연 {args.rtt_ms} ms, 요청 {args.requests}회")
+    print(f"{'경우':<24} {'평균 ms':>10} {'문장/요청':>10}")
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {token}"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+        cases = (
+            ("기존 (요청마다 조회)", "/legacy", False),
+            ("사용자 캐시", "/current", False),
+            ("stateless 토큰", "/current", True),
+        )
+        for label, path, stateless in cases:
+            settings.AUTH_STATELESS = stateless
+            user_cache.clear()
+            latencies = []
+            statements = 0
+            for _ in range(args.requests):
+                start = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+            print(f"{label:<24} {statistics.mean(latencies) * 1000:>10.2f} {statements / args.requests:>10.2f}")
+        settings.AUTH_STATELESS = False
+        print(f"캐시 지표: {user_cache.metrics()}")
+
+        # 로그인 시 bcrypt 비용 변경처럼 같은 비밀번호를 다시 해시해도 이전 토큰은 유지됨 (password_version 그대로)
+        (await client.get("/current")).raise_for_status()
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            db.add(user)
+            user.password_hash = get_password_hash("bench")  # 솔트가 달라 해시 문자열이 바뀜
+            await db.commit()
+        response = await client.get("/current")
+        assert response.status_code == 200, "다시 해시한 뒤 이전 토큰이 거부되었습니다"
+        print("다시 해시한 뒤 이전 토큰 유지 확인 완료")
+
+        # 비밀번호를 바꾸면 캐시에서 제거되고, 이전 토큰은 거부됨
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            db.add(user)
+            user.password_hash = get_password_hash("changed")
+            user.password_version += 1
+            await db.commit()
+        assert user_cache.metrics()["size"] == 0, "비밀번호 변경 후 캐시가 비워지지 않았습니다"
+        response = await client.get("/current")
+        assert response.status_code == 401, "비밀번호 변경 전 토큰이 허용되었습니다"
+        response = await client.get(
+            "/current", headers={"Authorization": f"Bearer {create_access_token(user_token_claims(user))}"}
+        )
+        response.raise_for_status()
+        print("비밀번호 변경 후 이전 토큰 거부 확인 완료")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인증 의존성 벤치마크")
+    parser.add_argument("--database-url", help="SQLAlchemy 비동기 DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--rtt-ms", type=float, default=1.0, help="SQL 문장마다 추가할 왕복 지연(ms)")
+    parser.add_argument("--requests", type=int, default=500, help="경우별 요청 수")
+    args = parser.parse_args()
+
+    configure_env()
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.database_url is None:
+            args.database_url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench_auth.db')}"
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
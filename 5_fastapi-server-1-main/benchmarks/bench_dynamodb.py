@@ -0,0 +1,182 @@
+"""
+DynamoDB 호출 지연 시간 마이크로 벤치마크
+
+호출마다 boto3 클라이언트를 새로 만들고 기본 executor에서 실행하던 방식(before)과
+공유 클라이언트 + DynamoDB 전용 스레드 풀(after)을 로컬 DynamoDB 대체 서버에서 비교합니다.
+기본 executor가 다른 작업(파일 읽기, 해시 계산 등)으로 포화된 상황도 함께 측정합니다.
+메타데이터 저장은 기존 3회 요청(describe_table, put_item, 다시 읽기)과 put_asset_metadata를 비교합니다.
+대량 저장은 항목별 put_item과 쓰기 지연 큐(BatchWriteItem)를 비교합니다.
+
+    pip install "moto[server]"
+    python -m benchmarks.bench_dynamodb
+    python -m benchmarks.bench_dynamodb --endpoint-url http://localhost:8001  # DynamoDB Local
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from .bench_upload import configure_env, start_moto_server
+
+TABLE = "BenchAssetMetadata"
+
+
+def summarize(label: str, latencies: list, elapsed: float) -> None:
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{label:<40} 평균 {statistics.mean(latencies) * 1000:7.2f} ms  p50 {statistics.median(latencies) * 1000:7.2f} ms"
+          f"  p99 {p99 * 1000:7.2f} ms  {len(latencies) / elapsed:8.0f} ops/s")
+
+
+async def measure(label: str, call, requests: int, concurrency: int) -> None:
+    latencies = []
+    queue = iter(range(requests))
+
+    async def worker():
+        for i in queue:
+            start = time.perf_counter()
+            await call(i)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    summarize(label, latencies, time.perf_counter() - start)
+
+
+async def run(args) -> None:
+    import boto3
+    from app.config import settings
+    from app.utils.aws import get_client, run_in_executor
+    from app.utils import dynamodb
+
+    def key(i: int) -> dict:
+        return {"user_id": {"S": "bench"}, "asset_id": {"S": str(i % 100)}}
+
+    # before: 기존 get_dynamodb_client와 같이 호출마다 클라이언트 생성
+    def new_client():
+        return boto3.client(
+            "dynamodb",
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_REGION,
+            endpoint_url=settings.DYNAMODB_ENDPOINT_URL
+        )
+
+    async def before(i: int):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: new_client().get_item(TableName=TABLE, Key=key(i)))
+
+    async def after(i: int):
+        return await run_in_executor("dynamodb", get_client("dynamodb").get_item, TableName=TABLE, Key=key(i))
+
+    client = get_client("dynamodb")
+    try:
+        client.create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}, {"AttributeName": "asset_id", "KeyType": "RANGE"}],
+            AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}, {"AttributeName": "asset_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST"
+        )
+        client.get_waiter("table_exists").wait(TableName=TABLE)
+    except client.exceptions.ResourceInUseException:
+        pass
+    for i in range(100):
+        client.put_item(TableName=TABLE, Item={**key(i), "name": {"S": f"asset {i}"}})
+
+    for concurrency in args.concurrency:
+        print(f"\n동시 요청 {concurrency}개, get_item {args.requests}회")
+        await measure("before (호출마다 클라이언트 생성)", before, args.requests, concurrency)
+        await measure("after (공유 클라이언트 + 전용 풀)", after, args.requests, concurrency)
+
+    # 기본 executor를 블로킹 작업으로 채운 상태에서 측정
+    loop = asyncio.get_running_loop()
+    busy = [loop.run_in_executor(None, time.sleep, args.busy_seconds) for _ in range(64)]
+    print(f"\n기본 executor 포화 상태 (블로킹 작업 64개), 동시 요청 8개, get_item {args.requests // 5}회")
+    await measure("before (기본 executor)", before, args.requests // 5, 8)
+    await measure("after (전용 풀)", after, args.requests // 5, 8)
+    await asyncio.gather(*busy)
+
+    # 메타데이터 저장: 기존 경로(3회 요청)와 단일 조건부 put_item 비교
+    settings.DYNAMODB_TABLE_NAME = TABLE
+    item_args = dict(name="asset", description=None, mime_type="image/png", size=1024,
+                     s3_key="bench.png", folder_id=None, tags=[{"id": 1, "name": "tag"}])
+
+    def old_put(asset_id: str):
+        dynamodb.get_dynamodb_client().describe_table(TableName=TABLE)
+        dynamodb.get_dynamodb_client().put_item(
+            TableName=TABLE,
+            Item={
+                "user_id": {"S": "writer"}, "asset_id": {"S": asset_id}, "name": {"S": "asset"},
+                "mime_type": {"S": "image/png"}, "size": {"N": "1024"}, "s3_key": {"S": "bench.png"},
+                "created_at": {"S": "2024-01-01T00:00:00"}
+            },
+            ReturnConsumedCapacity="TOTAL"
+        )
+        dynamodb._get_asset_metadata_sync("writer", asset_id)
+
+    async def before_put(i: int):
+        return await run_in_executor("dynamodb", old_put, f"old-{i}")
+
+    async def after_put(i: int):
+        assert await dynamodb.put_asset_metadata(user_id="writer", asset_id=f"new-{i}", **item_args)
+
+    print(f"\n메타데이터 저장 {args.requests}회, 동시 요청 1개")
+    await measure("before (describe + put + get)", before_put, args.requests, 1)
+    await measure("after (조건부 put_item)", after_put, args.requests, 1)
+    duplicate = await dynamodb.put_asset_metadata(user_id="writer", asset_id="new-0", **item_args)
+    print(f"같은 키 재저장 거부: {not duplicate}")
+
+    # 대량 저장: 항목별 put_item(동시 16개)과 쓰기 지연 큐 비교
+    print(f"\n대량 메타데이터 저장 {args.bulk}건")
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        run_in_executor("dynamodb", dynamodb._put_asset_metadata_sync, "bulk-direct", str(i), **item_args)
+        for i in range(args.bulk)
+    ))
+    direct = time.perf_counter() - start
+    print(f"{'항목별 put_item':<40} {direct:6.2f}s  {args.bulk / direct:8.0f} items/s  요청 {args.bulk}회")
+
+    writer = dynamodb.metadata_writer
+    writer.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        dynamodb.put_asset_metadata(user_id="bulk-batched", asset_id=str(i), **item_args)
+        for i in range(args.bulk)
+    ))
+    await writer.close()
+    batched = time.perf_counter() - start
+    metrics = writer.metrics()
+    print(f"{'쓰기 지연 큐 (BatchWriteItem)':<40} {batched:6.2f}s  {args.bulk / batched:8.0f} items/s  요청 {metrics['batches']}회")
+    print(f"배치 저장 지연 p50 {metrics['flush_latency_ms']['p50']} ms, p99 {metrics['flush_latency_ms']['p99']} ms, "
+          f"백프레셔 대기 {metrics['backpressure_waits']}회, 실패 {metrics['failed']}건")
+    stored = client.query(
+        TableName=TABLE, KeyConditionExpression="user_id = :u",
+        ExpressionAttributeValues={":u": {"S": "bulk-batched"}}, Select="COUNT"
+    )["Count"]
+    print(f"저장 확인: {stored}/{args.bulk}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DynamoDB 호출 지연 시간 벤치마크")
+    parser.add_argument("--endpoint-url", help="DynamoDB 호환 서버 주소 (지정하지 않으면 moto 서버를 띄움)")
+    parser.add_argument("--requests", type=int, default=500, help="단계별 요청 수")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16], help="동시 요청 수")
+    parser.add_argument("--bulk", type=int, default=2000, help="대량 저장 항목 수")
+    parser.add_argument("--busy-seconds", type=float, default=0.5, help="기본 executor를 점유하는 블로킹 작업 시간(초)")
+    args = parser.parse_args()
+
+    process = None
+    endpoint_url = args.endpoint_url
+    if endpoint_url is None:
+        process, endpoint_url = start_moto_server()
+    configure_env(DYNAMODB_ENDPOINT_URL=endpoint_url)
+
+    try:
+        asyncio.run(run(args))
+    finally:
+        if process is not None:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    main()
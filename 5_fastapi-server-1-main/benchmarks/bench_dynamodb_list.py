@@ -0,0 +1,226 @@
+"""
+자산 목록 조회 경로(RDS / DynamoDB UserCreatedAtIndex) 벤치마크
+
+같은 자산을 SQLite와 DynamoDB(moto 서버 또는 --endpoint-url)에 같은 created_at으로 저장한 뒤,
+GET /assets 최신순 페이지 조회를 source=rds와 source=dynamodb로 비교합니다.
+- 커서를 따라 모든 페이지를 읽은 결과가 두 경로에서 같은 순서인지 확인
+- DynamoDB 경로의 요청당 SQL 문 수 (RDS로 가는 목록 조회가 없어야 함)
+- 쓰기 지연 큐에 남아 있는 새 자산/삭제가 DynamoDB 목록에 바로 반영되는지 확인
+- 첫 페이지와 깊은 페이지(커서)의 p50 지연 시간과 응답 크기
+moto는 Query마다 파티션의 모든 항목을 파이썬에서 정렬하므로, DynamoDB 경로의 절대 지연 시간은 실제 DynamoDB와 다릅니다.
+
+    pip install "moto[server]"
+    python -m benchmarks.bench_dynamodb_list
+    python -m benchmarks.bench_dynamodb_list --endpoint-url http://localhost:8001  # DynamoDB Local
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from .bench_tags import configure_env  # noqa: F401 (SQLite BIGINT 자동 증가 설정 포함)
+from .bench_upload import start_moto_server
+
+TABLE = "BenchListAssetMetadata"
+BUCKET = "bench-list"
+
+
+async def read_all(client, params: dict) -> list:
+    """커서를 따라 모든 페이지의 id를 읽음"""
+    ids, cursor = [], None
+    while True:
+        page_params = dict(params, **({"cursor": cursor} if cursor else {}))
+        response = await client.get("/assets", params=page_params)
+        response.raise_for_status()
+        ids.extend(item["id"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return ids
+
+
+async def run(args) -> None:
+    import httpx
+    from fastapi import FastAPI
+    from sqlalchemy import event, insert
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from app.database import Base, get_db
+    from app.dependencies import get_current_user
+    from app.models.asset import Asset, Tag, asset_tags
+    from app.models.folder import Folder  # noqa: F401 (관계 설정용)
+    from app.models.user import User
+    from app.routers import assets
+    from app.utils import dynamodb
+    from app.utils.aws import get_client
+    from app.utils.dynamodb_setup import create_asset_metadata_table
+
+    create_asset_metadata_table()
+    get_client("s3").create_bucket(Bucket=BUCKET, CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"})
+
+    engine = create_async_engine(args.database_url)
+    statements = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    # 두 저장소에 같은 자산을 같은 created_at으로 저장 (같은 초에 여러 건이 있도록 3건씩)
+    rng = random.Random(0)
+    start_time = datetime(2024, 1, 1)
+    tags = [{"id": i + 1, "name": f"tag-{i}", "created_at": start_time} for i in range(20)]
+    rows, links = [], []
+    for i in range(args.assets):
+        rows.append({"id": i + 1, "name": f"asset-{i}.png", "description": f"벤치마크 자산 {i}", "mime_type": "image/png",
+                     "size": rng.randrange(1, 10 ** 6), "s3_key": f"uploads/1/{i}.png", "user_id": 1,
+                     "created_at": start_time + timedelta(seconds=i // 3), "updated_at": start_time + timedelta(seconds=i // 3)})
+        links.append(rng.sample(tags, 3))
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        user = User(id=1, email="bench@example.com", password_hash="x", name="bench")
+        db.add(user)
+        await db.flush()
+        await db.execute(insert(Tag), [{"id": tag["id"], "name": tag["name"], "user_id": 1, "created_at": start_time} for tag in tags])
+        await db.execute(insert(Asset), rows)
+        await db.execute(insert(asset_tags), [
+            {"asset_id": row["id"], "tag_id": tag["id"]} for row, row_tags in zip(rows, links) for tag in row_tags
+        ])
+        await db.commit()
+
+    writer = dynamodb.metadata_writer
+    writer.start()
+    start = time.perf_counter()
+    for row, row_tags in zip(rows, links):
+        item = dynamodb._build_item("1", str(row["id"]), row["name"], row["description"], row["mime_type"],
+                                    row["size"], row["s3_key"], None, row_tags, created_at=row["created_at"])
+        await writer.put(item)
+    await writer.flush()
+    print(f"자산 {args.assets}개 저장 (DynamoDB {time.perf_counter() - start:.1f}s)")
+
+    app = FastAPI()
+    app.include_router(assets.router, prefix="/assets")
+
+    async def override_db():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        # 1) 두 경로의 전체 페이지 순서 비교
+        params = {"fields": "id", "limit": args.page_size}
+        from_rds = await read_all(client, {**params, "source": "rds"})
+        statements.clear()
+        from_dynamodb = await read_all(client, {**params, "source": "dynamodb"})
+        assert from_dynamodb == from_rds, "DynamoDB 목록 순서가 RDS와 다릅니다"
+        assert len(from_rds) == args.assets
+        assert not statements, f"DynamoDB 목록 조회 중 SQL {len(statements)}건 실행"
+        print(f"전체 페이지 순서 확인 완료 (페이지 크기 {args.page_size}, DynamoDB 경로 SQL 0건)")
+
+        # 태그와 필드 값이 RDS 응답과 같은지 (updated_at은 DynamoDB에 없으므로 created_at과 같은 경우만 비교)
+        rds_page = (await client.get("/assets", params={"limit": 20, "source": "rds", "include_url": "false"})).json()
+        ddb_page = (await client.get("/assets", params={"limit": 20, "source": "dynamodb", "include_url": "false"})).json()
+        for expected, actual in zip(rds_page, ddb_page):
+            expected["tags"].sort(key=lambda tag: tag["id"])
+            actual["tags"].sort(key=lambda tag: tag["id"])
+        assert ddb_page == rds_page, "DynamoDB 응답 필드가 RDS와 다릅니다"
+
+        # 2) 쓰기 지연 큐에 남은 요청이 목록에 반영되는지 (저장 간격을 늘려 큐에 머물게 함)
+        dynamodb.settings.DYNAMODB_FLUSH_INTERVAL = 3600
+        await writer.flush()  # 이미 기다리는 중인 저장 간격도 새 값으로 다시 시작
+        new_ids = []
+        for i in range(3):
+            response = await client.post("/assets", data={"name": f"new-{i}.txt", "tags": '["new"]'},
+                                         files={"file": (f"new-{i}.txt", b"hello", "text/plain")})
+            response.raise_for_status()
+            new_ids.append(response.json()["id"])
+        assert writer.metrics()["queue_depth"] == 3, "새 자산이 쓰기 지연 큐에 없습니다"
+        page = (await client.get("/assets", params={"limit": 5, "source": "dynamodb", "fields": "id,tags"})).json()
+        assert [item["id"] for item in page[:3]] == new_ids[::-1], "큐에 있는 새 자산이 목록에 없습니다"
+        assert page[0]["tags"][0]["name"] == "new"
+        (await client.delete(f"/assets/{new_ids[1]}")).raise_for_status()
+        page = (await client.get("/assets", params={"limit": 5, "source": "dynamodb", "fields": "id"})).json()
+        assert new_ids[1] not in [item["id"] for item in page], "큐에 있는 삭제가 목록에 반영되지 않았습니다"
+        # 큐에 있는 새 자산이 페이지 경계에 걸려도 중복/누락이 없는지
+        paged = await read_all(client, {"fields": "id", "limit": 2, "source": "dynamodb"})
+        assert paged == [new_ids[2], new_ids[0], *from_rds], "큐 반영 후 페이지 순서가 다릅니다"
+        await writer.flush()
+        assert writer.metrics()["queue_depth"] == 0
+        paged = await read_all(client, {"fields": "id", "limit": 2, "source": "dynamodb"})
+        assert paged == [new_ids[2], new_ids[0], *from_rds], "저장 후 페이지 순서가 다릅니다"
+        # POST /assets로 저장한 메타데이터의 created_at/updated_at이 RDS 값과 같은지
+        rds_page = (await client.get("/assets", params={"limit": 2, "source": "rds", "include_url": "false"})).json()
+        ddb_page = (await client.get("/assets", params={"limit": 2, "source": "dynamodb", "include_url": "false"})).json()
+        assert ddb_page == rds_page, f"새 자산의 DynamoDB 응답이 RDS와 다릅니다: {ddb_page} != {rds_page}"
+        print("쓰기 지연 큐의 새 자산/삭제 반영 확인 완료")
+
+        # 3) 지연 시간: 첫 페이지, 깊은 페이지(커서)
+        deep = {}
+        for source in ("rds", "dynamodb"):
+            response = await client.get("/assets", params={"limit": args.assets // 2, "fields": "id", "source": source})
+            deep[source] = response.headers["X-Next-Cursor"]
+        print(f"\n자산 {args.assets}개, 페이지 크기 {args.page_size}, 반복 {args.iterations}회")
+        print(f"{'경우':<32} {'rds p50 ms':>11} {'dynamodb p50 ms':>16} {'rds SQL/요청':>12} {'dynamodb SQL/요청':>17} {'응답 KB':>9}")
+        cases = [
+            ("첫 페이지", {"limit": args.page_size}),
+            ("첫 페이지 include_url=false", {"limit": args.page_size, "include_url": "false"}),
+            ("첫 페이지 fields=id,name,size", {"limit": args.page_size, "fields": "id,name,size"}),
+            ("중간 페이지 (커서)", {"limit": args.page_size, "include_url": "false"}),
+        ]
+        for label, params in cases:
+            timings, sql_counts = {}, {}
+            for source in ("rds", "dynamodb"):
+                case_params = dict(params, source=source)
+                if label.startswith("중간"):
+                    case_params["cursor"] = deep[source]
+                latencies = []
+                statements.clear()
+                for _ in range(args.iterations):
+                    start = time.perf_counter()
+                    response = await client.get("/assets", params=case_params)
+                    latencies.append(time.perf_counter() - start)
+                    response.raise_for_status()
+                    assert response.headers["X-Asset-Source"] == source
+                timings[source] = statistics.median(latencies)
+                sql_counts[source] = len(statements) / args.iterations
+            print(f"{label:<32} {timings['rds'] * 1000:>11.1f} {timings['dynamodb'] * 1000:>16.1f} "
+                  f"{sql_counts['rds']:>12.0f} {sql_counts['dynamodb']:>17.0f} {len(response.content) / 1024:>9.1f}")
+
+    await writer.close()
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자산 목록 조회 경로(RDS / DynamoDB) 벤치마크")
+    parser.add_argument("--endpoint-url", help="DynamoDB/S3 호환 서버 주소 (지정하지 않으면 moto 서버를 띄움)")
+    parser.add_argument("--assets", type=int, default=2000, help="자산 수")
+    parser.add_argument("--page-size", type=int, default=100, help="페이지 크기")
+    parser.add_argument("--iterations", type=int, default=20, help="경우별 반복 횟수")
+    args = parser.parse_args()
+
+    process = None
+    endpoint_url = args.endpoint_url
+    if endpoint_url is None:
+        process, endpoint_url = start_moto_server()
+    configure_env(
+        DYNAMODB_ENDPOINT_URL=endpoint_url, S3_ENDPOINT_URL=endpoint_url, DYNAMODB_TABLE_NAME=TABLE,
+        S3_BUCKET_NAME=BUCKET, S3_PRESIGNED_URL_CACHE_SIZE="0", METRICS_ENABLED="false"
+    )
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            args.database_url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench_dynamodb_list.db')}"
+            asyncio.run(run(args))
+    finally:
+        if process is not None:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+폴더 트리 조회 벤치마크
+
+폴더마다 자식 폴더를 SELECT 하던 기존 get_folder_tree와, 쿼리 한 번(또는 재귀 CTE)으로 읽어
+메모리에서 트리를 만드는 현재 구현을 합성 계층 구조로 비교합니다.
+응답 검증/직렬화까지 포함하도록 FastAPI 앱을 통해 호출하며, 요청당 SQL 문 수도 함께 출력합니다.
+RDS까지의 네트워크 왕복은 --rtt-ms 만큼 문장마다 지연을 넣어 흉내 냅니다.
+
+    python -m benchmarks.bench_folder_tree
+    python -m benchmarks.bench_folder_tree --folders 5000 --database-url mysql+aiomysql://user:pw@127.0.0.1:3306/bench
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from .bench_tags import configure_env  # noqa: F401 (SQLite BIGINT 자동 증가 설정 포함)
+
+
+def wide(n: int):
+    # 루트 50개, 각 루트 아래 자식 폴더 (2단계)
+    roots = 50
+    return [None] * roots + [i % roots for i in range(n - roots)]
+
+
+def balanced(n: int):
+    # 자식 4개씩 꽉 찬 트리
+    return [None] + [(i - 1) // 4 for i in range(1, n)]
+
+
+def deep(n: int):
+    # 한 줄로 이어진 폴더 (깊이 n)
+    return [None] + list(range(n - 1))
+
+
+async def run(args) -> None:
+    import httpx
+    from fastapi import Depends, FastAPI
+    from sqlalchemy import event, insert, select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from typing import List
+    from app.database import Base, get_db
+    from app.dependencies import get_current_user
+    from app.models.asset import Asset  # noqa: F401 (관계 설정용)
+    from app.models.folder import Folder
+    from app.models.user import User
+    from app.routers import folders
+    from app.schemas.folder import FolderTreeResponse
+
+    engine = create_async_engine(args.database_url)
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(*_):
+        nonlocal statements
+        statements += 1
+        time.sleep(args.rtt_ms / 1000)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async def legacy_get_folder_tree(current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+        # 변경 전 get_folder_tree의 쿼리 패턴 (폴더마다 자식 SELECT)
+        # 원래 코드의 from_orm(folder)은 지연 로딩되는 children 관계를 읽어 비동기 세션에서 실패하므로
+        # 여기서는 컬럼 값으로 응답을 만듭니다.
+        result = await db.execute(
+            select(Folder).where(Folder.user_id == current_user.id, Folder.parent_id == None)
+        )
+        root_folders = result.scalars().all()
+
+        async def build_tree(folder):
+            result = await db.execute(
+                select(Folder).where(Folder.parent_id == folder.id, Folder.user_id == current_user.id)
+            )
+            children = result.scalars().all()
+            return FolderTreeResponse(
+                id=folder.id, name=folder.name, parent_id=folder.parent_id, user_id=folder.user_id,
+                created_at=folder.created_at, updated_at=folder.updated_at,
+                children=[await build_tree(child) for child in children]
+            )
+
+        return [await build_tree(folder) for folder in root_folders]
+
+    app = FastAPI()
+    app.include_router(folders.router, prefix="/folders")
+    app.add_api_route("/legacy/tree", legacy_get_folder_tree, response_model=List[FolderTreeResponse])
+
+    current_user = None
+
+    async def override_db():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_user] = lambda: current_user
+
+    shapes = {"wide": wide, "balanced": balanced, "deep": deep}
+    print(f"DB: {engine.url.render_as_string(hide_password=True)}, 문장당 지연 {args.rtt_ms} ms, 반복 {args.iterations}회")
+    print(f"{'구조':<10} {'폴더':>6} {'경로':<28} {'평균 ms':>10} {'문장':>6}")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for user_id, (shape, parents_of) in enumerate(shapes.items(), start=1):
+            n = args.deep_folders if shape == "deep" else args.folders
+            async with AsyncSession(engine, expire_on_commit=False) as db:
+                current_user = User(id=user_id, email=f"{shape}@example.com", password_hash="x", name=shape)
+                db.add(current_user)
+                await db.flush()
+                # 부모가 항상 먼저 만들어지므로 id = 첫 id + 위치
+                first_id = (user_id - 1) * max(args.folders, args.deep_folders) + 1
+                await db.execute(insert(Folder), [
+                    {"id": first_id + i, "name": f"{shape}-{i}", "user_id": user_id,
+                     "parent_id": None if parent is None else first_id + parent}
+                    for i, parent in enumerate(parents_of(n))
+                ])
+                await db.commit()
+
+            paths = [("기존 (폴더마다 SELECT)", "/legacy/tree"), ("현재 (전체 한 번)", "/folders/tree"),
+                     ("현재 (root_id, 재귀 CTE)", f"/folders/tree?root_id={first_id}"),
+                     ("현재 (depth=2)", "/folders/tree?depth=2")]
+            expected = None
+            for label, path in paths:
+                latencies, counts = [], []
+                iterations = 1 if path.startswith("/legacy") else args.iterations
+                for _ in range(iterations):
+                    statements = 0
+                    start = time.perf_counter()
+                    response = await client.get(path)
+                    latencies.append(time.perf_counter() - start)
+                    counts.append(statements)
+                    response.raise_for_status()
+                if expected is None:
+                    expected = response.json()
+                elif path == "/folders/tree":
+                    assert response.json() == expected, "기존 구현과 결과가 다릅니다"
+                print(f"{shape:<10} {n:>6} {label:<28} {statistics.mean(latencies) * 1000:>10.1f} {max(counts):>6}")
+
+        # 최대 단계 경계: 루트 아래 MAX_TREE_DEPTH 단계는 조회되고, 그보다 깊으면 depth 없이 400
+        max_depth = folders.MAX_TREE_DEPTH
+        user_id = len(shapes) + 1
+        for extra in (0, 1):
+            async with AsyncSession(engine, expire_on_commit=False) as db:
+                current_user = User(id=user_id, email=f"limit-{extra}@example.com", password_hash="x", name="limit")
+                db.add(current_user)
+                await db.flush()
+                first_id = (user_id - 1) * max(args.folders, args.deep_folders, max_depth + 2) + 1
+                await db.execute(insert(Folder), [
+                    {"id": first_id + i, "name": f"limit-{i}", "user_id": user_id,
+                     "parent_id": None if i == 0 else first_id + i - 1}
+                    for i in range(max_depth + 1 + extra)
+                ])
+                await db.commit()
+            for path in ("/folders/tree", f"/folders/tree?root_id={first_id}"):
+                response = await client.get(path)
+                assert response.status_code == (400 if extra else 200), f"{path}: {response.status_code}"
+            response = await client.get(f"/folders/tree?depth={max_depth}")
+            response.raise_for_status()
+            node, levels = response.json()[0], 0
+            while node["children"]:
+                node, levels = node["children"][0], levels + 1
+            assert levels == max_depth, f"depth={max_depth} 조회 단계 수: {levels}"
+            user_id += 1
+        assert (await client.get(f"/folders/tree?depth={max_depth + 1}")).status_code == 422
+        print(f"최대 단계({max_depth}) 확인 완료: 더 깊은 트리는 depth 없이 400, depth는 {max_depth}까지")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="폴더 트리 조회 벤치마크")
+    parser.add_argument("--database-url", help="SQLAlchemy 비동기 DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--rtt-ms", type=float, default=1.0, help="SQL 문장마다 추가할 왕복 지연(ms)")
+    parser.add_argument("--folders", type=int, default=5000, help="wide/balanced 구조의 폴더 수")
+    parser.add_argument("--deep-folders", type=int, default=200, help="deep 구조의 깊이(폴더 수)")
+    parser.add_argument("--iterations", type=int, default=5, help="현재 구현 반복 횟수 (기존 구현은 1회)")
+    args = parser.parse_args()
+
+    configure_env()
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.database_url is None:
+            args.database_url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench_folder_tree.db')}"
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
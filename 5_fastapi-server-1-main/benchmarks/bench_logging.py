@@ -0,0 +1,144 @@
+"""
+로깅 설정별 요청 처리량 벤치마크
+
+자산 목록 조회(GET /assets)를 동시에 호출하면서 두 가지 로깅 설정의 처리량과 p99 지연 시간을 비교합니다.
+- debug: 변경 전 설정 (루트/boto3/botocore/urllib3 DEBUG, SQLAlchemy echo, 요청 스레드에서 바로 출력)
+- production: configure_logging() 기본값 (큐 기반 출력, JSON, SDK 로거 WARNING)
+presigned URL은 boto3로 매번 서명하도록 캐시와 로컬 서명을 끄고 측정합니다. (botocore 로그가 생기도록)
+로그는 임시 파일에 쓰며, 설정마다 별도 프로세스에서 실행합니다.
+
+    python -m benchmarks.bench_logging
+    python -m benchmarks.bench_logging --requests 2000 --concurrency 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from .bench_tags import configure_env  # noqa: F401 (SQLite BIGINT 자동 증가 설정 포함)
+
+
+def percentile(values, p: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * p / 100), len(values) - 1)]
+
+
+async def run(args, log_file) -> dict:
+    import logging
+    import httpx
+    from fastapi import FastAPI
+    from sqlalchemy import insert
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from app.database import Base, get_db
+    from app.dependencies import get_current_user
+    from app.models.asset import Asset
+    from app.models.folder import Folder  # noqa: F401 (관계 설정용)
+    from app.models.user import User
+    from app.routers import assets
+    from app.utils.log_config import configure_logging, stop_logging
+
+    if args.profile == "debug":
+        # 변경 전 app/main.py의 로깅 설정
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[logging.StreamHandler(log_file)]
+        )
+        for name in ("boto3", "botocore", "urllib3"):
+            logging.getLogger(name).setLevel(logging.DEBUG)
+    else:
+        configure_logging(stream=log_file)
+
+    engine = create_async_engine(args.database_url, echo=args.profile == "debug")
+    if args.profile == "debug":
+        # echo=True는 표준 출력 핸들러를 붙이므로 같은 파일로 출력되게 바꿈
+        engine_logger = logging.getLogger("sqlalchemy.engine.Engine")
+        for handler in engine_logger.handlers:
+            handler.setStream(log_file)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        user = User(id=1, email="bench@example.com", password_hash="x", name="bench")
+        db.add(user)
+        await db.flush()
+        await db.execute(insert(Asset), [
+            {"name": f"asset-{i}", "mime_type": "image/png", "size": i, "s3_key": f"uploads/1/{i}.png", "user_id": 1}
+            for i in range(args.assets)
+        ])
+        await db.commit()
+
+    app = FastAPI()
+    app.include_router(assets.router, prefix="/assets")
+
+    async def override_db():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def worker(count: int):
+            for _ in range(count):
+                start = time.perf_counter()
+                (await client.get("/assets", params={"limit": args.assets})).raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        per_worker = args.requests // args.concurrency
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(per_worker) for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+
+    await engine.dispose()
+    stop_logging()
+    log_file.flush()
+    return {
+        "throughput": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": percentile(latencies, 99),
+        "log_bytes": os.path.getsize(log_file.name),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로깅 설정별 요청 처리량 벤치마크")
+    parser.add_argument("--requests", type=int, default=1000, help="설정별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument("--assets", type=int, default=20, help="요청마다 조회할 자산 수 (자산마다 presigned URL 서명)")
+    parser.add_argument("--profile", choices=["debug", "production"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.profile is None:
+        # 로깅 설정이 섞이지 않도록 설정마다 새 프로세스에서 실행
+        print(f"요청 {args.requests}개, 동시 {args.concurrency}, 요청당 자산 {args.assets}개")
+        print(f"{'설정':<12} {'요청/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'로그 KB':>10}")
+        for profile in ("debug", "production"):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_logging", "--profile", profile,
+                 "--requests", str(args.requests), "--concurrency", str(args.concurrency),
+                 "--assets", str(args.assets)],
+                check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{profile:<12} {result['throughput']:>10.1f} {result['p50'] * 1000:>9.2f} "
+                  f"{result['p99'] * 1000:>9.2f} {result['log_bytes'] / 1024:>10.1f}")
+        return
+
+    configure_env(S3_LOCAL_PRESIGN="false", S3_PRESIGNED_URL_CACHE_SIZE="0")
+    with tempfile.TemporaryDirectory() as tmp:
+        args.database_url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench_logging.db')}"
+        with open(os.path.join(tmp, "app.log"), "w", encoding="utf-8") as log_file:
+            print(json.dumps(asyncio.run(run(args, log_file))))
+
+
+if __name__ == "__main__":
+    main()
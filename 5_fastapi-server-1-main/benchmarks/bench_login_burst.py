@@ -0,0 +1,143 @@
+"""
+로그인 폭주 부하 테스트
+
+동시 로그인 요청을 한꺼번에 보내는 동안, 인증과 관계없는 엔드포인트(/ping)를 주기적으로 호출해
+지연 시간 분포(p50/p99/최대)를 측정합니다. 지연은 예정된 호출 시각부터 재므로 이벤트 루프가 멈춘 시간도 포함됩니다.
+bcrypt를 이벤트 루프에서 실행하던 기존 로그인과 프로세스 풀(password_hasher)을 사용하는 현재 로그인을 비교합니다.
+로그인 응답 코드별 개수(200 성공, 503 대기열 초과)와 전체 로그인 완료 시간도 출력합니다.
+
+    python -m benchmarks.bench_login_burst
+    python -m benchmarks.bench_login_burst --logins 500 --rounds 12 --workers 4
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections import Counter
+
+from .bench_tags import configure_env  # noqa: F401 (SQLite BIGINT 자동 증가 설정 포함)
+
+
+def percentile(values, p: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * p / 100), len(values) - 1)]
+
+
+async def run(args) -> None:
+    import httpx
+    from fastapi import Depends, FastAPI, HTTPException
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from app.database import Base, get_db
+    from app.models.asset import Asset  # noqa: F401 (관계 설정용)
+    from app.models.folder import Folder  # noqa: F401 (관계 설정용)
+    from app.models.user import User
+    from app.routers import auth
+    from app.utils.auth import get_password_hash, password_hasher, pwd_context
+
+    engine = create_async_engine(args.database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        db.add(User(email="bench@example.com", password_hash=get_password_hash("bench"), name="bench"))
+        await db.commit()
+
+    app = FastAPI()
+    app.include_router(auth.router, prefix="/auth")
+
+    @app.post("/legacy/login")
+    async def legacy_login(request: auth.LoginRequest, db: AsyncSession = Depends(get_db)):
+        # 변경 전 login (bcrypt를 이벤트 루프에서 실행)
+        result = await db.execute(select(User).where(User.email == request.email))
+        user = result.scalar_one_or_none()
+        if not user or not pwd_context.verify(request.password, user.password_hash):
+            raise HTTPException(status_code=401)
+        return {"id": user.id}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    async def override_db():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_db
+    password_hasher.warm_up()
+
+    print(f"동시 로그인 {args.logins}개, bcrypt rounds {args.rounds}, 해시 프로세스 {args.workers}개, "
+          f"대기열 {args.queue_size}, /ping 간격 {args.ping_interval_ms} ms")
+    print(f"{'로그인':<18} {'p50 ms':>8} {'p99 ms':>8} {'최대 ms':>9} {'ping 수':>8} {'로그인 완료 s':>13}  응답 코드")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for label, path in (("기존 (이벤트 루프)", "/legacy/login"), ("현재 (프로세스 풀)", "/auth/login")):
+            done = asyncio.Event()
+            latencies = []
+
+            async def probe():
+                # 예정된 호출 시각부터 측정 (이벤트 루프가 멈춰 호출이 늦어진 시간도 지연에 포함)
+                interval = args.ping_interval_ms / 1000
+                scheduled = time.perf_counter()
+                while not done.is_set():
+                    (await client.get("/ping")).raise_for_status()
+                    latencies.append(time.perf_counter() - scheduled)
+                    scheduled += interval
+                    await asyncio.sleep(max(scheduled - time.perf_counter(), 0))
+
+            async def login():
+                response = await client.post("/" + path.lstrip("/"), json={"email": "bench@example.com", "password": "bench"})
+                return response.status_code
+
+            probe_task = asyncio.create_task(probe())
+            await asyncio.sleep(0.05)
+            start = time.perf_counter()
+            statuses = Counter(await asyncio.gather(*(login() for _ in range(args.logins))))
+            elapsed = time.perf_counter() - start
+            done.set()
+            await probe_task
+
+            codes = ", ".join(f"{code}: {count}" for code, count in sorted(statuses.items()))
+            print(f"{label:<18} {statistics.median(latencies) * 1000:>8.1f} {percentile(latencies, 99) * 1000:>8.1f} "
+                  f"{max(latencies) * 1000:>9.1f} {len(latencies):>8} {elapsed:>13.2f}  {codes}")
+
+        # 같은 이메일로 동시에 가입: 해시를 기다리는 동안 중복 확인을 모두 통과하므로 유니크 제약에서 걸림
+        # 하나만 201이고 나머지는 500이 아닌 400이어야 함
+        responses = await asyncio.gather(*(
+            client.post("/auth/register", json={"email": "race@example.com", "password": "race", "name": "race"})
+            for _ in range(args.workers * 2)
+        ))
+        statuses = Counter(response.status_code for response in responses)
+        assert statuses == {201: 1, 400: len(responses) - 1}, f"동시 가입 응답 코드: {dict(statuses)}"
+        print(f"같은 이메일 동시 가입 {len(responses)}건: 201 1건, 400 {statuses[400]}건")
+
+    password_hasher.shutdown()
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 폭주 부하 테스트")
+    parser.add_argument("--database-url", help="SQLAlchemy 비동기 DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--logins", type=int, default=500, help="동시에 보낼 로그인 요청 수")
+    parser.add_argument("--rounds", type=int, default=10, help="bcrypt 비용 (AUTH_BCRYPT_ROUNDS)")
+    parser.add_argument("--workers", type=int, default=2, help="해시 프로세스 수 (AUTH_HASH_WORKERS)")
+    parser.add_argument("--queue-size", type=int, default=1000, help="해시 대기열 크기 (AUTH_HASH_QUEUE_SIZE)")
+    parser.add_argument("--ping-interval-ms", type=float, default=10, help="/ping 호출 간격(ms)")
+    args = parser.parse_args()
+
+    # 해시 프로세스도 같은 설정을 읽도록 환경 변수로 전달
+    configure_env(
+        AUTH_BCRYPT_ROUNDS=str(args.rounds),
+        AUTH_HASH_WORKERS=str(args.workers),
+        AUTH_HASH_QUEUE_SIZE=str(args.queue_size),
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.database_url is None:
+            args.database_url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench_login_burst.db')}"
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
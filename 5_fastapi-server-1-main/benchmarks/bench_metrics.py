@@ -0,0 +1,183 @@
+"""
+Prometheus 메트릭 측정 비용 벤치마크
+
+같은 SQLite DB에 대해 계측하지 않은 앱과, MetricsMiddleware + instrument_engine으로 계측한 앱에
+자산 목록 조회(GET /assets)를 번갈아 보내 처리량과 p50/p99 지연 시간을 비교합니다.
+이어서 /assets/{asset_id}/url을 여러 id로 호출해 라우트 레이블이 템플릿 하나로 묶이는지 확인하고,
+moto 서버(또는 --endpoint-url)가 있으면 S3/DynamoDB 호출과 오류(404)가 기록되는지 확인한 뒤 /metrics 일부를 출력합니다.
+
+    python -m benchmarks.bench_metrics
+    python -m benchmarks.bench_metrics --requests 5000 --concurrency 20
+    pip install "moto[server]"  # S3/DynamoDB 계측 확인용 (없으면 건너뜀)
+"""
+import argparse
+import asyncio
+import importlib.util
+import os
+import statistics
+import tempfile
+import time
+
+from .bench_tags import configure_env  # noqa: F401 (SQLite BIGINT 자동 증가 설정 포함)
+from .bench_upload import start_moto_server
+
+
+def percentile(values, p: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * p / 100), len(values) - 1)]
+
+
+async def measure(client, args) -> dict:
+    latencies = []
+
+    async def worker(count: int):
+        for _ in range(count):
+            start = time.perf_counter()
+            (await client.get("/assets", params={"limit": args.page_size})).raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(args.requests // args.concurrency) for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    return {"throughput": len(latencies) / elapsed, "p50": statistics.median(latencies), "p99": percentile(latencies, 99)}
+
+
+async def exercise_aws() -> None:
+    from botocore.exceptions import ClientError
+    from app.utils.aws import get_client, run_in_executor
+
+    s3_client = get_client("s3")
+    await run_in_executor("s3", s3_client.create_bucket, Bucket="bench",
+                          CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"})
+    for i in range(20):
+        await run_in_executor("s3", s3_client.put_object, Bucket="bench", Key=f"metrics/{i}", Body=b"x")
+    try:
+        await run_in_executor("s3", s3_client.head_object, Bucket="bench", Key="metrics/missing")
+    except ClientError:
+        pass
+    await run_in_executor("dynamodb", get_client("dynamodb").list_tables)
+
+
+async def run(args) -> None:
+    import httpx
+    from fastapi import FastAPI, Response
+    from sqlalchemy import insert
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from app.database import Base, get_db
+    from app.dependencies import get_current_user
+    from app.models.asset import Asset
+    from app.models.folder import Folder  # noqa: F401 (관계 설정용)
+    from app.models.user import User
+    from app.routers import assets
+    from app.utils.metrics import (
+        CONTENT_TYPE, DEPENDENCY_ERRORS, DEPENDENCY_LATENCY, REQUEST_LATENCY,
+        MetricsMiddleware, instrument_engine, render_metrics
+    )
+
+    plain_engine = create_async_engine(args.database_url)
+    async with plain_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(plain_engine, expire_on_commit=False) as db:
+        user = User(id=1, email="bench@example.com", password_hash="x", name="bench")
+        db.add(user)
+        await db.flush()
+        await db.execute(insert(Asset), [
+            {"id": i + 1, "name": f"asset-{i}", "mime_type": "image/png", "size": i, "s3_key": f"uploads/1/{i}.png", "user_id": 1}
+            for i in range(args.assets)
+        ])
+        await db.commit()
+    metrics_engine = create_async_engine(args.database_url)
+    instrument_engine(metrics_engine, "bench")
+
+    def build_app(engine, instrumented: bool) -> FastAPI:
+        app = FastAPI()
+        app.include_router(assets.router, prefix="/assets")
+        if instrumented:
+            app.add_middleware(MetricsMiddleware)
+
+            @app.get("/metrics")
+            async def metrics():
+                return Response(content=render_metrics(), media_type=CONTENT_TYPE)
+
+        async def override_db():
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                yield session
+
+        app.dependency_overrides[get_db] = override_db
+        app.dependency_overrides[get_current_user] = lambda: user
+        return app
+
+    plain = httpx.AsyncClient(transport=httpx.ASGITransport(app=build_app(plain_engine, False)),
+                              base_url="http://bench", timeout=None)
+    instrumented = httpx.AsyncClient(transport=httpx.ASGITransport(app=build_app(metrics_engine, True)),
+                                     base_url="http://bench", timeout=None)
+    async with plain, instrumented:
+        # 순서에 따른 차이(워밍업 등)를 줄이기 위해 번갈아 여러 번 측정
+        results = {"계측 안 함": [], "계측": []}
+        for _ in range(args.rounds):
+            results["계측 안 함"].append(await measure(plain, args))
+            results["계측"].append(await measure(instrumented, args))
+
+        print(f"요청 {args.requests}개 x {args.rounds}회, 동시 {args.concurrency}, 페이지 크기 {args.page_size}")
+        print(f"{'경우':<12} {'요청/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+        for label, runs in results.items():
+            print(f"{label:<12} {statistics.median(r['throughput'] for r in runs):>10.1f} "
+                  f"{statistics.median(r['p50'] for r in runs) * 1000:>9.2f} "
+                  f"{statistics.median(r['p99'] for r in runs) * 1000:>9.2f}")
+
+        for asset_id in range(1, 51):
+            (await instrumented.get(f"/assets/{asset_id}/url")).raise_for_status()
+        _, _, count = REQUEST_LATENCY.snapshot("GET", "/assets/{asset_id}/url", "200")
+        assert count == 50, f"/assets/{{asset_id}}/url 레이블로 기록된 요청 수가 {count}입니다"
+        _, _, count = DEPENDENCY_LATENCY.snapshot("db", "SELECT")
+        print(f"\n라우트 템플릿 레이블 확인 완료, 기록된 SELECT {count}건")
+
+        if args.endpoint_url:
+            await exercise_aws()
+            _, _, puts = DEPENDENCY_LATENCY.snapshot("s3", "PutObject")
+            assert puts == 20, f"PutObject 기록 수가 {puts}입니다"
+            assert DEPENDENCY_ERRORS.value("s3", "HeadObject", "404") == 1, "HeadObject 404 오류가 기록되지 않았습니다"
+            print("S3/DynamoDB 호출과 오류 기록 확인 완료")
+        else:
+            print("moto가 없어 S3/DynamoDB 확인은 건너뜀 (pip install \"moto[server]\")")
+
+        body = (await instrumented.get("/metrics")).text
+        print("\n/metrics 일부:")
+        for line in body.splitlines():
+            # 히스토그램은 _count만, 오류 카운터와 풀 게이지는 모두 출력
+            if "_count{" in line or line.startswith(("dependency_call_errors_total", "db_pool_checked", "db_pool_overflow", "db_pool_size")):
+                print("  " + line)
+
+    await plain_engine.dispose()
+    await metrics_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prometheus 메트릭 측정 비용 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000, help="회당 요청 수")
+    parser.add_argument("--rounds", type=int, default=3, help="경우별 반복 횟수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument("--assets", type=int, default=1000, help="자산 수")
+    parser.add_argument("--page-size", type=int, default=20, help="요청마다 조회할 자산 수")
+    parser.add_argument("--endpoint-url", help="S3/DynamoDB 호환 서버 주소 (지정하지 않으면 moto가 있을 때 moto 서버를 띄움)")
+    args = parser.parse_args()
+
+    process = None
+    if args.endpoint_url is None and importlib.util.find_spec("moto") is not None:
+        process, args.endpoint_url = start_moto_server()
+    overrides = {}
+    if args.endpoint_url:
+        overrides = {"S3_ENDPOINT_URL": args.endpoint_url, "DYNAMODB_ENDPOINT_URL": args.endpoint_url}
+    configure_env(S3_PRESIGNED_URL_CACHE_SIZE="0", **overrides)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            args.database_url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench_metrics.db')}"
+            asyncio.run(run(args))
+    finally:
+        if process is not None:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    main()
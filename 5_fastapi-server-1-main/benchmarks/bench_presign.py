@@ -0,0 +1,61 @@
+"""
+자산 목록 presigned URL 생성 벤치마크
+
+자산마다 boto3 generate_presigned_url을 호출하던 기존 방식과, 서명 키를 배치마다 한 번만 만드는
+로컬 서명(generate_presigned_urls), 그리고 캐시에 URL이 있을 때의 비용을 키 수별로 비교합니다.
+서명은 로컬 연산이므로 AWS 연결 없이 측정합니다.
+
+    python -m benchmarks.bench_presign
+    python -m benchmarks.bench_presign --keys 100 1000 10000
+"""
+import argparse
+import time
+
+from .bench_upload import configure_env
+
+
+def measure(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="presigned URL 생성 벤치마크")
+    parser.add_argument("--keys", type=int, nargs="+", default=[100, 1000, 10000], help="한 번에 만들 URL 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    configure_env()
+    from app.utils import s3
+
+    print(f"{'키':>7} {'boto3 (키마다)':>16} {'로컬 배치 서명':>16} {'캐시 적중':>12}")
+    for count in args.keys:
+        keys = [f"uploads/1/{i:08d}-photo.jpg" for i in range(count)]
+
+        def boto3_each():
+            for key in keys:
+                s3.s3_client.generate_presigned_url(
+                    'get_object', Params={'Bucket': s3.settings.S3_BUCKET_NAME, 'Key': key}, ExpiresIn=3600
+                )
+
+        def local_batch():
+            s3._sign_urls(keys, 3600, time.time())
+
+        def cached():
+            s3.generate_presigned_urls(keys, 3600)
+
+        boto3_seconds = measure(boto3_each, args.repeat)
+        local_seconds = measure(local_batch, args.repeat)
+        cached_seconds = measure(cached, args.repeat)
+        print(
+            f"{count:>7} {boto3_seconds * 1000:>13.1f} ms {local_seconds * 1000:>13.1f} ms "
+            f"{cached_seconds * 1000:>9.1f} ms  (x{boto3_seconds / local_seconds:.0f} / x{boto3_seconds / cached_seconds:.0f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
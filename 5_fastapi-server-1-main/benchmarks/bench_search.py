@@ -0,0 +1,218 @@
+"""
+자산 검색 벤치마크
+
+한 사용자에게 합성 자산(이름/설명 단어는 Zipf 분포, 태그 0~3개)을 만들고 rebuild_index로 검색 색인을 채운 뒤,
+GET /assets/search의 검색어 종류별(드문 단어, 흔한 단어, 접두어, 여러 단어) 지연 시간을 측정합니다.
+- 결과 순서와 전체 결과 수, 태그 패싯이 파이썬으로 직접 계산한 값과 같은지 확인
+- 다른 사용자의 자산이 검색되지 않는지, 자산을 색인/삭제하면 바로 반영되는지 확인
+- 비교용으로 기존 방식(전체 목록을 받아 클라이언트에서 필터링)의 지연 시간도 출력
+
+    python -m benchmarks.bench_search
+    python -m benchmarks.bench_search --assets 1000000 --database-url mysql+aiomysql://user:pw@127.0.0.1:3306/bench
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from collections import Counter
+
+from .bench_tags import configure_env  # noqa: F401 (SQLite BIGINT 자동 증가 설정 포함)
+
+VOCABULARY = 5000
+TAGS = [f"tag{i}" for i in range(50)]
+
+
+def zipf_word(rng: random.Random) -> str:
+    # 순위 r의 단어가 1/r에 비례해 나오도록 (w1이 가장 흔함)
+    return f"w{min(int(rng.paretovariate(1.0)), VOCABULARY)}"
+
+
+def make_assets(count: int, seed: int):
+    rng = random.Random(seed)
+    assets = []
+    for i in range(count):
+        name = " ".join(zipf_word(rng) for _ in range(rng.randint(2, 3))) + rng.choice([".png", ".jpg", ".pdf"])
+        description = " ".join(zipf_word(rng) for _ in range(rng.randint(5, 10)))
+        assets.append((i + 1, name, description, rng.sample(TAGS, rng.randint(0, 3))))
+    return assets
+
+
+def reference_search(assets, terms):
+    """
+    색인과 같은 규칙으로 직접 계산한 (asset_id, score) 목록 (점수 내림차순, id 내림차순)
+    """
+    from app.utils.search import asset_terms
+
+    hits = []
+    for asset_id, name, description, tags in assets:
+        weights = asset_terms(name, description, tags)
+        score = 0
+        for term, is_prefix in terms:
+            if is_prefix:
+                best = max((weight for word, weight in weights.items() if word.startswith(term)), default=0)
+            else:
+                best = weights.get(term, 0)
+            if not best:
+                break
+            score += best
+        else:
+            hits.append((asset_id, score))
+    hits.sort(key=lambda hit: (hit[1], hit[0]), reverse=True)
+    return hits
+
+
+async def run(args) -> None:
+    import httpx
+    from fastapi import FastAPI
+    from sqlalchemy import insert
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from app.config import settings
+    from app.database import Base, get_db
+    from app.dependencies import get_current_user
+    from app.models.asset import Asset, Tag, asset_tags
+    from app.models.folder import Folder  # noqa: F401 (관계 설정용)
+    from app.models.user import User
+    from app.routers import assets as assets_router
+    from app.utils import search
+
+    engine = create_async_engine(args.database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    data = make_assets(args.assets, seed=0)
+    # 다른 사용자의 자산 (같은 단어를 쓰므로 사용자 범위가 지켜지는지 확인할 수 있음)
+    other = [(args.assets + asset_id, *rest) for asset_id, *rest in make_assets(args.assets // 10, seed=1)]
+    start = time.perf_counter()
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        user = User(id=1, email="bench@example.com", password_hash="x", name="bench")
+        db.add_all([user, User(id=2, email="other@example.com", password_hash="x", name="other")])
+        await db.flush()
+        tag_ids = {}
+        for user_id in (1, 2):
+            for name in TAGS:
+                tag_ids[user_id, name] = len(tag_ids) + 1
+        await db.execute(insert(Tag), [
+            {"id": tag_id, "user_id": user_id, "name": name} for (user_id, name), tag_id in tag_ids.items()
+        ])
+        for user_id, rows in ((1, data), (2, other)):
+            for offset in range(0, len(rows), 10000):
+                chunk = rows[offset:offset + 10000]
+                await db.execute(insert(Asset), [
+                    {"id": asset_id, "name": name, "description": description, "mime_type": "image/png",
+                     "size": 1, "s3_key": f"uploads/{user_id}/{asset_id}", "user_id": user_id}
+                    for asset_id, name, description, _ in chunk
+                ])
+                links = [{"asset_id": asset_id, "tag_id": tag_ids[user_id, name]}
+                         for asset_id, _, _, tags in chunk for name in tags]
+                if links:
+                    await db.execute(insert(asset_tags), links)
+        await db.commit()
+        print(f"자산 {len(data) + len(other)}개 저장 {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        indexed = await search.rebuild_index(db, batch_size=5000)
+        print(f"색인 {indexed}개 {time.perf_counter() - start:.1f}s")
+
+    app = FastAPI()
+    app.include_router(assets_router.router, prefix="/assets")
+
+    async def override_db():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    queries = [
+        ("드문 단어", "w150"),
+        ("중간 단어", "w20"),
+        ("흔한 단어", "w2"),
+        ("접두어", "w12*"),
+        ("두 단어", "w3 w7"),
+        ("태그 + 단어", "tag7 w5"),
+        ("흔한 접두어 + 단어", "w1* tag3"),
+    ]
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        # 결과 확인: 페이지를 이어 붙인 순서, 전체 결과 수, 태그 패싯
+        for _, q in queries:
+            expected = reference_search(data, search.parse_query(q))
+            first = await client.get("/assets/search", params={"q": q, "limit": 100, "include_url": "false"})
+            first.raise_for_status()
+            body = first.json()
+            assert body["total"] == len(expected), f"{q}: total {body['total']} != {len(expected)}"
+            got = [(item["id"], item["score"]) for item in body["items"]]
+            cursor = first.headers.get("X-Next-Cursor")
+            for _ in range(2):
+                if not cursor:
+                    break
+                page = await client.get("/assets/search", params={"q": q, "limit": 100, "include_url": "false", "cursor": cursor})
+                got.extend((item["id"], item["score"]) for item in page.json()["items"])
+                cursor = page.headers.get("X-Next-Cursor")
+            assert got == expected[:len(got)], f"{q}: 결과 순서가 다릅니다"
+            assert all(asset_id <= args.assets for asset_id, _ in got), f"{q}: 다른 사용자의 자산이 검색되었습니다"
+            # 태그 패싯은 점수 상위 SEARCH_FACET_SAMPLE_SIZE개 결과 기준
+            expected_ids = {asset_id for asset_id, _ in expected[:settings.SEARCH_FACET_SAMPLE_SIZE]}
+            facet_counts = Counter(name for asset_id, _, _, tags in data if asset_id in expected_ids for name in tags)
+            for facet in body["tag_facets"]:
+                assert facet_counts[facet["name"]] == facet["count"], f"{q}: 태그 패싯 {facet['name']} 개수가 다릅니다"
+
+        # 색인 갱신: 새 자산 색인 후 바로 검색되고, 삭제하면 사라지는지
+        async with AsyncSession(engine) as db:
+            db.add(Asset(id=10 ** 9, name="quarterly-report.pdf", description="신규 자산", mime_type="application/pdf",
+                         size=1, s3_key="uploads/1/new", user_id=1))
+            await db.flush()
+            await search.index_asset(db, 1, 10 ** 9, "quarterly-report.pdf", "신규 자산", ["finance"])
+            await db.commit()
+            found = (await client.get("/assets/search", params={"q": "quarter* fin*"})).json()["items"]
+            assert [item["id"] for item in found] == [10 ** 9], "새 자산이 검색되지 않습니다"
+            await search.remove_asset(db, 10 ** 9)
+            await db.commit()
+            assert not (await client.get("/assets/search", params={"q": "quarterly"})).json()["items"], "삭제한 자산이 검색됩니다"
+        print("결과 순서, 전체 결과 수, 태그 패싯, 사용자 범위, 색인 갱신 확인 완료")
+
+        print(f"\nDB: {engine.url.render_as_string(hide_password=True)}, 사용자 자산 {args.assets}개, 반복 {args.iterations}회")
+        print(f"{'검색어':<28} {'결과 수':>8} {'p50 ms':>9} {'p50 ms(패싯 제외)':>18}")
+        for label, q in queries:
+            total = None
+            timings = {True: [], False: []}
+            for _ in range(args.iterations):
+                for with_facets in (True, False):
+                    start = time.perf_counter()
+                    response = await client.get("/assets/search", params={"q": q, "facets": str(with_facets).lower()})
+                    timings[with_facets].append(time.perf_counter() - start)
+                    response.raise_for_status()
+                    if with_facets:
+                        total = response.json()["total"]
+            print(f"{label + ' (' + q + ')':<28} {total:>8} {statistics.median(timings[True]) * 1000:>9.1f} "
+                  f"{statistics.median(timings[False]) * 1000:>18.1f}")
+
+        # 기존 방식: 전체 목록을 받아 클라이언트에서 이름/설명 필터링
+        start = time.perf_counter()
+        listing = (await client.get("/assets", params={"fields": "id,name,description,tags", "include_url": "false"})).json()
+        hits = [item for item in listing if "w150" in (item["name"] + " " + (item["description"] or ""))]
+        print(f"\n전체 목록 다운로드 후 필터링 (w150): {(time.perf_counter() - start) * 1000:.1f} ms, 결과 {len(hits)}개")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자산 검색 벤치마크")
+    parser.add_argument("--database-url", help="SQLAlchemy 비동기 DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--assets", type=int, default=100000, help="검색할 사용자의 자산 수")
+    parser.add_argument("--iterations", type=int, default=5, help="검색어별 반복 횟수")
+    args = parser.parse_args()
+
+    configure_env(S3_PRESIGNED_URL_CACHE_SIZE="0")
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.database_url is None:
+            args.database_url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench_search.db')}"
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
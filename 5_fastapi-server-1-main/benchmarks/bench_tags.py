@@ -0,0 +1,152 @@
+"""
+자산 등록 시 태그 처리 지연 시간 벤치마크
+
+태그 이름마다 SELECT/flush를 하던 기존 방식과 _resolve_tags(SELECT IN + 다중 행 INSERT)를
+태그 수별로 비교합니다. 새 태그만 있는 경우와 기존 태그만 있는 경우를 나눠 측정하고,
+자산 한 건을 등록하는 데 보낸 SQL 문 수(DB 왕복 횟수)를 함께 출력합니다.
+RDS까지의 네트워크 왕복은 --rtt-ms 만큼 문장마다 지연을 넣어 흉내 냅니다.
+S3 업로드와 DynamoDB 저장은 측정에서 제외합니다.
+
+    python -m benchmarks.bench_tags
+    python -m benchmarks.bench_tags --database-url mysql+aiomysql://user:pw@127.0.0.1:3306/bench --rtt-ms 0
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import BigInteger
+from sqlalchemy.ext.compiler import compiles
+
+from .bench_upload import configure_env
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    # SQLite는 INTEGER PRIMARY KEY만 자동 증가하므로 BIGINT 대신 INTEGER로 생성
+    return "INTEGER"
+
+
+async def run(args) -> None:
+    from sqlalchemy import event, select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from app.database import Base
+    from app.models.asset import Asset, Tag
+    from app.models.folder import Folder  # noqa: F401 (관계 설정용)
+    from app.models.user import User
+    from app.routers import assets
+
+    async def skip_metadata(**kwargs):
+        return True
+
+    assets.put_asset_metadata = skip_metadata
+
+    engine = create_async_engine(args.database_url)
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(*_):
+        nonlocal statements
+        statements += 1
+        time.sleep(args.rtt_ms / 1000)
+
+    @event.listens_for(engine.sync_engine, "commit")
+    def commit(*_):
+        nonlocal statements
+        statements += 1
+        time.sleep(args.rtt_ms / 1000)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async def legacy_create_asset(db, user, tag_names):
+        # 변경 전 _create_asset의 태그 처리와 응답 생성
+        tag_objects = []
+        for tag_name in tag_names:
+            result = await db.execute(select(Tag).where(Tag.name == tag_name, Tag.user_id == user.id))
+            tag = result.scalar_one_or_none()
+            if not tag:
+                tag = Tag(name=tag_name, user_id=user.id)
+                db.add(tag)
+                await db.flush()
+            tag_objects.append(tag)
+        asset = Asset(name="bench", mime_type="image/png", size=1, s3_key="bench.png",
+                      user_id=user.id, tags=tag_objects)
+        db.add(asset)
+        await db.commit()
+        await db.refresh(asset)
+        result = await db.execute(select(Tag).where(Tag.id.in_([tag.id for tag in tag_objects])))
+        return [{"id": tag.id, "name": tag.name, "created_at": tag.created_at} for tag in result.scalars().all()]
+
+    async def current_create_asset(db, user, tag_names):
+        response = await assets._create_asset(
+            db, user, name="bench", description=None, folder_id=None, tag_names=tag_names,
+            mime_type="image/png", size=1, s3_key="bench.png"
+        )
+        return response.tags
+
+    async def measure(create, user, names_for) -> tuple:
+        nonlocal statements
+        latencies, counts = [], []
+        for i in range(args.iterations):
+            tag_names = names_for(i)
+            async with AsyncSession(engine, expire_on_commit=False) as db:
+                db.add(user)
+                statements = 0
+                start = time.perf_counter()
+                tags = await create(db, user, tag_names)
+                latencies.append(time.perf_counter() - start)
+                counts.append(statements)
+                assert len(tags) == len(tag_names)
+        return statistics.mean(latencies) * 1000, max(counts)
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        users = [User(email=f"bench{i}@example.com", password_hash="x", name="bench") for i in range(2)]
+        db.add_all(users)
+        await db.commit()
+
+    print(f"DB: {engine.url.render_as_string(hide_password=True)}, 문장당 지연 {args.rtt_ms} ms, 반복 {args.iterations}회")
+    print(f"{'태그 수':>6} {'경우':<8} {'기존 (ms / 문장)':>20} {'변경 후 (ms / 문장)':>22} {'개선':>7}")
+    for count in args.tags:
+        existing = [f"tag-{count}-{j}" for j in range(count)]
+        cases = (
+            # 반복마다 처음 보는 이름만 사용
+            ("새 태그", lambda i: [f"new-{i}-{name}" for name in existing]),
+            ("기존 태그", lambda i: existing),
+        )
+        for label, names_for in cases:
+            results = []
+            for user, create in zip(users, (legacy_create_asset, current_create_asset)):
+                if names_for is cases[1][1]:
+                    # 태그를 미리 만들어 둠
+                    async with AsyncSession(engine, expire_on_commit=False) as db:
+                        db.add(user)
+                        await current_create_asset(db, user, existing)
+                results.append(await measure(create, user, names_for))
+            (before_ms, before_count), (after_ms, after_count) = results
+            print(f"{count:>6} {label:<8} {before_ms:>12.2f} / {before_count:>4} {after_ms:>14.2f} / {after_count:>4}"
+                  f" {before_ms / after_ms:>6.1f}x")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자산 등록 태그 처리 벤치마크")
+    parser.add_argument("--database-url", help="SQLAlchemy 비동기 DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--rtt-ms", type=float, default=1.0, help="SQL 문장마다 추가할 왕복 지연(ms)")
+    parser.add_argument("--iterations", type=int, default=20, help="태그 수별 반복 횟수")
+    parser.add_argument("--tags", type=int, nargs="+", default=[0, 1, 5, 10, 30, 100], help="측정할 태그 수")
+    args = parser.parse_args()
+
+    configure_env()
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.database_url is None:
+            args.database_url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench_tags.db')}"
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
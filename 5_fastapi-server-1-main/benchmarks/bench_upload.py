@@ -0,0 +1,183 @@
+"""
+스트리밍 멀티파트 업로드 메모리 벤치마크
+
+로컬 S3 대체 서버(moto)를 별도 프로세스로 띄우고, 메모리에 올리지 않고 생성한
+수 GB 크기의 파일을 app.utils.s3.upload_file로 업로드하면서 최대 RSS를 측정합니다.
+업로드된 객체의 크기/SHA-256 확인과, 업로드 도중 실패 시 멀티파트 업로드가
+중단(abort)되는지도 함께 확인합니다.
+
+    pip install "moto[server]"
+    python -m benchmarks.bench_upload --size-gb 1
+    python -m benchmarks.bench_upload --size-gb 4 --endpoint-url http://localhost:9000  # MinIO 등 이미 실행 중인 서버
+
+moto 서버는 업로드된 객체를 메모리에 보관하므로 파일 크기의 3배 이상 여유 메모리가 필요합니다.
+더 큰 파일은 MinIO 같은 디스크 기반 S3 호환 서버를 --endpoint-url로 지정하세요.
+측정하는 RSS는 벤치마크(업로드하는) 프로세스의 값입니다.
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import resource
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+BUCKET = "bench-upload"
+BLOCK = os.urandom(1024 * 1024)
+
+
+class GeneratedFile:
+    """
+    size 바이트를 요청받은 만큼만 만들어 돌려주는 파일 객체. 전체 내용을 메모리에 두지 않습니다.
+    fail_at을 지정하면 그 위치를 지나 읽을 때 예외를 발생시킵니다.
+    """
+
+    def __init__(self, size: int, fail_at: int = None):
+        self.size = size
+        self.fail_at = fail_at
+        self.position = 0
+        self.checksum = hashlib.sha256()
+
+    def read(self, n: int = -1) -> bytes:
+        remaining = self.size - self.position
+        n = remaining if n < 0 else min(n, remaining)
+        if self.fail_at is not None and self.position + n > self.fail_at:
+            raise ConnectionResetError("클라이언트 연결이 끊어졌습니다 (테스트)")
+        offset = self.position % len(BLOCK)
+        data = (BLOCK[offset:] + BLOCK * (n // len(BLOCK) + 1))[:n]
+        self.position += n
+        self.checksum.update(data)
+        return data
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self.position
+
+    def close(self) -> None:
+        pass
+
+
+def current_rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+
+def peak_rss_mb() -> float:
+    # 리눅스에서 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def start_moto_server() -> tuple[subprocess.Popen, str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    process = subprocess.Popen(
+        [sys.executable, "-m", "moto.server", "-p", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(url, timeout=1)
+            return process, url
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("moto 서버를 시작하지 못했습니다. pip install \"moto[server]\"")
+
+
+def configure_env(**overrides: str) -> None:
+    """
+    app.config.Settings 필수 값을 벤치마크용 기본값으로 채웁니다. app 모듈을 import하기 전에 호출해야 합니다.
+    """
+    for key, value in {
+        "DB_HOST": "127.0.0.1", "DB_PORT": "3306", "DB_USER": "bench", "DB_PASSWORD": "bench",
+        "DB_NAME": "bench", "JWT_SECRET_KEY": "bench", "AWS_ACCESS_KEY_ID": "testing",
+        "AWS_SECRET_ACCESS_KEY": "testing", "AWS_REGION": "ap-northeast-2", "S3_BUCKET_NAME": "bench",
+    }.items():
+        os.environ.setdefault(key, value)
+    os.environ.update(overrides)
+
+
+async def run(args) -> int:
+    # 설정을 읽기 전에 환경 변수를 채워야 하므로 여기서 import
+    from fastapi import UploadFile
+    from starlette.datastructures import Headers
+    from app.utils import s3
+
+    try:
+        s3.s3_client.create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": s3.settings.AWS_REGION}
+        )
+    except s3.s3_client.exceptions.BucketAlreadyOwnedByYou:
+        pass
+    chunk_size = s3.settings.S3_MULTIPART_CHUNK_SIZE
+    concurrency = s3.settings.S3_MULTIPART_CONCURRENCY
+    size = int(args.size_gb * 1024 ** 3)
+    headers = Headers({"content-type": "video/mp4"})
+
+    # 1) 정상 업로드: 최대 RSS 증가량 측정
+    baseline = current_rss_mb()
+    source = GeneratedFile(size)
+    start = time.perf_counter()
+    s3_key, file_size, checksum = await s3.upload_file(UploadFile(source, filename="bench.mp4", headers=headers))
+    elapsed = time.perf_counter() - start
+    growth = peak_rss_mb() - baseline
+    print(f"업로드: {file_size / 1024 ** 3:.2f} GiB, {elapsed:.1f}s ({file_size / 1024 ** 2 / elapsed:,.0f} MiB/s)")
+    print(f"파트 크기 {chunk_size // 1024 ** 2} MiB x 동시 {concurrency}개, RSS 기준 {baseline:.0f} MiB, 최대 증가 {growth:.0f} MiB (한도 {args.max_rss_growth_mb} MiB)")
+
+    head = s3.s3_client.head_object(Bucket=BUCKET, Key=s3_key)
+    failures = []
+    if file_size != size or head["ContentLength"] != size:
+        failures.append(f"크기 불일치: 원본 {size}, 반환 {file_size}, S3 {head['ContentLength']}")
+    if checksum != source.checksum.hexdigest():
+        failures.append("SHA-256 불일치")
+    if growth > args.max_rss_growth_mb:
+        failures.append(f"RSS 증가량 {growth:.0f} MiB가 한도를 넘었습니다")
+    s3.s3_client.delete_object(Bucket=BUCKET, Key=s3_key)
+
+    # 2) 업로드 도중 실패: 멀티파트 업로드가 남지 않아야 함
+    source = GeneratedFile(chunk_size * (concurrency + 2), fail_at=chunk_size * (concurrency + 1))
+    try:
+        await s3.upload_file(UploadFile(source, filename="broken.mp4", headers=headers))
+        failures.append("실패한 업로드가 예외 없이 끝났습니다")
+    except ConnectionResetError:
+        pass
+    uploads = s3.s3_client.list_multipart_uploads(Bucket=BUCKET).get("Uploads", [])
+    print(f"실패 후 남은 멀티파트 업로드: {len(uploads)}개")
+    if uploads:
+        failures.append("실패한 멀티파트 업로드가 중단되지 않았습니다")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    print("OK" if not failures else "FAILED")
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스트리밍 멀티파트 업로드 메모리 벤치마크")
+    parser.add_argument("--size-gb", type=float, default=1.0, help="업로드할 파일 크기(GiB)")
+    parser.add_argument("--endpoint-url", help="S3 호환 서버 주소 (지정하지 않으면 moto 서버를 띄움)")
+    parser.add_argument("--max-rss-growth-mb", type=int, default=256, help="허용할 최대 RSS 증가량(MiB)")
+    args = parser.parse_args()
+
+    process = None
+    endpoint_url = args.endpoint_url
+    if endpoint_url is None:
+        process, endpoint_url = start_moto_server()
+
+    configure_env(S3_BUCKET_NAME=BUCKET, S3_ENDPOINT_URL=endpoint_url)
+
+    try:
+        sys.exit(asyncio.run(run(args)))
+    finally:
+        if process is not None:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    main()